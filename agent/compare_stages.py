@@ -0,0 +1,88 @@
+"""Compare the fused summarize-and-categorize agent with the two-step path.
+
+Discovers live candidates, extracts a sample, and runs both the Summarization
+-> Categorization agents and the single Summarize & Categorize Agent on each
+article. Reports sport agreement and per-article model latency. Model calls
+go through the pipeline's shared rate limiter.
+
+    python agent/compare_stages.py --sample 20
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is on path
+_root = Path(__file__).resolve().parents[1]
+if str(_root) not in sys.path:
+    sys.path.insert(0, str(_root))
+
+from dotenv import load_dotenv
+load_dotenv(_root / ".env")
+
+from agent.crew.agents import (
+    categorization_agent,
+    summarization_agent,
+    summarize_categorize_agent,
+)
+from agent.crew.crew import categorization_prompt, fused_prompt, summary_prompt
+from agent.crew.ratelimit import install_openai_client, run_limited
+from agent.crew.tools import aextract_article_content, collect_rss_candidates, http_session
+
+
+async def _compare(sample: int) -> None:
+    install_openai_client()
+    candidates = collect_rss_candidates()
+    rows = []
+    async with http_session():
+        for item in candidates:
+            if len(rows) >= sample:
+                break
+            content = await aextract_article_content(item["url"])
+            if not content or len(content) < 50:
+                continue
+            headline = item["title"] or "No headline"
+
+            started = time.perf_counter()
+            summarized = (await run_limited(
+                summarization_agent, summary_prompt(headline, content)
+            )).final_output
+            two_step = (await run_limited(
+                categorization_agent, categorization_prompt(summarized, item["sport"])
+            )).final_output
+            two_step_latency = time.perf_counter() - started
+
+            started = time.perf_counter()
+            fused = (await run_limited(
+                summarize_categorize_agent, fused_prompt(headline, content, item["sport"])
+            )).final_output
+            fused_latency = time.perf_counter() - started
+
+            rows.append((
+                headline, two_step.sport_slug, fused.sport_slug, two_step_latency, fused_latency,
+            ))
+            marker = "  " if two_step.sport_slug == fused.sport_slug else "!!"
+            print(f"{marker} {two_step.sport_slug:>8} / {fused.sport_slug:<8} {headline[:70]}")
+
+    if not rows:
+        print("No articles could be extracted")
+        return
+    agree = sum(1 for r in rows if r[1] == r[2])
+    print()
+    print(f"Articles compared:       {len(rows)}")
+    print(f"Categorization agreement: {agree / len(rows):.1%}")
+    print(f"Median latency two-step:  {statistics.median(r[3] for r in rows):.2f}s")
+    print(f"Median latency fused:     {statistics.median(r[4] for r in rows):.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sample", type=int, default=20, help="Number of articles to compare")
+    args = parser.parse_args()
+    asyncio.run(_compare(args.sample))
+
+
+if __name__ == "__main__":
+    main()
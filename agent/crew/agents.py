@@ -2,9 +2,11 @@
 from agents import Agent, ModelSettings
 
 from agent.crew.models import (
+    BatchSummaryResult,
     CategorizedArticle,
     DiscoveryResult,
     SummarizedArticle,
+    SummarizedCategorizedArticle,
 )
 from agent.crew.tools import fetch_rss_feeds
 
@@ -39,6 +41,23 @@ summarization_agent = Agent(
     output_type=SummarizedArticle,
 )
 
+batch_summarization_agent = Agent(
+    name="Batch Summarization Agent",
+    instructions=(
+        "You are a sports news summarizer. "
+        "You will be given several articles, each introduced by a line '### Article id=<id>' "
+        "followed by its headline and content. Summarize every article independently: "
+        "for each, produce a 2-4 sentence summary highlighting the key takeaways. "
+        "Be concise, informative, and avoid redundancy. Never mix facts between articles. "
+        "Return a structured BatchSummaryResult with exactly one item per article, "
+        "carrying the article's id, its original headline, and your generated summary."
+    ),
+    model=_model,
+    model_settings=ModelSettings(temperature=0.3),
+    tools=[],
+    output_type=BatchSummaryResult,
+)
+
 categorization_agent = Agent(
     name="Categorization Agent",
     instructions=(
@@ -57,3 +76,25 @@ categorization_agent = Agent(
     tools=[],
     output_type=CategorizedArticle,
 )
+
+summarize_categorize_agent = Agent(
+    name="Summarize & Categorize Agent",
+    instructions=(
+        "You are a sports news summarizer and categorizer. "
+        "Given a headline, article content, and candidate sport, do two things. "
+        "First, produce a 2-4 sentence summary highlighting the key takeaways; be concise, "
+        "informative, and avoid redundancy, and keep the original headline. "
+        "Second, determine the correct sport category. "
+        "Valid sport slugs are: 'cricket', 'soccer'. "
+        "Cricket articles discuss cricket, IPL, T20, test matches, "
+        "wickets, batsmen, bowlers, innings, etc. "
+        "Soccer articles discuss football, Premier League, "
+        "FIFA, La Liga, Champions League, Serie A, Bundesliga, MLS, goals, penalties, etc. "
+        "Return a structured SummarizedCategorizedArticle with the headline, summary, "
+        "sport_slug, a confidence level (low/medium/high) and brief reasoning."
+    ),
+    model=_model,
+    model_settings=ModelSettings(temperature=0.2),
+    tools=[],
+    output_type=SummarizedCategorizedArticle,
+)
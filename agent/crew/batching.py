@@ -0,0 +1,110 @@
+"""Micro-batching of per-article agent requests into multi-article calls."""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Rough characters-per-token ratio used for batch token budgeting.
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+@dataclass
+class _Pending(Generic[T]):
+    id: str
+    prompt: str
+    tokens: int
+    future: asyncio.Future = field(repr=False)
+
+
+class MicroBatcher(Generic[T]):
+    """Collects concurrent single-item requests and runs them as batches.
+
+    Callers ``await submit(prompt)`` as if making a single call. Requests are
+    grouped until ``batch_size`` items or ``token_budget`` estimated prompt
+    tokens are pending, or ``linger`` seconds pass since the first one, then
+    sent through ``run_batch``, which maps item ids to results. Items missing
+    from the batch result (dropped, garbled) fall back to ``run_single``
+    individually; the rest of the batch is unaffected.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[list[tuple[str, str]]], Awaitable[dict[str, T]]],
+        run_single: Callable[[str], Awaitable[T]],
+        batch_size: int,
+        token_budget: int,
+        linger: float = 0.5,
+    ):
+        self._run_batch = run_batch
+        self._run_single = run_single
+        self.batch_size = max(1, batch_size)
+        self.token_budget = token_budget
+        self.linger = linger
+        self.batches = 0
+        self.fallbacks = 0
+        self._pending: list[_Pending[T]] = []
+        self._pending_tokens = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._next_id = 0
+
+    async def submit(self, prompt: str) -> T:
+        tokens = estimate_tokens(prompt)
+        if self.batch_size == 1 or tokens >= self.token_budget:
+            return await self._run_single(prompt)
+
+        if self._pending and self._pending_tokens + tokens > self.token_budget:
+            self._flush()
+        loop = asyncio.get_running_loop()
+        item = _Pending(str(self._next_id), prompt, tokens, loop.create_future())
+        self._next_id += 1
+        self._pending.append(item)
+        self._pending_tokens += tokens
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger, self._flush)
+        return await item.future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending, self._pending_tokens = self._pending, [], 0
+        if batch:
+            task = asyncio.create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: list[_Pending[T]]) -> None:
+        if len(batch) == 1:
+            await self._resolve(batch[0], None)
+            return
+        self.batches += 1
+        results: dict[str, T] = {}
+        try:
+            results = await self._run_batch([(p.id, p.prompt) for p in batch])
+        except Exception as e:
+            logger.warning(f"  Batch of {len(batch)} failed, falling back to single calls: {e}")
+        missing = [p for p in batch if p.id not in results]
+        self.fallbacks += len(missing)
+        await asyncio.gather(*(self._resolve(p, results.get(p.id)) for p in batch))
+
+    async def _resolve(self, item: _Pending[T], result: Optional[T]) -> None:
+        if item.future.done():
+            return
+        if result is None:
+            try:
+                result = await self._run_single(item.prompt)
+            except Exception as e:
+                item.future.set_exception(e)
+                return
+        item.future.set_result(result)
@@ -0,0 +1,156 @@
+"""Disk-backed, content-addressed cache for structured agent outputs."""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from agents import Agent
+from pydantic import BaseModel
+
+from agent.crew.metrics import AGENT_CACHE
+from agent.crew.state import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+_MAX_BYTES = int(os.getenv("AGENT_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+_MAX_AGE_DAYS = float(os.getenv("AGENT_CACHE_MAX_AGE_DAYS", "30"))
+
+
+def cache_key(agent: Agent, prompt: str) -> str:
+    """Hash of everything that determines an agent's output for a prompt."""
+    material = json.dumps(
+        [agent.name, str(agent.instructions), str(agent.model), prompt],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class AgentOutputCache:
+    """SQLite store of agent outputs keyed by ``cache_key``.
+
+    Entries older than ``max_age_days`` are ignored and pruned; ``prune`` also
+    evicts least-recently-used entries until the store is under ``max_bytes``.
+    Hit / miss counts and the model latency saved by hits are tracked per
+    instance.
+
+    The pipeline uses ``aget`` / ``aput``, which run the SQLite work in a
+    worker thread so lookups never block the event loop; a lock serializes
+    access to the shared connection.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_bytes: int = _MAX_BYTES,
+        max_age_days: float = _MAX_AGE_DAYS,
+    ):
+        self.path = Path(path) if path else CACHE_DIR / "agent_outputs.sqlite3"
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS agent_outputs ("
+            " key TEXT PRIMARY KEY,"
+            " agent TEXT NOT NULL,"
+            " output TEXT NOT NULL,"
+            " latency REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, agent: Agent, prompt: str) -> Optional[BaseModel]:
+        """Return the cached output for (agent, prompt), or None."""
+        key = cache_key(agent, prompt)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT output, latency FROM agent_outputs WHERE key = ? AND created_at >= ?",
+                (key, now - self.max_age),
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            AGENT_CACHE.labels(agent.name, "miss").inc()
+            return None
+        try:
+            output = agent.output_type.model_validate_json(row[0])
+        except ValueError:
+            self.misses += 1
+            AGENT_CACHE.labels(agent.name, "miss").inc()
+            return None
+        with self._lock:
+            self._conn.execute(
+                "UPDATE agent_outputs SET last_used = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+        self.hits += 1
+        AGENT_CACHE.labels(agent.name, "hit").inc()
+        self.saved_seconds += row[1]
+        return output
+
+    async def aget(self, agent: Agent, prompt: str) -> Optional[BaseModel]:
+        return await asyncio.to_thread(self.get, agent, prompt)
+
+    def put(self, agent: Agent, prompt: str, output: BaseModel, latency: float) -> None:
+        """Store an agent output along with the latency it took to produce."""
+        payload = output.model_dump_json()
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO agent_outputs"
+                " (key, agent, output, latency, size, created_at, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (cache_key(agent, prompt), agent.name, payload, latency, len(payload), now, now),
+            )
+            self._conn.commit()
+
+    async def aput(self, agent: Agent, prompt: str, output: BaseModel, latency: float) -> None:
+        await asyncio.to_thread(self.put, agent, prompt, output, latency)
+
+    def prune(self) -> int:
+        """Evict expired entries, then LRU entries beyond max_bytes. Returns rows removed."""
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM agent_outputs WHERE created_at < ?",
+                (time.time() - self.max_age,),
+            ).rowcount
+            total = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM agent_outputs"
+            ).fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                doomed = []
+                for key, size in self._conn.execute(
+                    "SELECT key, size FROM agent_outputs ORDER BY last_used"
+                ):
+                    if excess <= 0:
+                        break
+                    doomed.append((key,))
+                    excess -= size
+                self._conn.executemany("DELETE FROM agent_outputs WHERE key = ?", doomed)
+                removed += len(doomed)
+            self._conn.commit()
+            return removed
+
+    def log_stats(self) -> None:
+        lookups = self.hits + self.misses
+        rate = (self.hits / lookups * 100) if lookups else 0.0
+        logger.info(
+            f"  Agent cache: {self.hits}/{lookups} hits ({rate:.0f}%), "
+            f"saved ~{self.saved_seconds:.1f}s of model latency"
+        )
+
+    def close(self) -> None:
+        self._conn.close()
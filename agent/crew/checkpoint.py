@@ -0,0 +1,234 @@
+"""Run checkpoints and incremental persistence for the streaming pipeline."""
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import update
+
+from agent.crew.dedup import Alternate, attach_alternates, store_signatures
+from agent.crew.metrics import ARTICLES, timed
+from agent.crew.models import ArticleCandidate, SummarizedArticle
+from app.database import SessionLocal
+from app.models import PipelineCheckpoint
+from app.persistence import bulk_insert_articles
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+SUMMARIZED = "summarized"
+SAVED = "saved"
+SKIPPED = "skipped"
+DUPLICATE = "duplicate"
+FAILED = "failed"
+TERMINAL_STAGES = (SAVED, SKIPPED, DUPLICATE, FAILED)
+
+
+@dataclass
+class WorkItem:
+    """A candidate plus any stage output recovered from an interrupted run."""
+    candidate: ArticleCandidate
+    summarized: Optional[SummarizedArticle] = None
+    backfill: bool = False
+
+
+def load_unfinished_run() -> tuple[Optional[str], list[WorkItem]]:
+    """Return (run_id, unfinished work items) of an interrupted run, if any."""
+    db = SessionLocal()
+    try:
+        row = (
+            db.query(PipelineCheckpoint.run_id)
+            .filter(PipelineCheckpoint.stage.notin_(TERMINAL_STAGES))
+            .order_by(PipelineCheckpoint.updated_at.desc())
+            .first()
+        )
+        if row is None:
+            return None, []
+        run_id = row[0]
+        items = []
+        for cp in (
+            db.query(PipelineCheckpoint)
+            .filter(
+                PipelineCheckpoint.run_id == run_id,
+                PipelineCheckpoint.stage.notin_(TERMINAL_STAGES),
+            )
+            .order_by(PipelineCheckpoint.id)
+        ):
+            item = WorkItem(ArticleCandidate.model_validate_json(cp.candidate), backfill=True)
+            if cp.stage == SUMMARIZED and cp.result:
+                item.summarized = SummarizedArticle.model_validate_json(cp.result)
+            items.append(item)
+        return run_id, items
+    finally:
+        db.close()
+
+
+def register_candidates(run_id: Optional[str], candidates: list[ArticleCandidate]) -> str:
+    """Record new candidates as pending under ``run_id`` (a new run if None)."""
+    run_id = run_id or str(uuid.uuid4())
+    db = SessionLocal()
+    try:
+        existing = {
+            url for (url,) in db.query(PipelineCheckpoint.url).filter_by(run_id=run_id)
+        }
+        db.add_all(
+            PipelineCheckpoint(
+                run_id=run_id,
+                url=c.url[:2000],
+                stage=PENDING,
+                candidate=c.model_dump_json(),
+            )
+            for c in candidates
+            if c.url[:2000] not in existing
+        )
+        db.commit()
+    finally:
+        db.close()
+    return run_id
+
+
+def finish_run(run_id: str) -> bool:
+    """Drop a run's checkpoints once every candidate reached a terminal stage."""
+    db = SessionLocal()
+    try:
+        open_count = (
+            db.query(PipelineCheckpoint)
+            .filter(
+                PipelineCheckpoint.run_id == run_id,
+                PipelineCheckpoint.stage.notin_(TERMINAL_STAGES),
+            )
+            .count()
+        )
+        if open_count:
+            return False
+        db.query(PipelineCheckpoint).filter_by(run_id=run_id).delete()
+        db.commit()
+        return True
+    finally:
+        db.close()
+
+
+class CheckpointWriter:
+    """Single consumer that commits finished articles and stage changes as they arrive.
+
+    Producers enqueue stage updates and article rows; the writer groups them
+    into small batches (``batch_size`` items or ``flush_interval`` seconds)
+    and writes each batch in a worker thread. Articles are inserted through
+    the idempotent bulk layer before their checkpoint is marked saved, so a
+    crash between the two only causes a no-op re-insert on resume.
+
+    Near-duplicates are recorded as alternate sources of their primary
+    article once it is stored. If the primary never gets stored (it failed),
+    the duplicate's checkpoint is reset to pending so the next run
+    processes it on its own.
+    """
+
+    def __init__(self, run_id: str, batch_size: int = 10, flush_interval: float = 1.0):
+        self.run_id = run_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.saved = 0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._deferred: list[Alternate] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "CheckpointWriter":
+        self._task = asyncio.create_task(self._consume())
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self._queue.put(None)
+        await self._task
+
+    async def stage(self, url: str, stage: str, result: Optional[str] = None) -> None:
+        await self._queue.put((url, stage, result, None, None))
+
+    async def save(self, url: str, row: dict) -> None:
+        """Store an article row; a ``signature`` key records its SimHash too."""
+        await self._queue.put((url, SAVED, None, row, None))
+
+    async def duplicate(self, alternate: Alternate) -> None:
+        await self._queue.put((alternate.url, DUPLICATE, None, None, alternate))
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        done = False
+        while not done:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+            try:
+                with timed("db_write"):
+                    inserted = await asyncio.to_thread(self._write, batch)
+                self.saved += inserted
+                ARTICLES.labels("saved").inc(inserted)
+            except Exception:
+                logger.exception("Checkpoint writer failed on a batch of %d updates", len(batch))
+        if self._deferred:
+            await asyncio.to_thread(self._release_deferred)
+
+    def _write(self, batch: list[tuple]) -> int:
+        db = SessionLocal()
+        try:
+            rows = [row for _, _, _, row, _ in batch if row is not None]
+            inserted = bulk_insert_articles(db, rows) if rows else 0
+            signatures = {
+                row["source_url"]: row["signature"] for row in rows if row.get("signature")
+            }
+            if signatures:
+                store_signatures(db, signatures)
+            alternates = self._deferred + [alt for *_, alt in batch if alt is not None]
+            self._deferred = attach_alternates(db, alternates)
+            # Only alternates recorded now become DUPLICATE; deferred ones keep their stage.
+            deferred = {alt.url for alt in self._deferred}
+            updates = [
+                (url, stage, result) for url, stage, result, _, _ in batch if stage != DUPLICATE
+            ]
+            updates += [(alt.url, DUPLICATE, None) for alt in alternates if alt.url not in deferred]
+            for url, stage, result in updates:
+                db.execute(
+                    update(PipelineCheckpoint)
+                    .where(
+                        PipelineCheckpoint.run_id == self.run_id,
+                        PipelineCheckpoint.url == url[:2000],
+                    )
+                    .values(stage=stage, result=result)
+                )
+            db.commit()
+            return inserted
+        finally:
+            db.close()
+
+    def _release_deferred(self) -> None:
+        """Reopen duplicates whose primary article was never stored."""
+        db = SessionLocal()
+        try:
+            for alt in self._deferred:
+                db.execute(
+                    update(PipelineCheckpoint)
+                    .where(
+                        PipelineCheckpoint.run_id == self.run_id,
+                        PipelineCheckpoint.url == alt.url[:2000],
+                    )
+                    .values(stage=PENDING, result=None)
+                )
+            db.commit()
+            logger.info(f"  {len(self._deferred)} duplicates lost their original; retrying next run")
+            self._deferred = []
+        finally:
+            db.close()
@@ -0,0 +1,89 @@
+"""In-process keyword classifier used in front of the Categorization Agent."""
+import os
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+# Weighted cue phrases per sport slug, mirroring the categorization agent's
+# instructions. Multi-word phrases are matched as whole phrases.
+_KEYWORDS: dict[str, dict[str, float]] = {
+    "cricket": {
+        "cricket": 3, "cricketer": 3, "ipl": 3, "t20": 3, "t20i": 3, "odi": 3,
+        "test match": 3, "wicket": 3, "wickets": 3, "wicketkeeper": 3,
+        "batsman": 2, "batsmen": 2, "batter": 2, "bowler": 2, "bowling": 2,
+        "innings": 2, "ashes": 3, "bcci": 3, "icc": 2, "county championship": 3,
+        "big bash": 3, "lbw": 3, "run chase": 2, "all-rounder": 2, "spinner": 2,
+        "seamer": 2, "duck": 1, "century": 1, "ranji trophy": 3,
+    },
+    "soccer": {
+        "football": 2, "footballer": 2, "soccer": 3, "premier league": 3,
+        "fifa": 3, "uefa": 3, "la liga": 3, "champions league": 3,
+        "europa league": 3, "serie a": 3, "bundesliga": 3, "ligue 1": 3,
+        "mls": 3, "fa cup": 3, "carabao cup": 3, "goal": 2, "goals": 2,
+        "goalkeeper": 3, "striker": 2, "midfielder": 2, "defender": 1,
+        "penalty": 1, "penalties": 1, "hat-trick": 1, "transfer window": 2,
+        "world cup qualifier": 2, "clean sheet": 2, "var": 1,
+    },
+}
+
+# Weight given to the sport of the RSS source the article came from.
+_SOURCE_PRIOR = 2.0
+# Minimum keyword evidence before the classifier will claim high confidence.
+_MIN_EVIDENCE = 3.0
+
+DEFAULT_THRESHOLD = float(os.getenv("LOCAL_CLASSIFIER_THRESHOLD", "0.85"))
+
+_PATTERNS = {
+    slug: [(k, re.compile(rf"(?<![\w-]){re.escape(k)}(?![\w-])"), w) for k, w in words.items()]
+    for slug, words in _KEYWORDS.items()
+}
+
+
+@dataclass
+class LocalPrediction:
+    """Result of the local classifier."""
+    sport_slug: str
+    confidence: float
+    reasoning: str
+
+
+def classify(headline: str, summary: str, source_sport: Optional[str] = None) -> LocalPrediction:
+    """Score an article against each sport's cue phrases.
+
+    Confidence is the winning sport's share of the total score, scaled down
+    when there is little keyword evidence, so it lies in [0, 1].
+    """
+    text = f"{headline} {summary}".lower()
+    scores: dict[str, float] = {}
+    hits: dict[str, list[str]] = {}
+    for slug, patterns in _PATTERNS.items():
+        score = 0.0
+        matched = []
+        for keyword, pattern, weight in patterns:
+            n = len(pattern.findall(text))
+            if n:
+                score += weight * n
+                matched.append(keyword)
+        scores[slug] = score
+        hits[slug] = matched
+
+    evidence = sum(scores.values())
+    if source_sport in scores:
+        scores[source_sport] += _SOURCE_PRIOR
+    total = sum(scores.values())
+    if total == 0:
+        return LocalPrediction(source_sport or "soccer", 0.0, "no sport keywords found")
+
+    best = max(scores, key=scores.get)
+    confidence = scores[best] / total * min(1.0, evidence / _MIN_EVIDENCE)
+    cues = ", ".join(hits[best][:5]) or "source prior"
+    return LocalPrediction(best, round(confidence, 3), f"keywords: {cues}")
+
+
+def confidence_label(confidence: float) -> str:
+    """Map a numeric confidence onto the agent's low/medium/high scale."""
+    if confidence >= 0.9:
+        return "high"
+    if confidence >= 0.6:
+        return "medium"
+    return "low"
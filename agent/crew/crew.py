@@ -1,134 +1,592 @@
-"""Pipeline orchestration - runs agents sequentially using OpenAI Agents SDK."""
+"""Pipeline orchestration - streams candidates through agent stages using OpenAI Agents SDK."""
 import asyncio
 import logging
+import os
 import sys
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from agents import Runner
+from agents import Agent, Runner
 
 # Add backend to path for DB access
 _root = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(_root / "backend"))
 
 from agent.crew.agents import (
+    batch_summarization_agent,
     categorization_agent,
     source_discovery_agent,
     summarization_agent,
+    summarize_categorize_agent,
 )
-from agent.crew.tools import extract_article_content
+from agent.crew.batching import MicroBatcher
+from agent.crew.cache import AgentOutputCache
+from agent.crew.checkpoint import (
+    FAILED,
+    SKIPPED,
+    SUMMARIZED,
+    CheckpointWriter,
+    WorkItem,
+    finish_run,
+    load_unfinished_run,
+    register_candidates,
+)
+from agent.crew.classifier import DEFAULT_THRESHOLD, classify, confidence_label
+from agent.crew.dedup import Alternate, DuplicateIndex, simhash
+from agent.crew.metrics import ARTICLES, record_llm_call, timed
+from agent.crew.models import ArticleCandidate, CategorizedArticle, SummarizedArticle
+from agent.crew.ratelimit import (
+    BACKFILL,
+    FRESH,
+    RateLimitExhausted,
+    install_openai_client,
+    limiter,
+    priority,
+)
+from agent.crew.state import FeedStateStore
+from agent.crew.tools import aextract_article_content, collect_rss_candidates, http_session
+from agent.crew.urls import normalize_url
 from app.database import SessionLocal, init_db
-from app.models import Article, Sport
+from app.models import Article, ArticleSource
 from app.seed import seed_sports
 
 logger = logging.getLogger(__name__)
 
 
-async def run_pipeline(sources_path: Optional[Path] = None) -> int:
-    """Run full agent pipeline: discover -> extract -> summarize -> categorize -> save."""
+_LOOKUP_CHUNK = 500
 
-    # Step 1: Source Discovery Agent
-    logger.info("Step 1: Running Source Discovery Agent...")
-    discovery_result = await Runner.run(
-        source_discovery_agent,
-        "Fetch all article candidates from the configured RSS feeds.",
-    )
-    candidates = discovery_result.final_output.candidates
-    logger.info(f"  Discovered {len(candidates)} candidates")
 
-    articles_to_save = []
-    seen_urls: set[str] = set()
+@dataclass
+class PipelineStats:
+    """Counters for a single pipeline run, logged as the run summary."""
+    discovered: int = 0
+    known_skipped: int = 0
+    resumed: int = 0
+    processed: int = 0
+    skipped: int = 0
+    duplicates: int = 0
+    failed: int = 0
+    deferred: int = 0
+    local_classified: int = 0
+    llm_calls: int = 0
+    saved: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def articles_per_minute(self) -> float:
+        return self.processed / self.elapsed * 60 if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"discovered={self.discovered} known_skipped={self.known_skipped} "
+            f"resumed={self.resumed} processed={self.processed} "
+            f"skipped={self.skipped} duplicates={self.duplicates} failed={self.failed} "
+            f"deferred={self.deferred} "
+            f"local_classified={self.local_classified} llm_calls={self.llm_calls} "
+            f"saved={self.saved} elapsed={self.elapsed:.1f}s "
+            f"throughput={self.articles_per_minute:.1f} articles/min"
+        )
+
+
+_DEFAULT_CONCURRENCY = int(os.getenv("PIPELINE_CONCURRENCY", "8"))
+_DEFAULT_PER_HOST_CONCURRENCY = int(os.getenv("PIPELINE_PER_HOST_CONCURRENCY", "2"))
+_DEFAULT_DISCOVERY = os.getenv("PIPELINE_DISCOVERY", "direct")
+_CACHE_ENABLED = os.getenv("AGENT_CACHE", "1") != "0"
+_DEFAULT_SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "1"))
+_SUMMARY_BATCH_TOKENS = int(os.getenv("SUMMARY_BATCH_TOKENS", "12000"))
+_DEFAULT_FUSED = os.getenv("PIPELINE_FUSED", "0") == "1"
+_DEDUP_ENABLED = os.getenv("PIPELINE_DEDUP", "1") != "0"
+
+
+@dataclass
+class _RunContext:
+    """Shared state for the candidates of one pipeline run."""
+    workers: asyncio.Semaphore
+    stats: PipelineStats
+    cache: Optional[AgentOutputCache] = None
+    classifier_threshold: float = DEFAULT_THRESHOLD
+    summarizer: Optional[MicroBatcher[SummarizedArticle]] = None
+    fused: bool = False
+    writer: Optional[CheckpointWriter] = None
+    duplicates: Optional[DuplicateIndex] = None
+
+
+async def _run_agent(ctx: _RunContext, agent: Agent, prompt: str) -> Any:
+    """Run an agent, serving and filling the output cache when enabled."""
+    if ctx.cache is not None:
+        cached = await ctx.cache.aget(agent, prompt)
+        if cached is not None:
+            return cached
+    started = time.perf_counter()
+    result = await limiter.call(lambda: Runner.run(agent, prompt), prompt, agent.name)
+    latency = time.perf_counter() - started
+    ctx.stats.llm_calls += 1
+    record_llm_call(agent.name, latency, result)
+    output = result.final_output
+    if ctx.cache is not None:
+        await ctx.cache.aput(agent, prompt, output, latency)
+    return output
 
-    # Steps 2-4: Process each candidate
-    for i, candidate in enumerate(candidates):
-        url = candidate.url
-        if not url or url in seen_urls:
+
+async def _summarize_batch(
+    ctx: _RunContext,
+    items: list[tuple[str, str]],
+) -> dict[str, SummarizedArticle]:
+    """Summarize several (id, prompt) items in one Batch Summarization Agent call.
+
+    Cached items are served from the cache. Returned entries with unknown
+    ids or empty fields are discarded so the batcher retries them singly.
+    """
+    results: dict[str, SummarizedArticle] = {}
+    prompts: dict[str, str] = {}
+    for item_id, prompt in items:
+        cached = (
+            await ctx.cache.aget(summarization_agent, prompt) if ctx.cache is not None else None
+        )
+        if cached is not None:
+            results[item_id] = cached
+        else:
+            prompts[item_id] = prompt
+    if not prompts:
+        return results
+
+    batch_prompt = "\n\n".join(
+        f"### Article id={item_id}\n{prompt}" for item_id, prompt in prompts.items()
+    )
+    started = time.perf_counter()
+    result = await limiter.call(
+        lambda: Runner.run(batch_summarization_agent, batch_prompt),
+        batch_prompt,
+        batch_summarization_agent.name,
+    )
+    elapsed = time.perf_counter() - started
+    ctx.stats.llm_calls += 1
+    record_llm_call(batch_summarization_agent.name, elapsed, result)
+    latency = elapsed / len(prompts)
+    for entry in result.final_output.items:
+        item_id = entry.id.strip()
+        if item_id not in prompts or item_id in results:
+            continue
+        if not entry.headline.strip() or not entry.summary.strip():
             continue
-        seen_urls.add(url)
+        summarized = SummarizedArticle(headline=entry.headline, summary=entry.summary)
+        results[item_id] = summarized
+        if ctx.cache is not None:
+            await ctx.cache.aput(summarization_agent, prompts[item_id], summarized, latency)
+    return results
 
+
+async def _summarize(ctx: _RunContext, prompt: str) -> SummarizedArticle:
+    """Step 3: summarize one article, through the batcher when batching is on."""
+    if ctx.summarizer is None:
+        return await _run_agent(ctx, summarization_agent, prompt)
+    return await ctx.summarizer.submit(prompt)
+
+
+def summary_prompt(headline: str, content: str) -> str:
+    return f"Headline: {headline}\n\nArticle content:\n{content[:4000]}"
+
+
+def categorization_prompt(summarized: SummarizedArticle, source_sport: str) -> str:
+    return (
+        f"Headline: {summarized.headline}\n"
+        f"Summary: {summarized.summary}\n"
+        f"Candidate sport from RSS source: {source_sport}"
+    )
+
+
+def fused_prompt(headline: str, content: str, source_sport: str) -> str:
+    return (
+        f"Headline: {headline}\n"
+        f"Candidate sport from RSS source: {source_sport}\n\n"
+        f"Article content:\n{content[:4000]}"
+    )
+
+
+async def _categorize(
+    ctx: _RunContext,
+    summarized: SummarizedArticle,
+    source_sport: str,
+) -> CategorizedArticle:
+    """Step 4: local classifier first, Categorization Agent when unsure."""
+    local = classify(summarized.headline, summarized.summary, source_sport)
+    if local.confidence >= ctx.classifier_threshold:
+        ctx.stats.local_classified += 1
+        return CategorizedArticle(
+            sport_slug=local.sport_slug,
+            confidence=confidence_label(local.confidence),
+            reasoning=f"local classifier ({local.confidence:.2f}) {local.reasoning}",
+        )
+    return await _run_agent(
+        ctx, categorization_agent, categorization_prompt(summarized, source_sport)
+    )
+
+
+async def _fused_stage(
+    ctx: _RunContext,
+    headline: str,
+    content: str,
+    source_sport: str,
+) -> tuple[SummarizedArticle, CategorizedArticle]:
+    """Single Summarize & Categorize Agent call producing both outputs."""
+    fused = await _run_agent(
+        ctx, summarize_categorize_agent, fused_prompt(headline, content, source_sport)
+    )
+    return (
+        SummarizedArticle(headline=fused.headline, summary=fused.summary),
+        CategorizedArticle(
+            sport_slug=fused.sport_slug,
+            confidence=fused.confidence,
+            reasoning=fused.reasoning,
+        ),
+    )
+
+
+def _published_at(candidate: ArticleCandidate) -> Optional[datetime]:
+    """Parse the candidate's ISO date string back to datetime for SQLAlchemy."""
+    if candidate.date:
         try:
-            # Step 2: Content Extraction (plain function, no agent)
-            content = extract_article_content(url)
-            if not content or len(content) < 50:
-                logger.debug(f"  Skipping {url}: insufficient content")
-                continue
-
-            headline = candidate.title or "No headline"
-
-            # Step 3: Summarization Agent
-            summary_result = await Runner.run(
-                summarization_agent,
-                f"Headline: {headline}\n\nArticle content:\n{content[:4000]}",
-            )
-            summarized = summary_result.final_output
-
-            # Step 4: Categorization Agent
-            cat_result = await Runner.run(
-                categorization_agent,
-                (
-                    f"Headline: {summarized.headline}\n"
-                    f"Summary: {summarized.summary}\n"
-                    f"Candidate sport from RSS source: {candidate.sport}"
-                ),
-            )
-            categorized = cat_result.final_output
+            return datetime.fromisoformat(candidate.date)
+        except (ValueError, TypeError):
+            pass
+    return None
+
+
+async def _find_duplicate(ctx: _RunContext, url: str, signature: int) -> Optional[str]:
+    """URL of the article this one near-duplicates, from this run or recently stored."""
+    primary = ctx.duplicates.claim(url, signature)
+    if primary is not None:
+        return primary
+    primary = await asyncio.to_thread(ctx.duplicates.find_stored, signature)
+    if primary is not None:
+        ctx.duplicates.redirect(url, primary)
+    return primary
+
+
+async def _process_candidate(
+    index: int,
+    total: int,
+    item: WorkItem,
+    ctx: _RunContext,
+) -> None:
+    """Stream one candidate through extract -> dedup -> summarize -> categorize -> save.
+
+    Near-duplicates of a story already seen this run or stored recently are
+    recorded as alternate sources of that article instead of being
+    summarized. Each completed stage is handed to the checkpoint writer, and the finished
+    article is committed as soon as it is categorized. A candidate resumed
+    with a stored summary skips extraction and summarization. Failures are
+    logged and recorded, and never propagate to sibling candidates.
+
+    Model calls queue for the rate limiter behind fresh candidates when this
+    one is backfill from an interrupted run, and behind newer articles. A
+    candidate whose call is still rate limited after every retry is left
+    unfinished for the next run rather than marked failed.
+    """
+    candidate = item.candidate
+    url = candidate.url
+    published = _published_at(candidate)
+    priority.set((
+        BACKFILL if item.backfill else FRESH,
+        -published.timestamp() if published else 0.0,
+    ))
+    async with ctx.workers:
+        try:
+            summarized = item.summarized
+            signature = None
+            if summarized is None:
+                # Step 2: Content Extraction (plain function, no agent)
+                content = await aextract_article_content(url)
+                if not content or len(content) < 50:
+                    logger.debug(f"  Skipping {url}: insufficient content")
+                    ctx.stats.skipped += 1
+                    ARTICLES.labels("skipped").inc()
+                    await ctx.writer.stage(url, SKIPPED)
+                    return
+
+                headline = candidate.title or "No headline"
+
+                # Collapse near-duplicate stories before paying for the model
+                if ctx.duplicates is not None:
+                    with timed("dedup"):
+                        signature = await asyncio.to_thread(simhash, content)
+                        primary = await _find_duplicate(ctx, url, signature)
+                    if primary is not None:
+                        logger.info(f"  [{index+1}/{total}] Duplicate of {primary}: {url}")
+                        ctx.stats.duplicates += 1
+                        ARTICLES.labels("duplicate").inc()
+                        await ctx.writer.duplicate(Alternate(
+                            url=url[:2000],
+                            primary_url=primary,
+                            source_name=candidate.source_name,
+                            published_at=published,
+                        ))
+                        return
+
+                # Steps 3-4: Summarize and categorize (one fused call or two steps)
+                if ctx.fused:
+                    with timed("summarize_categorize"):
+                        summarized, categorized = await _fused_stage(
+                            ctx, headline, content, candidate.sport
+                        )
+                else:
+                    with timed("summarize"):
+                        summarized = await _summarize(ctx, summary_prompt(headline, content))
+                    await ctx.writer.stage(url, SUMMARIZED, summarized.model_dump_json())
+                    with timed("categorize"):
+                        categorized = await _categorize(ctx, summarized, candidate.sport)
+            else:
+                with timed("categorize"):
+                    categorized = await _categorize(ctx, summarized, candidate.sport)
 
-            # Parse date string back to datetime for SQLAlchemy
-            pub_date = None
-            if candidate.date:
-                try:
-                    pub_date = datetime.fromisoformat(candidate.date)
-                except (ValueError, TypeError):
-                    pass
+            logger.info(
+                f"  [{index+1}/{total}] {summarized.headline[:60]}... "
+                f"-> {categorized.sport_slug} ({categorized.confidence}: {categorized.reasoning})"
+            )
 
-            articles_to_save.append({
+            # Step 5: Persist (committed incrementally by the checkpoint writer)
+            ctx.stats.processed += 1
+            await ctx.writer.save(url, {
                 "headline": summarized.headline[:500],
                 "summary": summarized.summary,
                 "source_url": url[:2000],
                 "source_name": candidate.source_name[:200],
-                "published_at": pub_date,
+                "published_at": published,
                 "sport_slug": categorized.sport_slug,
+                "signature": signature,
             })
 
-            logger.info(
-                f"  [{i+1}/{len(candidates)}] {summarized.headline[:60]}... "
-                f"-> {categorized.sport_slug} ({categorized.confidence}: {categorized.reasoning})"
-            )
-
+        except RateLimitExhausted as e:
+            logger.warning(f"  Deferred {url} to the next run: {e}")
+            ctx.stats.deferred += 1
+            ARTICLES.labels("deferred").inc()
         except Exception as e:
             logger.warning(f"  Failed processing {url}: {e}")
+            ctx.stats.failed += 1
+            ARTICLES.labels("failed").inc()
+            await ctx.writer.stage(url, FAILED)
+
+
+def _filter_known_candidates(
+    candidates: list[ArticleCandidate],
+) -> tuple[list[ArticleCandidate], int]:
+    """Drop candidates whose URL is already stored, using bulk IN lookups.
+
+    URLs recorded as alternate sources of a stored story count as stored.
+
+    Candidate URLs are normalized first; both the normalized and the original
+    form are checked so rows saved before normalization still match.
+    Returns (unique unseen candidates, number skipped as already stored).
+    """
+    unique: list[ArticleCandidate] = []
+    seen_urls: set[str] = set()
+    lookup: set[str] = set()
+    for candidate in candidates:
+        if not candidate.url:
+            continue
+        original = candidate.url
+        candidate.url = normalize_url(original)
+        if candidate.url in seen_urls:
             continue
+        seen_urls.add(candidate.url)
+        lookup.update((candidate.url, original))
+        unique.append(candidate)
+
+    known: set[str] = set()
+    lookup_list = sorted(lookup)
+    db = SessionLocal()
+    try:
+        for start in range(0, len(lookup_list), _LOOKUP_CHUNK):
+            chunk = lookup_list[start:start + _LOOKUP_CHUNK]
+            for column in (Article.source_url, ArticleSource.source_url):
+                rows = db.query(column).filter(column.in_(chunk)).all()
+                known.update(normalize_url(r[0]) for r in rows)
+    finally:
+        db.close()
+
+    fresh = [c for c in unique if c.url not in known]
+    return fresh, len(unique) - len(fresh)
+
+
+async def _discover(
+    mode: str,
+    sources_path: Optional[Path],
+    feed_state: Optional[FeedStateStore] = None,
+) -> list[ArticleCandidate]:
+    """Step 1: collect candidates directly from the feeds, or via the discovery agent.
+
+    In direct mode, advanced feed marks are left in ``feed_state`` for the
+    caller to save once the candidates are checkpointed.
+    """
+    if mode == "agent":
+        logger.info("Step 1: Running Source Discovery Agent...")
+        started = time.perf_counter()
+        prompt = "Fetch all article candidates from the configured RSS feeds."
+        discovery_result = await limiter.call(
+            lambda: Runner.run(source_discovery_agent, prompt),
+            prompt,
+            source_discovery_agent.name,
+        )
+        record_llm_call(
+            source_discovery_agent.name, time.perf_counter() - started, discovery_result
+        )
+        return discovery_result.final_output.candidates
+    if mode != "direct":
+        raise ValueError(f"Unknown discovery mode: {mode!r} (expected 'direct' or 'agent')")
+
+    logger.info("Step 1: Fetching RSS feeds directly...")
+    items = await asyncio.to_thread(collect_rss_candidates, sources_path, feed_state)
+    return [ArticleCandidate(**item) for item in items]
+
+
+async def run_pipeline(
+    sources_path: Optional[Path] = None,
+    max_concurrency: Optional[int] = None,
+    per_host_concurrency: Optional[int] = None,
+    classifier_threshold: Optional[float] = None,
+    discovery: Optional[str] = None,
+    summary_batch_size: Optional[int] = None,
+    fused: Optional[bool] = None,
+    stats: Optional[PipelineStats] = None,
+) -> int:
+    """Run full agent pipeline: discover -> extract -> summarize -> categorize -> save.
+
+    Candidates stream through the stages independently: each finished article
+    is committed as it completes, and per-candidate stage state is recorded in
+    ``pipeline_checkpoints`` so an interrupted run is resumed by the next one.
+
+    Candidates are processed concurrently, bounded by ``max_concurrency`` in
+    total and ``per_host_concurrency`` for pooled connections to a single host
+    (defaults: ``PIPELINE_CONCURRENCY`` / ``PIPELINE_PER_HOST_CONCURRENCY``).
+    A ``max_concurrency`` of 1 reproduces the original sequential behaviour.
+
+    Articles the local keyword classifier labels with confidence at or above
+    ``classifier_threshold`` (default ``LOCAL_CLASSIFIER_THRESHOLD``) skip the
+    Categorization Agent; pass a value above 1 to always use the agent.
+
+    ``discovery`` is ``"direct"`` (build candidates straight from the feed
+    parser, no model involved) or ``"agent"`` (the Source Discovery Agent);
+    defaults to ``PIPELINE_DISCOVERY``, itself defaulting to direct.
+
+    ``summary_batch_size`` above 1 (default ``SUMMARY_BATCH_SIZE``) groups up
+    to that many concurrent summarizations, within ``SUMMARY_BATCH_TOKENS``,
+    into one model call; batches can never exceed ``max_concurrency``.
+
+    ``fused=True`` (default ``PIPELINE_FUSED``) replaces steps 3 and 4 with a
+    single Summarize & Categorize Agent call per article; batching and the
+    local classifier only apply to the two-step path.
+
+    Every model call goes through the shared rate limiter
+    (``agent.crew.ratelimit``), which retries 429s and transient errors; when
+    ``OPENAI_API_KEY`` is set, the run installs a client that feeds it the
+    provider's rate-limit headers.
+
+    Pass ``stats`` to receive the run's counters (e.g. to record them in
+    ``pipeline_runs``); they are filled in as the run progresses.
+    """
+    started = time.perf_counter()
+    summary_batch_size = max(1, summary_batch_size or _DEFAULT_SUMMARY_BATCH_SIZE)
+    fused = _DEFAULT_FUSED if fused is None else fused
+    max_concurrency = max(1, max_concurrency or _DEFAULT_CONCURRENCY)
+    per_host_concurrency = max(1, per_host_concurrency or _DEFAULT_PER_HOST_CONCURRENCY)
+
+    if os.getenv("OPENAI_API_KEY"):
+        # A fresh client per run: its connection pool is bound to this event loop
+        install_openai_client()
 
-    # Step 5: Persist to DB
     init_db()
     db = SessionLocal()
-    seed_sports(db)
-    db.commit()
-    saved = 0
     try:
-        sport_map = {s.slug: s.id for s in db.query(Sport).all()}
-        for a in articles_to_save:
-            sport_id = sport_map.get(a["sport_slug"])
-            if not sport_id:
-                continue
-            existing = db.query(Article).filter_by(source_url=a["source_url"]).first()
-            if existing:
-                continue
-            db.add(Article(
-                sport_id=sport_id,
-                headline=a["headline"],
-                summary=a["summary"],
-                source_url=a["source_url"],
-                source_name=a["source_name"],
-                published_at=a["published_at"],
-            ))
-            saved += 1
+        seed_sports(db)
         db.commit()
     finally:
         db.close()
 
-    logger.info(f"Pipeline complete. Saved {saved} new articles.")
+    # Resume an interrupted run's unfinished candidates, if any
+    run_id, leftovers = await asyncio.to_thread(load_unfinished_run)
+    resumed = {item.candidate.url: item for item in leftovers}
+    if run_id:
+        logger.info(f"Resuming run {run_id} with {len(leftovers)} unfinished candidates")
+
+    # Step 1: Source discovery
+    feed_state = FeedStateStore()
+    with timed("discovery"):
+        candidates = await _discover(discovery or _DEFAULT_DISCOVERY, sources_path, feed_state)
+    stats = stats if stats is not None else PipelineStats()
+    stats.discovered = len(candidates)
+    logger.info(f"  Discovered {len(candidates)} candidates")
+
+    # Pre-filter: skip URLs stored by earlier runs before paying for extraction
+    # (filtering normalizes candidate URLs; checkpoints are keyed by the original)
+    checkpointed = [(item.candidate, item.candidate.url) for item in leftovers]
+    unique, stats.known_skipped = _filter_known_candidates(
+        [item.candidate for item in leftovers] + candidates
+    )
+    logger.info(f"  Skipped {stats.known_skipped} already-stored articles")
+    fresh = [c for c in unique if c.url not in resumed]
+    # Leftovers already stored (e.g. a crash between insert and checkpoint) are
+    # closed as skipped, or their run would never finish
+    unique_urls = {c.url for c in unique}
+    stored_leftovers = [url for c, url in checkpointed if c.url not in unique_urls]
+    run_id = await asyncio.to_thread(register_candidates, run_id, fresh)
+    # Feed marks only move past entries once they are checkpointed
+    await asyncio.to_thread(feed_state.save)
+    items = [resumed.get(c.url) or WorkItem(c) for c in unique]
+    stats.resumed = len(items) - len(fresh)
+
+    # Steps 2-5: Stream candidates through the stages concurrently
+    logger.info(
+        f"Steps 2-5: Processing {len(items)} candidates in run {run_id} "
+        f"(concurrency={max_concurrency}, per_host={per_host_concurrency}, "
+        f"summary_batch={summary_batch_size}, fused={fused})"
+    )
+    ctx = _RunContext(
+        workers=asyncio.Semaphore(max_concurrency),
+        stats=stats,
+        cache=AgentOutputCache() if _CACHE_ENABLED else None,
+        classifier_threshold=(
+            DEFAULT_THRESHOLD if classifier_threshold is None else classifier_threshold
+        ),
+        fused=fused,
+        duplicates=DuplicateIndex() if _DEDUP_ENABLED else None,
+    )
+    if summary_batch_size > 1 and not fused:
+        ctx.summarizer = MicroBatcher(
+            run_batch=lambda batch: _summarize_batch(ctx, batch),
+            run_single=lambda prompt: _run_agent(ctx, summarization_agent, prompt),
+            batch_size=summary_batch_size,
+            token_budget=_SUMMARY_BATCH_TOKENS,
+        )
+    try:
+        async with http_session(per_host=per_host_concurrency), \
+                CheckpointWriter(run_id) as ctx.writer:
+            for url in stored_leftovers:
+                await ctx.writer.stage(url, SKIPPED)
+            await asyncio.gather(*(
+                _process_candidate(i, len(items), item, ctx)
+                for i, item in enumerate(items)
+            ))
+    finally:
+        if ctx.summarizer is not None:
+            logger.info(
+                f"  Summary batching: {ctx.summarizer.batches} batches, "
+                f"{ctx.summarizer.fallbacks} entries fell back to single calls"
+            )
+        if ctx.cache is not None:
+            ctx.cache.log_stats()
+            await asyncio.to_thread(ctx.cache.prune)
+            ctx.cache.close()
+
+    if not await asyncio.to_thread(finish_run, run_id):
+        logger.warning(f"  Run {run_id} left unfinished candidates; they resume next run")
+
+    saved = ctx.writer.saved
+    stats.saved = saved
+    stats.elapsed = time.perf_counter() - started
+    logger.info(f"Pipeline complete. Saved {saved} new articles. ({stats.summary()})")
     return saved
 
 
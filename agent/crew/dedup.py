@@ -0,0 +1,205 @@
+"""Near-duplicate story detection with 64-bit SimHash signatures.
+
+Each extracted article gets a SimHash over word 3-gram shingles of its
+text (not the feed headline, which outlets rewrite more freely than the
+copy); two stories are duplicates when their signatures differ in at most
+``MAX_DISTANCE`` bits. Signatures of stored articles live in
+``article_signatures``, split into four 16-bit bands: by the pigeonhole
+principle, any two signatures within 3 bits share at least one band
+exactly, so lookups are indexed equality queries over a recent window.
+Distances above 3 still work within a run but may miss stored matches.
+"""
+import hashlib
+import os
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import Article, ArticleSignature, ArticleSource
+
+MAX_DISTANCE = int(os.getenv("DEDUP_MAX_DISTANCE", "3"))
+WINDOW_DAYS = float(os.getenv("DEDUP_WINDOW_DAYS", "3"))
+
+_BITS = 64
+_BANDS = 4
+_BAND_BITS = _BITS // _BANDS
+_SHINGLE = 3
+# Characters of article text hashed; the summarizer sees 4000.
+_MAX_CHARS = 4000
+_WORD = re.compile(r"\w+")
+
+
+def simhash(text: str) -> int:
+    """Unsigned 64-bit SimHash of ``text``'s word shingles."""
+    words = _WORD.findall(text[:_MAX_CHARS].lower())
+    shingles = Counter(
+        " ".join(words[i:i + _SHINGLE]) for i in range(max(1, len(words) - _SHINGLE + 1))
+    )
+    totals = [0] * _BITS
+    for shingle, weight in shingles.items():
+        h = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        for bit in range(_BITS):
+            totals[bit] += weight if h >> bit & 1 else -weight
+    return sum(1 << bit for bit, total in enumerate(totals) if total > 0)
+
+
+def distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def bands(signature: int) -> list[int]:
+    mask = (1 << _BAND_BITS) - 1
+    return [signature >> (i * _BAND_BITS) & mask for i in range(_BANDS)]
+
+
+def _to_signed(signature: int) -> int:
+    """Store unsigned 64-bit values in a signed BIGINT column."""
+    return signature - (1 << _BITS) if signature >= 1 << (_BITS - 1) else signature
+
+
+def _to_unsigned(value: int) -> int:
+    return value % (1 << _BITS)
+
+
+class DuplicateIndex:
+    """Signatures of the current run, plus lookups against recently stored articles.
+
+    ``claim`` is synchronous so that, on one event loop, two copies of a story
+    can never both register as the original. Each entry maps to the URL its
+    duplicates should attach to: the candidate's own URL, or the stored
+    article it was found to duplicate.
+    """
+
+    def __init__(self, max_distance: int = MAX_DISTANCE, window_days: float = WINDOW_DAYS):
+        self.max_distance = max_distance
+        self.window = timedelta(days=window_days)
+        self._entries: list[list] = []  # [signature, primary url]
+        self._bands: dict[tuple[int, int], list[int]] = defaultdict(list)
+        self._by_url: dict[str, int] = {}
+
+    def claim(self, url: str, signature: int) -> Optional[str]:
+        """Return the primary URL if ``signature`` duplicates one seen this run;
+        otherwise register ``url`` as a new primary and return None."""
+        seen: set[int] = set()
+        for key in enumerate(bands(signature)):
+            for idx in self._bands.get(key, ()):
+                if idx in seen:
+                    continue
+                seen.add(idx)
+                other, primary = self._entries[idx]
+                if distance(signature, other) <= self.max_distance:
+                    return primary
+        idx = len(self._entries)
+        self._entries.append([signature, url])
+        self._by_url[url] = idx
+        for key in enumerate(bands(signature)):
+            self._bands[key].append(idx)
+        return None
+
+    def redirect(self, url: str, primary: str) -> None:
+        """Point duplicates of ``url`` at ``primary`` (an already stored article)."""
+        idx = self._by_url.get(url)
+        if idx is not None:
+            self._entries[idx][1] = primary
+
+    def find_stored(self, signature: int) -> Optional[str]:
+        """Source URL of a recently stored article within ``max_distance``, if any."""
+        since = datetime.utcnow() - self.window
+        columns = (
+            ArticleSignature.band0,
+            ArticleSignature.band1,
+            ArticleSignature.band2,
+            ArticleSignature.band3,
+        )
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(ArticleSignature.simhash, Article.source_url)
+                .join(Article, Article.id == ArticleSignature.article_id)
+                .filter(
+                    ArticleSignature.created_at >= since,
+                    or_(*(col == band for col, band in zip(columns, bands(signature)))),
+                )
+                .all()
+            )
+        finally:
+            db.close()
+        best = min(
+            ((distance(signature, _to_unsigned(value)), url) for value, url in rows),
+            default=None,
+        )
+        if best is not None and best[0] <= self.max_distance:
+            return best[1]
+        return None
+
+
+@dataclass
+class Alternate:
+    """A duplicate candidate to record as another source of ``primary_url``."""
+    url: str
+    primary_url: str
+    source_name: str
+    published_at: Optional[datetime] = None
+
+
+def store_signatures(db: Session, signatures: dict[str, int]) -> None:
+    """Record signatures for stored articles, keyed by source URL."""
+    ids = dict(
+        db.query(Article.source_url, Article.id)
+        .filter(Article.source_url.in_(list(signatures)))
+        .all()
+    )
+    existing = {
+        article_id for (article_id,) in
+        db.query(ArticleSignature.article_id)
+        .filter(ArticleSignature.article_id.in_(list(ids.values())))
+    }
+    for url, article_id in ids.items():
+        if article_id in existing:
+            continue
+        signature = signatures[url]
+        band_values = bands(signature)
+        db.add(ArticleSignature(
+            article_id=article_id,
+            simhash=_to_signed(signature),
+            band0=band_values[0],
+            band1=band_values[1],
+            band2=band_values[2],
+            band3=band_values[3],
+        ))
+
+
+def attach_alternates(db: Session, alternates: list[Alternate]) -> list[Alternate]:
+    """Record alternates whose primary article is stored; return the rest."""
+    if not alternates:
+        return []
+    ids = dict(
+        db.query(Article.source_url, Article.id)
+        .filter(Article.source_url.in_({a.primary_url for a in alternates}))
+        .all()
+    )
+    known = {
+        url for (url,) in
+        db.query(ArticleSource.source_url)
+        .filter(ArticleSource.source_url.in_({a.url for a in alternates}))
+    }
+    pending = []
+    for alt in alternates:
+        article_id = ids.get(alt.primary_url)
+        if article_id is None:
+            pending.append(alt)
+        elif alt.url not in known:
+            known.add(alt.url)
+            db.add(ArticleSource(
+                article_id=article_id,
+                source_url=alt.url,
+                source_name=alt.source_name[:200],
+                published_at=alt.published_at,
+            ))
+    return pending
@@ -0,0 +1,73 @@
+"""Prometheus metrics for pipeline stages, model calls and feed sources.
+
+The pipeline runs in the worker process; set ``PROMETHEUS_MULTIPROC_DIR``
+to a directory shared with the API so its ``/metrics`` endpoint reports
+these alongside its own request metrics.
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from prometheus_client import Counter, Histogram
+
+_STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+STAGE_SECONDS = Histogram(
+    "pipeline_stage_seconds",
+    "Time spent in each pipeline stage, per call",
+    ["stage"],
+    buckets=_STAGE_BUCKETS,
+)
+LLM_CALLS = Counter("pipeline_llm_calls_total", "Model calls made, by agent", ["agent"])
+LLM_SECONDS = Histogram(
+    "pipeline_llm_seconds", "Model call latency, by agent", ["agent"], buckets=_STAGE_BUCKETS
+)
+LLM_TOKENS = Counter(
+    "pipeline_llm_tokens_total", "Model tokens used, by agent and kind", ["agent", "kind"]
+)
+LLM_RETRIES = Counter(
+    "pipeline_llm_retries_total", "Model calls retried, by agent and error", ["agent", "reason"]
+)
+LLM_WAIT_SECONDS = Histogram(
+    "pipeline_llm_wait_seconds",
+    "Time model calls waited for the client-side rate limiter, by agent",
+    ["agent"],
+    buckets=_STAGE_BUCKETS,
+)
+AGENT_CACHE = Counter(
+    "pipeline_agent_cache_total", "Agent output cache lookups", ["agent", "result"]
+)
+SOURCE_FETCHES = Counter(
+    "pipeline_source_fetches_total",
+    "Feed polls per source, by result (hit = not modified, miss = new content, error)",
+    ["source", "result"],
+)
+ARTICLES = Counter(
+    "pipeline_articles_total", "Candidates finished, by outcome", ["outcome"]
+)
+RUNS = Counter("pipeline_runs_total", "Pipeline runs completed, by status", ["status"])
+RUN_SECONDS = Histogram(
+    "pipeline_run_seconds",
+    "Wall time of whole pipeline runs",
+    buckets=(10, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200),
+)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """Observe the wall time of the block in pipeline_stage_seconds{stage}."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.labels(stage).observe(time.perf_counter() - started)
+
+
+def record_llm_call(agent_name: str, seconds: float, result: Any) -> None:
+    """Count one ``Runner.run`` call and the token usage it reported."""
+    LLM_CALLS.labels(agent_name).inc()
+    LLM_SECONDS.labels(agent_name).observe(seconds)
+    usage = getattr(getattr(result, "context_wrapper", None), "usage", None)
+    if usage is not None:
+        LLM_TOKENS.labels(agent_name, "input").inc(usage.input_tokens or 0)
+        LLM_TOKENS.labels(agent_name, "output").inc(usage.output_tokens or 0)
@@ -25,8 +25,29 @@ class SummarizedArticle(BaseModel):
     summary: str
 
 
+class BatchSummaryItem(BaseModel):
+    """One article's summary inside a batched summarization response."""
+    id: str = Field(description="The id given for the article in the request")
+    headline: str
+    summary: str
+
+
+class BatchSummaryResult(BaseModel):
+    """Output of the Batch Summarization Agent."""
+    items: list[BatchSummaryItem]
+
+
 class CategorizedArticle(BaseModel):
     """Output of the Categorization Agent."""
     sport_slug: str = Field(description="Either 'cricket' or 'soccer'")
     confidence: str = Field(description="low, medium, or high")
     reasoning: str = Field(description="Brief explanation for the categorization")
+
+
+class SummarizedCategorizedArticle(BaseModel):
+    """Output of the fused Summarize & Categorize Agent."""
+    headline: str
+    summary: str
+    sport_slug: str = Field(description="Either 'cricket' or 'soccer'")
+    confidence: str = Field(description="low, medium, or high")
+    reasoning: str = Field(description="Brief explanation for the categorization")
@@ -0,0 +1,290 @@
+"""Client-side rate limiting, retries and prioritization for model calls.
+
+Every agent invocation in the pipeline goes through ``limiter.call``:
+
+* Two token buckets, requests/min and tokens/min (``LLM_REQUESTS_PER_MINUTE``,
+  ``LLM_TOKENS_PER_MINUTE``), refill continuously. A call reserves one
+  request and its estimated tokens; the estimate is settled against the
+  usage the response reports.
+* Waiting calls are served in priority order (``priority`` context var):
+  fresh candidates before backfill resumed from an interrupted run, and
+  newer articles first within each.
+* Rate-limit response headers tighten the buckets: ``x-ratelimit-limit-*``
+  lowers the budget, ``x-ratelimit-remaining-*`` caps what is left, and a
+  429's ``retry-after`` (or reset time) pauses every caller.
+* 429s, timeouts, connection errors and 5xx responses are retried with
+  full-jitter exponential backoff. Each 429 also cuts the refill rate,
+  which recovers step by step as calls succeed.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import random
+import re
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Mapping, Optional, TypeVar
+
+import openai
+
+from agent.crew.batching import estimate_tokens
+from agent.crew.metrics import LLM_RETRIES, LLM_WAIT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+FRESH = 0
+BACKFILL = 1
+
+_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+_TOKENS_PER_MINUTE = float(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "4"))
+_RETRY_BASE_SECONDS = float(os.getenv("LLM_RETRY_BASE_SECONDS", "1"))
+_RETRY_MAX_SECONDS = float(os.getenv("LLM_RETRY_MAX_SECONDS", "60"))
+_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "120"))
+
+# Seconds of budget that may be spent at once
+_BURST_SECONDS = 10.0
+# Tokens reserved for the response on top of the prompt estimate
+_OUTPUT_TOKENS = 500
+_MIN_SCALE = 0.1
+_THROTTLE = 0.7
+_RECOVERY = 0.02
+
+_RETRYABLE = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    asyncio.TimeoutError,
+)
+_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+# (tier, -published timestamp) of the candidate whose call is being made
+priority: ContextVar[tuple] = ContextVar("llm_priority", default=(FRESH, 0.0))
+
+
+class RateLimitExhausted(Exception):
+    """A model call still hit retryable errors after every retry."""
+
+
+def usage_tokens(result: Any) -> Optional[int]:
+    """Total tokens a ``Runner.run`` result reports, if any."""
+    usage = getattr(getattr(result, "context_wrapper", None), "usage", None)
+    return getattr(usage, "total_tokens", None) or None
+
+
+def _seconds(value: Optional[str]) -> Optional[float]:
+    """Parse ``"20"``, ``"1.5s"``, ``"250ms"`` or ``"6m0s"`` to seconds."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        parts = _DURATION.findall(value)
+        return sum(float(n) * _UNITS[unit] for n, unit in parts) if parts else None
+
+
+class _Bucket:
+    """Continuously refilling budget of ``per_minute`` units; may go into debt."""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    @property
+    def capacity(self) -> float:
+        return max(1.0, self.per_minute * _BURST_SECONDS / 60)
+
+    def refill(self, now: float, scale: float) -> None:
+        rate = self.per_minute * scale / 60
+        self.level = min(self.capacity, self.level + (now - self.updated) * rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, scale: float) -> float:
+        # Requests larger than the burst capacity wait for a full bucket
+        need = min(amount, self.capacity) - self.level
+        return 0.0 if need <= 0 else need * 60 / (self.per_minute * scale)
+
+
+class RateLimiter:
+    """Requests/min and tokens/min budgets shared by every model call of the process."""
+
+    def __init__(
+        self,
+        requests_per_minute: float = _REQUESTS_PER_MINUTE,
+        tokens_per_minute: float = _TOKENS_PER_MINUTE,
+        max_retries: int = _MAX_RETRIES,
+        retry_base: float = _RETRY_BASE_SECONDS,
+        retry_max: float = _RETRY_MAX_SECONDS,
+        timeout: float = _TIMEOUT_SECONDS,
+    ):
+        self.configured = (requests_per_minute, tokens_per_minute)
+        self.requests = _Bucket(requests_per_minute)
+        self.tokens = _Bucket(tokens_per_minute)
+        self.max_retries = max_retries
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.timeout = timeout
+        self.scale = 1.0
+        self.paused_until = 0.0
+        self._seq = itertools.count()
+        # Waiters and their condition belong to one event loop; each run has its own
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cond: Optional[asyncio.Condition] = None
+        self._waiting: list[tuple] = []
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._cond, self._waiting = loop, asyncio.Condition(), []
+        return self._cond
+
+    async def acquire(self, tokens: int, rank: Optional[tuple] = None) -> float:
+        """Wait, in priority order, for one request and ``tokens``; returns seconds waited."""
+        cond = self._condition()
+        entry = (rank if rank is not None else priority.get(), next(self._seq))
+        started = time.monotonic()
+        async with cond:
+            heapq.heappush(self._waiting, entry)
+            try:
+                while True:
+                    if self._waiting[0] != entry:
+                        await cond.wait()
+                        continue
+                    now = time.monotonic()
+                    self.requests.refill(now, self.scale)
+                    self.tokens.refill(now, self.scale)
+                    wait = max(
+                        self.paused_until - now,
+                        self.requests.wait_time(1, self.scale),
+                        self.tokens.wait_time(tokens, self.scale),
+                    )
+                    if wait <= 0:
+                        self.requests.level -= 1
+                        self.tokens.level -= tokens
+                        heapq.heappop(self._waiting)
+                        cond.notify_all()
+                        return time.monotonic() - started
+                    try:
+                        await asyncio.wait_for(cond.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                if entry in self._waiting:
+                    self._waiting.remove(entry)
+                    heapq.heapify(self._waiting)
+                    cond.notify_all()
+                raise
+
+    def settle(self, reserved: int, used: int) -> None:
+        """Correct the token bucket once a call's real usage is known."""
+        self.tokens.level += reserved - used
+
+    def observe_headers(self, headers: Mapping[str, str]) -> None:
+        """Adopt the provider's view of the limits from ``x-ratelimit-*`` headers."""
+        for bucket, configured, kind in (
+            (self.requests, self.configured[0], "requests"),
+            (self.tokens, self.configured[1], "tokens"),
+        ):
+            limit = _seconds(headers.get(f"x-ratelimit-limit-{kind}"))
+            if limit:
+                bucket.per_minute = min(configured, limit)
+            remaining = _seconds(headers.get(f"x-ratelimit-remaining-{kind}"))
+            if remaining is not None:
+                bucket.level = min(bucket.level, remaining)
+
+    async def observe_response(self, response: Any) -> None:
+        """httpx response event hook feeding ``observe_headers``."""
+        self.observe_headers(response.headers)
+
+    def _retry_delay(self, error: BaseException, attempt: int) -> float:
+        backoff = random.uniform(0, min(self.retry_max, self.retry_base * 2 ** attempt))
+        if not isinstance(error, openai.RateLimitError):
+            return backoff
+        headers = error.response.headers
+        self.observe_headers(headers)
+        self.scale = max(_MIN_SCALE, self.scale * _THROTTLE)
+        retry_after = _seconds(headers.get("retry-after-ms"))
+        retry_after = retry_after / 1000 if retry_after else _seconds(headers.get("retry-after"))
+        if retry_after is None:
+            resets = [
+                _seconds(headers.get(f"x-ratelimit-reset-{kind}"))
+                for kind in ("requests", "tokens")
+                if _seconds(headers.get(f"x-ratelimit-remaining-{kind}")) == 0
+            ]
+            retry_after = max((r for r in resets if r), default=None)
+        if retry_after is None:
+            return backoff
+        # Everyone waits out the provider's reset; this caller adds jitter on top
+        self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+        return retry_after + random.uniform(0, self.retry_base)
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        prompt: str,
+        agent_name: str,
+    ) -> T:
+        """Run ``fn`` (one model call for ``prompt``) under the budgets, retrying
+        transient failures; raises ``RateLimitExhausted`` when retries run out."""
+        reserved = estimate_tokens(prompt) + _OUTPUT_TOKENS
+        attempt = 0
+        while True:
+            LLM_WAIT_SECONDS.labels(agent_name).observe(await self.acquire(reserved))
+            try:
+                result = await asyncio.wait_for(fn(), self.timeout)
+            except _RETRYABLE as e:
+                # A rejected or lost call is not billed; release its tokens
+                self.settle(reserved, 0)
+                reason = type(e).__name__
+                if attempt >= self.max_retries:
+                    raise RateLimitExhausted(
+                        f"{agent_name}: {reason} after {attempt + 1} attempts"
+                    ) from e
+                delay = self._retry_delay(e, attempt)
+                LLM_RETRIES.labels(agent_name, reason).inc()
+                logger.info(f"  {agent_name}: {reason}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self.scale = min(1.0, self.scale + _RECOVERY)
+            used = usage_tokens(result)
+            if used:
+                self.settle(reserved, used)
+            return result
+
+
+limiter = RateLimiter()
+
+
+async def run_limited(agent: Any, prompt: str) -> Any:
+    """``Runner.run(agent, prompt)`` under ``limiter``, for scripts outside the pipeline."""
+    from agents import Runner
+
+    return await limiter.call(lambda: Runner.run(agent, prompt), prompt, agent.name)
+
+
+def install_openai_client(base_url: Optional[str] = None, api_key: Optional[str] = None) -> None:
+    """Give the Agents SDK an OpenAI client whose responses feed ``limiter``.
+
+    The client's own retries are disabled so the limiter sees every 429 and
+    its headers. Call once per pipeline run: the client's connection pool
+    belongs to the event loop that first uses it.
+    """
+    from agents import set_default_openai_client
+
+    client = openai.AsyncOpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        max_retries=0,
+        http_client=openai.DefaultAsyncHttpxClient(
+            event_hooks={"response": [limiter.observe_response]}
+        ),
+    )
+    set_default_openai_client(client, use_for_tracing=False)
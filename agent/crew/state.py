@@ -0,0 +1,187 @@
+"""Persistent pipeline state kept on disk between runs."""
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+_root = Path(__file__).resolve().parents[2]
+
+CACHE_DIR = Path(os.getenv("AGENT_CACHE_DIR", str(_root / "agent" / ".cache")))
+
+# Entries taken from a feed with no publish-rate history yet
+INITIAL_ENTRIES = int(os.getenv("FEED_INITIAL_ENTRIES", "15"))
+# Upper bound on entries emitted per feed per run; a larger backlog drains over later runs
+MAX_ENTRIES = int(os.getenv("FEED_MAX_ENTRIES", "100"))
+_MIN_ENTRIES = 5
+# Budget = expected new entries since the last poll x headroom (+ minimum)
+_HEADROOM = 3.0
+_RATE_SMOOTHING = 0.3
+# Stop scanning after this many consecutive already-seen entries
+_KNOWN_RUN = 3
+_SEEN_KEEP = max(200, 2 * MAX_ENTRIES)
+
+
+@dataclass
+class FeedMark:
+    """A feed's high-water mark and observed publish rate.
+
+    ``select`` returns only entries newer than the mark: not among the
+    recently ``seen`` entry ids, and not published before ``last_published``.
+    Scanning stops after a few consecutive known entries, so a quiet feed
+    costs a handful of lookups. At most ``budget()`` entries are emitted,
+    sized from the publish rate and the time since the last poll; if a
+    backlog exceeds it, the mark is held back so the rest is emitted next run.
+    """
+    last_published: Optional[datetime] = None
+    seen: list = field(default_factory=list)
+    rate: Optional[float] = None  # entries per hour, smoothed
+    polled_at: Optional[datetime] = None
+    backlog: bool = False
+
+    @classmethod
+    def from_state(cls, state: dict) -> "FeedMark":
+        def when(key: str) -> Optional[datetime]:
+            return datetime.fromisoformat(state[key]) if state.get(key) else None
+
+        return cls(
+            last_published=when("last_published"),
+            seen=list(state.get("seen") or []),
+            rate=state.get("rate"),
+            polled_at=when("polled_at"),
+            backlog=bool(state.get("backlog")),
+        )
+
+    def to_state(self) -> dict:
+        """Values for ``FeedStateStore.update`` (None removes a key)."""
+        return {
+            "last_published": self.last_published.isoformat() if self.last_published else None,
+            "seen": self.seen or None,
+            "rate": round(self.rate, 4) if self.rate is not None else None,
+            "polled_at": self.polled_at.isoformat() if self.polled_at else None,
+            "backlog": self.backlog or None,
+        }
+
+    def budget(self, now: datetime) -> int:
+        if self.rate is None or self.polled_at is None:
+            return INITIAL_ENTRIES
+        hours = max(0.0, (now - self.polled_at).total_seconds() / 3600)
+        expected = math.ceil(self.rate * hours * _HEADROOM)
+        return max(_MIN_ENTRIES, min(MAX_ENTRIES, expected + _MIN_ENTRIES))
+
+    def select(
+        self,
+        entries: Iterable[Tuple[str, Optional[datetime], object]],
+        now: datetime,
+    ) -> list:
+        """Pick new ``(key, published, payload)`` entries (newest first) and advance the mark.
+
+        ``published`` may be a callable returning the date, so dates are only
+        parsed for entries that are not already known by key.
+        """
+        budget = self.budget(now)
+        seen = set(self.seen)
+        first_poll = self.polled_at is None
+        fresh: list = []
+        truncated = False
+        known_run = 0
+        for key, published, payload in entries:
+            if key in seen:
+                known_run += 1
+                if known_run >= _KNOWN_RUN and not self.backlog:
+                    break
+                continue
+            if callable(published):
+                published = published()
+            if published and self.last_published and published < self.last_published:
+                known_run += 1
+                if known_run >= _KNOWN_RUN and not self.backlog:
+                    break
+                continue
+            known_run = 0
+            if len(fresh) >= budget:
+                truncated = True
+                break
+            fresh.append((key, published, payload))
+
+        dates = [published for _, published, _ in fresh if published]
+        if first_poll:
+            # Entries beyond the initial budget predate the pipeline; skip them for good
+            self.rate = _rate_from_dates(dates)
+        else:
+            # A truncated poll only shows a lower bound; overestimate so the budget grows
+            self._observe(len(fresh) * (2 if truncated else 1), now)
+            self.backlog = truncated
+        if dates and not self.backlog:
+            self.last_published = max(dates + [self.last_published or dates[0]])
+        self.seen = ([key for key, _, _ in fresh] + self.seen)[:_SEEN_KEEP]
+        self.polled_at = now
+        return fresh
+
+    def unchanged(self, now: datetime) -> None:
+        """Record a poll that found nothing new (e.g. HTTP 304)."""
+        if self.polled_at is not None:
+            self._observe(0, now)
+            self.polled_at = now
+
+    def _observe(self, count: int, now: datetime) -> None:
+        hours = (now - self.polled_at).total_seconds() / 3600 if self.polled_at else 0
+        if hours < 1 / 60:
+            return
+        observed = count / hours
+        if self.rate is None:
+            self.rate = observed
+        else:
+            self.rate = _RATE_SMOOTHING * observed + (1 - _RATE_SMOOTHING) * self.rate
+
+
+def _rate_from_dates(dates: list) -> Optional[float]:
+    """Entries per hour implied by the spread of a feed's publish dates."""
+    if len(dates) < 2:
+        return None
+    span = (max(dates) - min(dates)).total_seconds() / 3600
+    return (len(dates) - 1) / span if span > 0 else None
+
+
+class FeedStateStore:
+    """Per-feed state (HTTP validators, etc.) persisted as a JSON file.
+
+    Keys are feed URLs; values are small dicts. Updates are thread-safe and
+    written atomically by ``save``.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else CACHE_DIR / "feed_state.json"
+        self._lock = threading.Lock()
+        self._data: Dict[str, dict] = {}
+        try:
+            with open(self.path) as f:
+                loaded = json.load(f)
+            if isinstance(loaded, dict):
+                self._data = loaded
+        except (OSError, ValueError):
+            pass
+
+    def get(self, feed_url: str) -> dict:
+        with self._lock:
+            return dict(self._data.get(feed_url, {}))
+
+    def update(self, feed_url: str, **values) -> None:
+        with self._lock:
+            entry = self._data.setdefault(feed_url, {})
+            for key, value in values.items():
+                if value is None:
+                    entry.pop(key, None)
+                else:
+                    entry[key] = value
+
+    def save(self) -> None:
+        with self._lock:
+            payload = json.dumps(self._data, indent=2, sort_keys=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(payload)
+        os.replace(tmp, self.path)
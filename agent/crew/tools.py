@@ -1,85 +1,312 @@
 """Tools for RSS parsing and content extraction."""
+import asyncio
 import json
-import re
+import logging
+import os
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import AsyncIterator, Iterator, List, Dict, Optional, Tuple
 from urllib.parse import urlparse
 
 import feedparser
-import requests
+import httpx
 import yaml
-from bs4 import BeautifulSoup
 from agents import function_tool
 
+from agent.crew.extraction import MAX_PARSE_BYTES, extract_text
+from agent.crew.metrics import SOURCE_FETCHES, STAGE_SECONDS, timed
+from agent.crew.state import FeedMark, FeedStateStore
+from agent.crew.urls import normalize_url
 
-def parse_rss_feed(url: str, source_name: str, sport_slug: str) -> List[Dict]:
-    """Parse RSS feed and return list of {title, url, date, source_name, sport}."""
+logger = logging.getLogger(__name__)
+
+_USER_AGENT = "Mozilla/5.0 (compatible; SportsNewsBot/1.0)"
+_RSS_FETCH_CONCURRENCY = int(os.getenv("RSS_FETCH_CONCURRENCY", "8"))
+
+
+def parse_rss_feed(
+    url: str,
+    source_name: str,
+    sport_slug: str,
+    state: Optional[FeedStateStore] = None,
+) -> List[Dict]:
+    """Parse RSS feed and return list of {title, url, date, source_name, sport}.
+
+    When a ``state`` store is given, the feed is requested conditionally with
+    its saved ETag / Last-Modified validators; an unchanged feed (HTTP 304)
+    returns an empty list without being parsed. Only entries newer than the
+    feed's saved high-water mark are returned (see ``FeedMark``); without a
+    store, the newest ``FEED_INITIAL_ENTRIES`` entries are.
+    """
+    items, _ = _poll_feed(url, source_name, sport_slug, state)
+    return items
+
+
+def _poll_feed(
+    url: str,
+    source_name: str,
+    sport_slug: str,
+    state: Optional[FeedStateStore],
+) -> Tuple[List[Dict], str]:
+    """Fetch one feed; returns (items, status) with status hit/miss/error."""
     try:
-        feed = feedparser.parse(url)
-        items = []
-        for entry in feed.entries[:15]:  # Limit per feed
-            link = entry.get("link") or entry.get("href")
-            if not link:
-                continue
-            # Parse date
-            pub_date = None
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                try:
-                    pub_date = datetime(*entry.published_parsed[:6])
-                except (TypeError, ValueError):
-                    pass
-            items.append({
+        saved = state.get(url) if state else {}
+        feed = feedparser.parse(
+            url,
+            etag=saved.get("etag"),
+            modified=saved.get("modified"),
+            agent=_USER_AGENT,
+        )
+        status = feed.get("status")
+        now = datetime.utcnow()
+        mark = FeedMark.from_state(saved)
+        if status == 304:
+            if state:
+                mark.unchanged(now)
+                state.update(url, **mark.to_state())
+            return [], "hit"
+        if status is not None and status >= 400:
+            return [], "error"
+        if feed.get("bozo") and status is None and not feed.entries:
+            # Network failure or unparseable response: keep the saved mark and validators
+            return [], "error"
+        fresh = mark.select(_keyed_entries(feed.entries), now)
+        if state:
+            state.update(
+                url, etag=feed.get("etag"), modified=feed.get("modified"), **mark.to_state()
+            )
+        items = [
+            {
                 "title": entry.get("title", "").strip(),
                 "url": link,
                 "date": pub_date,
                 "source_name": source_name,
                 "sport": sport_slug,
-            })
-        return items
+            }
+            for _, pub_date, (entry, link) in fresh
+        ]
+        return items, "miss"
     except Exception:
+        return [], "error"
+
+
+def _entry_published(entry) -> Optional[datetime]:
+    parsed = entry.get("published_parsed")
+    if not parsed:
+        return None
+    try:
+        return datetime(*parsed[:6])
+    except (TypeError, ValueError):
+        return None
+
+
+def _keyed_entries(entries: list) -> Iterator[tuple]:
+    """Yield (guid, lazy publish date, (entry, link)) newest first, for ``FeedMark.select``."""
+    if len(entries) > 1:
+        first, last = _entry_published(entries[0]), _entry_published(entries[-1])
+        if first and last and first < last:  # oldest-first feed
+            entries = list(reversed(entries))
+    for entry in entries:
+        link = _entry_link(entry)
+        if link:
+            yield entry.get("id") or link, lambda e=entry: _entry_published(e), (entry, link)
+
+
+def _entry_link(entry) -> Optional[str]:
+    """Best canonical URL for a feed entry, normalized for de-duplication."""
+    link = entry.get("feedburner_origlink")
+    if not link:
+        for alt in entry.get("links", []):
+            if alt.get("rel") == "canonical" and alt.get("href"):
+                link = alt["href"]
+                break
+    link = link or entry.get("link") or entry.get("href")
+    return normalize_url(link) if link else None
+
+
+def collect_rss_candidates(
+    sources_path: Optional[Path] = None,
+    state: Optional[FeedStateStore] = None,
+) -> List[Dict]:
+    """Poll every feed in sources.yaml in parallel and return de-duplicated candidates.
+
+    Feed validators and high-water marks are persisted in the agent cache
+    directory, so unchanged feeds are skipped and changed ones only yield
+    entries not seen by an earlier run. Dates are returned as ISO strings.
+
+    Pass ``state`` to save it yourself once the candidates are safely
+    recorded; otherwise a store is created and saved before returning.
+    """
+    if sources_path is None:
+        sources_path = Path(__file__).resolve().parents[2] / "agent" / "config" / "sources.yaml"
+
+    with open(sources_path) as f:
+        sources_config = yaml.safe_load(f)
+
+    feeds = [
+        (rss_source, sport_slug)
+        for sport_slug, config in sources_config.items()
+        for rss_source in config.get("rss", [])
+    ]
+    if not feeds:
         return []
 
+    owns_state = state is None
+    state = state or FeedStateStore()
 
-def extract_article_content(url: str) -> Optional[str]:
-    """Fetch URL and extract main article text."""
+    def poll(feed: Tuple[Dict, str]) -> Tuple[List[Dict], str]:
+        rss_source, sport_slug = feed
+        started = time.perf_counter()
+        items, status = _poll_feed(rss_source["url"], rss_source["name"], sport_slug, state)
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.labels("feed_fetch").observe(elapsed)
+        SOURCE_FETCHES.labels(rss_source["name"], status).inc()
+        logger.info(
+            f"  Feed {rss_source['name']}: {status}, {len(items)} entries in {elapsed:.2f}s"
+        )
+        return items, status
+
+    workers = min(len(feeds), _RSS_FETCH_CONCURRENCY)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(poll, feeds))
+    if owns_state:
+        state.save()
+
+    statuses = [status for _, status in results]
+    logger.info(
+        f"  Polled {len(feeds)} feeds: {statuses.count('miss')} changed, "
+        f"{statuses.count('hit')} not modified, {statuses.count('error')} failed"
+    )
+
+    candidates = []
+    seen_urls: set[str] = set()
+    for items, _ in results:
+        for item in items:
+            url = item.get("url", "")
+            if url and url not in seen_urls:
+                seen_urls.add(url)
+                if item.get("date"):
+                    item["date"] = item["date"].isoformat()
+                candidates.append(item)
+    return candidates
+
+
+_FETCH_TIMEOUT = 15.0
+# Upper bound on HTML read per page; extraction keeps 8000 chars of text,
+# which even on markup-heavy pages sits well inside this.
+_MAX_HTML_BYTES = MAX_PARSE_BYTES
+_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+_PER_HOST_CONNECTIONS = int(os.getenv("PIPELINE_PER_HOST_CONCURRENCY", "2"))
+
+
+class _HttpSession:
+    """Pooled keep-alive client plus per-host connection caps for one event loop."""
+
+    def __init__(self, max_connections: int, per_host: int):
+        self.client = httpx.AsyncClient(
+            headers={"User-Agent": _USER_AGENT},
+            timeout=_FETCH_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=30.0,
+            ),
+        )
+        self.per_host = per_host
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+
+    def host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.per_host)
+        return self._hosts[host]
+
+
+# One session per running event loop: httpx connections cannot cross loops,
+# and run_pipeline_sync starts a fresh loop on every scheduled run.
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _HttpSession]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _current_session() -> _HttpSession:
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None:
+        session = _HttpSession(_MAX_CONNECTIONS, _PER_HOST_CONNECTIONS)
+        _sessions[loop] = session
+    return session
+
+
+@asynccontextmanager
+async def http_session(
+    max_connections: Optional[int] = None,
+    per_host: Optional[int] = None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Open the shared pooled client for the current event loop and close it on exit."""
+    loop = asyncio.get_running_loop()
+    previous = _sessions.pop(loop, None)
+    if previous is not None:
+        await previous.client.aclose()
+    session = _HttpSession(
+        max_connections or _MAX_CONNECTIONS,
+        per_host or _PER_HOST_CONNECTIONS,
+    )
+    _sessions[loop] = session
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; SportsNewsBot/1.0)",
-        }
-        resp = requests.get(url, headers=headers, timeout=15)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        # Remove script, style
-        for tag in soup(["script", "style"]):
-            tag.decompose()
-
-        # Prefer article, main, or common content containers
-        for selector in ["article", "main", ".article-body", ".post-content", ".content", "#content"]:
-            el = soup.select_one(selector)
-            if el:
-                text = el.get_text(separator=" ", strip=True)
-                if len(text) > 100:
-                    return _clean_text(text)
-
-        # Fallback: body
-        body = soup.find("body")
-        if body:
-            text = body.get_text(separator=" ", strip=True)
-            return _clean_text(text)
-
-        return _clean_text(soup.get_text())
+        yield session.client
+    finally:
+        if _sessions.get(loop) is session:
+            del _sessions[loop]
+        await session.client.aclose()
+
+
+async def _fetch_html(url: str, max_bytes: int = _MAX_HTML_BYTES) -> str:
+    """Stream a page body, stopping once max_bytes have been read.
+
+    The whole page (up to the cap) is handed to the parser: articles can be
+    nested or preceded by teaser ``<article>`` blocks, so only the parser can
+    tell where the main one ends.
+    """
+    session = _current_session()
+    async with session.host_limit(url):
+        async with session.client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            chunks: list[bytes] = []
+            size = 0
+            async for chunk in resp.aiter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= max_bytes:
+                    break
+            encoding = resp.encoding or "utf-8"
+    return b"".join(chunks)[:max_bytes].decode(encoding, errors="replace")
+
+
+async def aextract_article_content(url: str) -> Optional[str]:
+    """Fetch URL over the shared pooled client and extract main article text."""
+    try:
+        with timed("html_fetch"):
+            html = await _fetch_html(url)
+        # Parsing is CPU-bound; keep it off the event loop.
+        with timed("parse"):
+            return await asyncio.to_thread(extract_text, html)
     except Exception:
         return None
 
 
-def _clean_text(text: str, max_len: int = 8000) -> str:
-    """Clean and truncate text."""
-    text = re.sub(r"\s+", " ", text).strip()
-    if len(text) > max_len:
-        text = text[:max_len] + "..."
-    return text
+def extract_article_content(url: str) -> Optional[str]:
+    """Fetch URL and extract main article text (synchronous wrapper)."""
+    async def _run() -> Optional[str]:
+        async with http_session():
+            return await aextract_article_content(url)
+
+    return asyncio.run(_run())
 
 
 # --- @function_tool wrappers for OpenAI Agents SDK ---
@@ -91,23 +318,4 @@ def fetch_rss_feeds() -> str:
     Returns a JSON string of article candidates with title, url, date,
     source_name, and sport fields.
     """
-    root = Path(__file__).resolve().parents[2]
-    sources_yaml_path = root / "agent" / "config" / "sources.yaml"
-
-    with open(sources_yaml_path) as f:
-        sources_config = yaml.safe_load(f)
-
-    candidates = []
-    seen_urls: set[str] = set()
-    for sport_slug, config in sources_config.items():
-        for rss_source in config.get("rss", []):
-            items = parse_rss_feed(rss_source["url"], rss_source["name"], sport_slug)
-            for item in items:
-                url = item.get("url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    if item.get("date"):
-                        item["date"] = item["date"].isoformat()
-                    candidates.append(item)
-
-    return json.dumps(candidates)
+    return json.dumps(collect_rss_candidates())
@@ -0,0 +1,136 @@
+"""Offline evaluation of the local sport classifier against stored articles.
+
+Re-categorizes a sample of stored articles live with the Categorization
+Agent (``--llm N``, default 50) and reports how often the keyword classifier
+agrees and how many articles would bypass the agent at a given threshold.
+Model calls go through the pipeline's shared rate limiter.
+
+``--stored`` also compares against the sport stored for every article. That
+figure is optimistic: since the classifier was introduced, confident rows
+were labelled by the classifier itself rather than by the agent.
+
+    python agent/evaluate_classifier.py --threshold 0.85 --llm 20
+    python agent/evaluate_classifier.py --llm 0 --stored
+"""
+import argparse
+import asyncio
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Ensure project root and backend are on path
+_root = Path(__file__).resolve().parents[1]
+for _p in (_root, _root / "backend"):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+from dotenv import load_dotenv
+load_dotenv(_root / ".env")
+
+import yaml
+
+from agent.crew.classifier import DEFAULT_THRESHOLD, classify
+from app.database import SessionLocal
+from app.models import Article, Sport
+
+
+def _source_sports() -> dict[str, str]:
+    """Map RSS source name -> configured sport slug."""
+    with open(_root / "agent" / "config" / "sources.yaml") as f:
+        config = yaml.safe_load(f)
+    return {
+        src["name"]: slug
+        for slug, cfg in config.items()
+        for src in cfg.get("rss", [])
+    }
+
+
+def _load_articles(limit: int) -> list[tuple[str, str, str, str]]:
+    db = SessionLocal()
+    try:
+        q = (
+            db.query(Article.headline, Article.summary, Article.source_name, Sport.slug)
+            .join(Sport)
+            .order_by(Article.id.desc())
+        )
+        if limit:
+            q = q.limit(limit)
+        return [tuple(r) for r in q.all()]
+    finally:
+        db.close()
+
+
+async def _llm_labels(rows: list[tuple[str, str, str, str]], sources: dict[str, str]) -> list[str]:
+    from agent.crew.agents import categorization_agent
+    from agent.crew.crew import categorization_prompt
+    from agent.crew.models import SummarizedArticle
+    from agent.crew.ratelimit import install_openai_client, run_limited
+
+    install_openai_client()
+    labels = []
+    for headline, summary, source_name, _ in rows:
+        prompt = categorization_prompt(
+            SummarizedArticle(headline=headline, summary=summary),
+            sources.get(source_name, "unknown"),
+        )
+        result = await run_limited(categorization_agent, prompt)
+        labels.append(result.final_output.sport_slug)
+    return labels
+
+
+def _report(title: str, rows, labels: list[str], sources: dict[str, str], threshold: float) -> None:
+    total = len(rows)
+    if not total:
+        print(f"{title}: no articles")
+        return
+    agree = covered = covered_agree = 0
+    confusion: Counter = Counter()
+    for (headline, summary, source_name, _), label in zip(rows, labels):
+        pred = classify(headline, summary, sources.get(source_name))
+        confusion[(label, pred.sport_slug)] += 1
+        hit = pred.sport_slug == label
+        agree += hit
+        if pred.confidence >= threshold:
+            covered += 1
+            covered_agree += hit
+
+    print(f"{title} ({total} articles, threshold {threshold})")
+    print(f"  agreement (all):           {agree / total:6.1%}")
+    print(f"  bypass coverage:           {covered / total:6.1%}  ({covered} would skip the agent)")
+    if covered:
+        print(f"  agreement (above thresh.): {covered_agree / covered:6.1%}")
+    print("  confusion (reference -> local):")
+    for (ref, pred), n in sorted(confusion.items()):
+        print(f"    {ref:>8} -> {pred:<8} {n}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--limit", type=int, default=0, help="Most recent N articles (0 = all)")
+    parser.add_argument("--llm", type=int, default=50, help="Re-categorize N articles with the agent")
+    parser.add_argument(
+        "--stored", action="store_true",
+        help="Also compare with stored labels (optimistic: includes classifier-labelled rows)",
+    )
+    args = parser.parse_args()
+
+    sources = _source_sports()
+    rows = _load_articles(args.limit)
+
+    if args.llm:
+        sample = rows[: args.llm]
+        labels = asyncio.run(_llm_labels(sample, sources))
+        _report("Live agent labels", sample, labels, sources, args.threshold)
+
+    if args.stored:
+        if args.llm:
+            print()
+        _report(
+            "Stored labels (includes rows the classifier labelled itself)",
+            rows, [r[3] for r in rows], sources, args.threshold,
+        )
+
+
+if __name__ == "__main__":
+    main()
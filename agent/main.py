@@ -1,13 +1,18 @@
-"""Entry point for agent pipeline."""
-import asyncio
+"""Entry point for a manual pipeline run.
+
+Queues a run and executes it through the worker (``app.worker --once
+--enqueue manual``), so it holds the pipeline lease and is recorded in
+``pipeline_runs`` like any other run.
+"""
 import logging
 import sys
 from pathlib import Path
 
 # Ensure project root is on path
 _root = Path(__file__).resolve().parents[1]
-if str(_root) not in sys.path:
-    sys.path.insert(0, str(_root))
+for path in (_root, _root / "backend"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
 
 from dotenv import load_dotenv
 load_dotenv(_root / ".env")
@@ -19,9 +24,18 @@ logging.basicConfig(
     datefmt="%H:%M:%S",
 )
 
-from agent.crew.crew import run_pipeline
+from app.database import SessionLocal, init_db
+from app.models import PipelineRun
+from app.worker import run_pending
 
 
 if __name__ == "__main__":
-    saved = asyncio.run(run_pipeline())
-    print(f"\nPipeline complete. Saved {saved} new articles.")
+    init_db()
+    if not run_pending(trigger="manual"):
+        sys.exit("Another worker holds the pipeline lease; not starting a run.")
+    db = SessionLocal()
+    try:
+        run = db.query(PipelineRun).order_by(PipelineRun.id.desc()).first()
+        print(f"\nPipeline run {run.id} {run.status}. Saved {run.saved} new articles.")
+    finally:
+        db.close()
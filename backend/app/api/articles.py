@@ -1,40 +1,256 @@
 """Articles API endpoints."""
+import base64
+import json
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from app.database import get_db
+from app.api.deps import Reader, get_reader
+from app.encoding import dumps
 from app.models import Article, Sport
-from app.schemas import ArticleWithSport
+from app.schemas import ArticleDetail, ArticleListPage, ArticlePage
+from app.search import search_articles
 
 router = APIRouter(prefix="/api", tags=["articles"])
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
 
-@router.get("/articles", response_model=List[ArticleWithSport])
-def list_articles(
-    db: Session = Depends(get_db),
+# Columns a ``fields=`` projection may select, by ArticleListItem field name
+PROJECTABLE = {
+    "id": Article.id,
+    "headline": Article.headline,
+    "summary": Article.summary,
+    "source_url": Article.source_url,
+    "source_name": Article.source_name,
+    "published_at": Article.published_at,
+    "created_at": Article.created_at,
+    "updated_at": Article.updated_at,
+    "sport_id": Article.sport_id,
+    "sport_slug": Sport.slug,
+    "sport_name": Sport.name,
+}
+# ``fields=compact``: what a list view renders
+COMPACT_FIELDS = ("id", "headline", "source_name", "source_url", "published_at", "sport_slug")
+
+_LISTING_ORDER = (
+    Article.published_at.desc().nullslast(),
+    Article.created_at.desc(),
+    Article.id.desc(),
+)
+
+
+def encode_cursor(article: Article) -> str:
+    """Opaque cursor pointing just past ``article`` in listing order."""
+    return _encode_key(article.published_at, article.created_at, article.id)
+
+
+def _encode_key(
+    published: Optional[datetime], created: Optional[datetime], article_id: int
+) -> str:
+    key = [
+        published.isoformat() if published else None,
+        created.isoformat() if created else None,
+        article_id,
+    ]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Optional[datetime], datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        published, created, article_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (
+            datetime.fromisoformat(published) if published else None,
+            datetime.fromisoformat(created),
+            int(article_id),
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def after_cursor(published: Optional[datetime], created: datetime, article_id: int):
+    """Keyset predicate for rows after the cursor in
+    (published_at DESC NULLS LAST, created_at DESC, id DESC) order."""
+    tie = or_(
+        Article.created_at < created,
+        and_(Article.created_at == created, Article.id < article_id),
+    )
+    if published is None:
+        return and_(Article.published_at.is_(None), tie)
+    return or_(
+        Article.published_at < published,
+        and_(Article.published_at == published, tie),
+        Article.published_at.is_(None),
+    )
+
+
+def parse_fields(fields: Optional[str]) -> Optional[tuple[str, ...]]:
+    """Validate a ``fields=`` value: ``compact`` or a comma-separated list of names."""
+    if not fields:
+        return None
+    if fields == "compact":
+        return COMPACT_FIELDS
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in PROJECTABLE]
+    if unknown or not names:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields {unknown}; choose from {sorted(PROJECTABLE)} or 'compact'",
+        )
+    return names
+
+
+@router.get("/articles", response_model=Union[ArticlePage, ArticleListPage])
+async def list_articles(
+    request: Request,
+    reader: Reader = Depends(get_reader),
     sport: Optional[str] = Query(None, description="Filter by sport slug"),
     from_date: Optional[date] = Query(None, alias="from"),
     to_date: Optional[date] = Query(None, alias="to"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(
+        None, description="'compact' or comma-separated ArticleListItem fields to return"
+    ),
 ):
-    """List articles with optional filters."""
-    q = db.query(Article).options(joinedload(Article.sport)).join(Sport)
+    """List articles with optional filters, newest first, one keyset page at a time.
+
+    With ``fields``, items are flat ``ArticleListItem`` rows holding only
+    those columns. Responses are cached until new articles are stored and
+    carry an ETag for conditional requests.
+    """
+    projection = parse_fields(fields)
+    if projection:
+        return await reader.respond(
+            request,
+            lambda db: _projected_page(db, projection, sport, from_date, to_date, limit, cursor),
+        )
+    return await reader.respond(
+        request, lambda db: _article_page(db, sport, from_date, to_date, limit, cursor)
+    )
+
+
+def _listing_filters(
+    sport: Optional[str],
+    from_date: Optional[date],
+    to_date: Optional[date],
+    cursor: Optional[str],
+) -> list:
+    conditions = []
     if sport:
-        q = q.filter(Sport.slug == sport)
+        sport_id = select(Sport.id).where(Sport.slug == sport).scalar_subquery()
+        conditions.append(Article.sport_id == sport_id)
     if from_date:
-        q = q.filter(Article.published_at >= from_date)
+        conditions.append(Article.published_at >= from_date)
     if to_date:
         end_of_day = datetime.combine(to_date, datetime.max.time())
-        q = q.filter(Article.published_at <= end_of_day)
-    return q.order_by(Article.published_at.desc().nullslast(), Article.created_at.desc()).all()
+        conditions.append(Article.published_at <= end_of_day)
+    if cursor:
+        conditions.append(after_cursor(*decode_cursor(cursor)))
+    return conditions
+
+
+def _article_page(
+    db: Session,
+    sport: Optional[str],
+    from_date: Optional[date],
+    to_date: Optional[date],
+    limit: int,
+    cursor: Optional[str],
+) -> ArticlePage:
+    rows = (
+        db.query(Article)
+        .options(joinedload(Article.sport))
+        .filter(*_listing_filters(sport, from_date, to_date, cursor))
+        .order_by(*_LISTING_ORDER)
+        .limit(limit + 1)
+        .all()
+    )
+    items = rows[:limit]
+    next_cursor = encode_cursor(items[-1]) if len(rows) > limit else None
+    return ArticlePage(items=items, next_cursor=next_cursor)
+
+
+def _projected_page(
+    db: Session,
+    fields: tuple[str, ...],
+    sport: Optional[str],
+    from_date: Optional[date],
+    to_date: Optional[date],
+    limit: int,
+    cursor: Optional[str],
+) -> bytes:
+    """Encoded ``ArticleListPage`` selecting only ``fields`` (plus the keyset
+    columns), from plain rows with no ORM objects or model validation."""
+    stmt = select(
+        Article.published_at.label("_published"),
+        Article.created_at.label("_created"),
+        Article.id.label("_id"),
+        *(PROJECTABLE[name].label(name) for name in fields),
+    )
+    if "sport_slug" in fields or "sport_name" in fields:
+        stmt = stmt.join(Sport, Sport.id == Article.sport_id)
+    stmt = (
+        stmt.where(*_listing_filters(sport, from_date, to_date, cursor))
+        .order_by(*_LISTING_ORDER)
+        .limit(limit + 1)
+    )
+    rows = db.execute(stmt).all()
+    items = [dict(zip(fields, row[3:])) for row in rows[:limit]]
+    next_cursor = _encode_key(*rows[limit - 1][:3]) if len(rows) > limit else None
+    return dumps({"items": items, "next_cursor": next_cursor})
+
+
+def _encode_offset(offset: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset}).encode()).decode().rstrip("=")
+
+
+def _decode_offset(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return max(0, int(json.loads(base64.urlsafe_b64decode(padded))["offset"]))
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.get("/articles/search", response_model=ArticlePage)
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200, description="Keywords to search for"),
+    reader: Reader = Depends(get_reader),
+    sport: Optional[str] = Query(None, description="Filter by sport slug"),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+):
+    """Full-text search over headlines and summaries, ranked by relevance."""
+    offset = _decode_offset(cursor) if cursor else 0
+
+    def build(db: Session) -> ArticlePage:
+        rows = search_articles(db, q, sport=sport, limit=limit + 1, offset=offset)
+        next_cursor = _encode_offset(offset + limit) if len(rows) > limit else None
+        return ArticlePage(items=rows[:limit], next_cursor=next_cursor)
+
+    return await reader.respond(request, build)
+
+
+def _article_detail(db: Session, article_id: int) -> Optional[ArticleDetail]:
+    article = (
+        db.query(Article)
+        .options(joinedload(Article.sport), selectinload(Article.alternate_sources))
+        .filter(Article.id == article_id)
+        .first()
+    )
+    return ArticleDetail.model_validate(article) if article else None
 
 
-@router.get("/articles/{article_id}", response_model=ArticleWithSport)
-def get_article(article_id: int, db: Session = Depends(get_db)):
-    """Get single article by ID."""
-    article = db.query(Article).options(joinedload(Article.sport)).filter(Article.id == article_id).first()
+@router.get("/articles/{article_id}", response_model=ArticleDetail)
+async def get_article(article_id: int, reader: Reader = Depends(get_reader)):
+    """Get single article by ID, with other sources that carried the same story."""
+    article = await reader.run(lambda db: _article_detail(db, article_id))
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     return article
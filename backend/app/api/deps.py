@@ -0,0 +1,61 @@
+"""Database access for the read routes, in either the sync or async mode.
+
+Each read route is defined once, as an ``async def`` handler whose queries
+are plain functions of a sync ``Session``. The ``Reader`` it receives runs
+them on the configured path: in the threadpool on a ``SessionLocal``
+session, or with ``DB_ASYNC=1`` through ``AsyncSession.run_sync`` on the
+async driver without holding a threadpool thread.
+"""
+from typing import Any, AsyncIterator, Callable, Protocol, TypeVar
+
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.cache import response_cache
+from app.database import ASYNC_ENABLED, SessionLocal, get_async_db
+
+T = TypeVar("T")
+
+
+class Reader(Protocol):
+    async def run(self, fn: Callable[[Session], T]) -> T: ...
+
+    async def respond(self, request: Request, build: Callable[[Session], Any]) -> Response: ...
+
+
+class SyncReader:
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        return await run_in_threadpool(fn, self.db)
+
+    async def respond(self, request: Request, build: Callable[[Session], Any]) -> Response:
+        return await run_in_threadpool(
+            response_cache.respond, request, self.db, lambda: build(self.db)
+        )
+
+
+class AsyncReader:
+    def __init__(self, db):
+        self.db = db
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        return await self.db.run_sync(fn)
+
+    async def respond(self, request: Request, build: Callable[[Session], Any]) -> Response:
+        return await response_cache.respond_async(request, self.db, build)
+
+
+async def get_reader() -> AsyncIterator[Reader]:
+    """Dependency yielding a ``Reader`` for the configured database path."""
+    if ASYNC_ENABLED:
+        async for db in get_async_db():
+            yield AsyncReader(db)
+        return
+    db = SessionLocal()
+    try:
+        yield SyncReader(db)
+    finally:
+        db.close()
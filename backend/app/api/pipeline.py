@@ -0,0 +1,62 @@
+"""Pipeline run endpoints: trigger a run and inspect past runs."""
+import hmac
+import os
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models import PipelineRun
+from app.scheduler import launch_worker, scheduler_enabled
+from app.schemas import PipelineRunResponse
+from app.worker import enqueue_run
+
+router = APIRouter(prefix="/api/pipeline", tags=["pipeline"])
+
+_TRIGGER_TOKEN = os.getenv("PIPELINE_TRIGGER_TOKEN")
+
+
+@router.get("/runs", response_model=List[PipelineRunResponse])
+def list_runs(
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """List pipeline runs, newest first."""
+    return db.query(PipelineRun).order_by(PipelineRun.id.desc()).limit(limit).all()
+
+
+@router.get("/runs/{run_id}", response_model=PipelineRunResponse)
+def get_run(run_id: int, db: Session = Depends(get_db)):
+    """Get a single pipeline run."""
+    run = db.query(PipelineRun).filter(PipelineRun.id == run_id).first()
+    if not run:
+        raise HTTPException(status_code=404, detail="Pipeline run not found")
+    return run
+
+
+@router.post("/runs", response_model=PipelineRunResponse, status_code=202)
+def trigger_run(
+    response: Response,
+    db: Session = Depends(get_db),
+    x_pipeline_token: Optional[str] = Header(None),
+):
+    """Queue a pipeline run; returns the already-queued run if there is one.
+
+    Requires the ``X-Pipeline-Token`` header to match ``PIPELINE_TRIGGER_TOKEN``;
+    triggering is disabled while that is unset, since every run costs model calls.
+    """
+    if not _TRIGGER_TOKEN:
+        raise HTTPException(
+            status_code=503,
+            detail="Pipeline triggering is disabled: PIPELINE_TRIGGER_TOKEN is not set",
+        )
+    if not hmac.compare_digest((x_pipeline_token or "").encode(), _TRIGGER_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Invalid pipeline token")
+    run, created = enqueue_run(db, "api")
+    if not created:
+        response.status_code = 200
+    elif scheduler_enabled():
+        # No dedicated worker service; start one for this run
+        launch_worker()
+    return run
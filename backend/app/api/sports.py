@@ -1,10 +1,9 @@
 """Sports API endpoints."""
 from typing import List
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request
 
-from app.database import get_db
+from app.api.deps import Reader, get_reader
 from app.models import Sport
 from app.schemas import SportResponse
 
@@ -12,6 +11,9 @@ router = APIRouter(prefix="/api", tags=["sports"])
 
 
 @router.get("/sports", response_model=List[SportResponse])
-def list_sports(db: Session = Depends(get_db)):
-    """List all available sports."""
-    return db.query(Sport).order_by(Sport.id).all()
+async def list_sports(request: Request, reader: Reader = Depends(get_reader)):
+    """List all available sports (cached, with ETag)."""
+    return await reader.respond(
+        request,
+        lambda db: [SportResponse.model_validate(s) for s in db.query(Sport).order_by(Sport.id)],
+    )
@@ -0,0 +1,79 @@
+"""Server-Sent Events stream of newly stored articles."""
+import asyncio
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+
+from app.metrics import STREAM_CONNECTIONS
+from app.stream import ArticleEvent, broadcaster
+
+router = APIRouter(prefix="/api", tags=["articles"])
+
+_HEARTBEAT_SECONDS = float(os.getenv("STREAM_HEARTBEAT_SECONDS", "15"))
+_RETRY_MS = 5000
+
+
+def _format(event: ArticleEvent) -> str:
+    return f"id: {event.id}\nevent: article\ndata: {event.data}\n\n"
+
+
+def _parse_event_id(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+@router.get("/articles/stream")
+async def stream_articles(
+    sport: Optional[str] = Query(None, description="Only push articles for this sport slug"),
+    last_event_id: Optional[str] = Header(None),
+):
+    """Push new articles (``ArticleWithSport``) as ``article`` events as they are stored.
+
+    Each event id is the article id. Reconnecting with ``Last-Event-ID``
+    first replays the articles stored since; if too many were missed, a
+    ``reset`` event tells the client to reload the list instead.
+    """
+    resume_after = _parse_event_id(last_event_id)
+
+    async def events():
+        # Subscribe here, not in the handler: a response that is never iterated
+        # (client gone before the first send) then holds no subscription.
+        STREAM_CONNECTIONS.inc()
+        subscription = None
+        try:
+            subscription = await broadcaster.subscribe(sport)
+            yield f"retry: {_RETRY_MS}\n\n"
+            sent = 0
+            if resume_after is not None:
+                backlog, truncated = await broadcaster.backfill(resume_after, sport)
+                if truncated:
+                    yield "event: reset\ndata: {}\n\n"
+                    backlog = []
+                for event in backlog:
+                    yield _format(event)
+                sent = backlog[-1].id if backlog else resume_after
+            while not subscription.overflowed:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(), timeout=_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if event.id > sent:
+                    sent = event.id
+                    yield _format(event)
+        finally:
+            if subscription is not None:
+                broadcaster.unsubscribe(subscription)
+            STREAM_CONNECTIONS.dec()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,182 @@
+"""HTTP response cache with ETag revalidation, invalidated by the data version."""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from app.persistence import get_data_version
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+_MAX_AGE = int(os.getenv("API_CACHE_MAX_AGE", "60"))
+_MAX_ENTRIES = int(os.getenv("API_CACHE_MAX_ENTRIES", "512"))
+_VERSION_CHECK_INTERVAL = float(os.getenv("API_CACHE_VERSION_INTERVAL", "1.0"))
+
+
+class CacheBackend(Protocol):
+    """Storage for serialized response bodies.
+
+    ``blocking`` backends do network I/O; async routes call them in a thread.
+    """
+
+    blocking: bool
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes) -> None: ...
+
+
+class MemoryBackend:
+    """Per-process LRU of response bodies."""
+
+    blocking = False
+
+    def __init__(self, max_entries: int = _MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+
+class RedisBackend:
+    """Shared backend for multiple API workers (requires the ``redis`` package)."""
+
+    blocking = True
+
+    def __init__(self, url: str, ttl: int = 3600):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(f"api-cache:{key}")
+
+    def set(self, key: str, value: bytes) -> None:
+        self._client.set(f"api-cache:{key}", value, ex=self.ttl)
+
+
+class ResponseCache:
+    """Caches JSON responses per route and query string.
+
+    Entries are keyed on the data version, which the persistence layer bumps
+    whenever it inserts articles, so new data invalidates every entry at
+    once. The version is re-read from the database at most once per
+    ``version_check_interval`` seconds. ETags are derived from the version
+    and key, so a matching ``If-None-Match`` is answered with 304 before any
+    query or serialization runs.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        max_age: int = _MAX_AGE,
+        version_check_interval: float = _VERSION_CHECK_INTERVAL,
+    ):
+        self.backend = backend
+        self.max_age = max_age
+        self.version_check_interval = version_check_interval
+        self._version = 0
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def data_version(self, db: Session) -> int:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < self.version_check_interval:
+                return self._version
+        version = get_data_version(db)
+        with self._lock:
+            self._version, self._checked_at = version, now
+        return version
+
+    def invalidate(self) -> None:
+        """Force the next request to re-read the data version."""
+        with self._lock:
+            self._checked_at = float("-inf")
+
+    def respond(self, request: Request, db: Session, build: Callable[[], Any]) -> Response:
+        """Serve ``build()`` as JSON through the cache, honouring If-None-Match.
+
+        ``build`` may return an already encoded JSON body as ``bytes``.
+        """
+        key, headers = self._key(request, self.data_version(db))
+        if key is None:
+            return Response(status_code=304, headers=headers)
+        body = self.backend.get(key)
+        if body is None:
+            body = self._serialize(build())
+            self.backend.set(key, body)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    async def respond_async(
+        self, request: Request, db: "AsyncSession", build: Callable[[Session], Any]
+    ) -> Response:
+        """``respond`` for async routes: ``build`` receives a sync view of ``db``."""
+        key, headers = self._key(request, await db.run_sync(self.data_version))
+        if key is None:
+            return Response(status_code=304, headers=headers)
+        body = await self._call_backend(self.backend.get, key)
+        if body is None:
+            body = self._serialize(await db.run_sync(build))
+            await self._call_backend(self.backend.set, key, body)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    async def _call_backend(self, method: Callable[..., Any], *args: Any) -> Any:
+        """Run a backend call without blocking the event loop on network I/O."""
+        if getattr(self.backend, "blocking", True):
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    def _key(self, request: Request, version: int) -> tuple[Optional[str], dict]:
+        """Cache key and response headers; the key is None when If-None-Match matches."""
+        query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+        route_key = f"{request.url.path}?{query}"
+        digest = hashlib.sha1(route_key.encode()).hexdigest()[:16]
+        etag = f'"{version}-{digest}"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={self.max_age}",
+        }
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return None, headers
+        return f"{version}:{route_key}", headers
+
+    @staticmethod
+    def _serialize(payload: Any) -> bytes:
+        if isinstance(payload, bytes):
+            return payload
+        return json.dumps(jsonable_encoder(payload), separators=(",", ":")).encode()
+
+
+def _default_backend() -> CacheBackend:
+    redis_url = os.getenv("API_CACHE_REDIS_URL")
+    if redis_url:
+        return RedisBackend(redis_url)
+    return MemoryBackend()
+
+
+response_cache = ResponseCache(_default_backend())
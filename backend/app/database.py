@@ -1,8 +1,16 @@
-"""Database connection and session management."""
+"""Database connection and session management.
+
+The API and pipeline share one synchronous engine. Setting ``DB_ASYNC=1``
+additionally builds an async engine on the same database (``aiosqlite``
+for SQLite, ``asyncpg`` for Postgres) which the API's read routes use, so
+requests wait on the database without holding a threadpool thread.
+"""
 from pathlib import Path
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 # Load .env from project root
@@ -14,12 +22,83 @@ import os
 _db_path = (_root / "sports_news.db").resolve()
 _default_db = f"sqlite:///{_db_path}"
 DATABASE_URL = os.getenv("DATABASE_URL", _default_db)
-connect_args = {"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+IS_SQLITE = make_url(DATABASE_URL).get_backend_name() == "sqlite"
+ASYNC_ENABLED = os.getenv("DB_ASYNC", "0") == "1"
+
+# SQLite: WAL lets API reads proceed while the pipeline writes; writers wait
+# up to the busy timeout for the lock instead of failing immediately.
+_SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+_SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+_SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+# Connection pool (server databases only)
+_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+connect_args = {"check_same_thread": False} if IS_SQLITE else {}
+
 
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
+def _engine_options() -> dict:
+    if IS_SQLITE:
+        return {}
+    return {
+        "pool_size": _POOL_SIZE,
+        "max_overflow": _MAX_OVERFLOW,
+        "pool_timeout": _POOL_TIMEOUT,
+        "pool_recycle": _POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout = {_SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA journal_mode = {_SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous = {_SQLITE_SYNCHRONOUS}")
+    finally:
+        cursor.close()
+
+
+def _configure(sync_engine: Engine) -> None:
+    if IS_SQLITE:
+        event.listen(sync_engine, "connect", _apply_sqlite_pragmas)
+
+
+engine = create_engine(DATABASE_URL, connect_args=connect_args, **_engine_options())
+_configure(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+_async_engine = None
+_async_sessionmaker = None
+
+
+def async_database_url(url: str = DATABASE_URL) -> str:
+    """``url`` with its driver swapped for the asyncio equivalent."""
+    parsed = make_url(url)
+    drivers = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+    backend = parsed.get_backend_name()
+    if backend not in drivers:
+        raise ValueError(f"No async driver configured for {backend}")
+    return parsed.set(drivername=drivers[backend]).render_as_string(hide_password=False)
+
+
+def get_async_engine():
+    """The shared async engine, created on first use (requires aiosqlite or asyncpg)."""
+    global _async_engine, _async_sessionmaker
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        _async_engine = create_async_engine(async_database_url(), **_engine_options())
+        _configure(_async_engine.sync_engine)
+        _async_sessionmaker = async_sessionmaker(
+            _async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_engine
+
 
 def get_db():
     """Dependency that yields a database session."""
@@ -30,7 +109,44 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Dependency that yields an ``AsyncSession``."""
+    get_async_engine()
+    async with _async_sessionmaker() as db:
+        yield db
+
+
+SCHEMA_FINGERPRINT_KEY = "schema_fingerprint"
+
+
 def init_db():
-    """Initialize database tables."""
-    from app.models import Base as ModelsBase
+    """Initialize database tables, apply pending migrations and record the schema fingerprint."""
+    from app.migrations import run_migrations, schema_fingerprint
+    from app.models import AppState, Base as ModelsBase
     ModelsBase.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    db = SessionLocal()
+    try:
+        db.merge(AppState(
+            key=SCHEMA_FINGERPRINT_KEY, value=schema_fingerprint(ModelsBase.metadata)
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def schema_is_current() -> bool:
+    """Whether ``init_db`` already brought the database up to the current models."""
+    from app.migrations import schema_fingerprint
+    from app.models import AppState, Base as ModelsBase
+    db = SessionLocal()
+    try:
+        stored = db.execute(
+            select(AppState.value).where(AppState.key == SCHEMA_FINGERPRINT_KEY)
+        ).scalar_one_or_none()
+    except SQLAlchemyError:
+        # No app_state table yet: a fresh database
+        return False
+    finally:
+        db.close()
+    return stored == schema_fingerprint(ModelsBase.metadata)
@@ -1,12 +1,13 @@
 """FastAPI application entry point."""
 import logging
 import os
+import time
 from pathlib import Path
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 # Load .env from project root
 _root = Path(__file__).resolve().parents[2]
@@ -18,9 +19,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-from app.database import get_db, init_db
+from app.database import get_db, init_db, schema_is_current
+from app.metrics import REQUEST_SECONDS, render
 from app.seed import seed_sports
 from app.scheduler import start_scheduler
+from app.stream import broadcaster
+
+# API-only processes serve HTTP alone: no scheduler, and no schema work when it is current
+API_ONLY = os.getenv("API_ONLY") == "1"
 
 app = FastAPI(title="Sports News API", version="0.1.0")
 
@@ -42,6 +48,31 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Observe request latency labelled by route template, not raw path."""
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        REQUEST_SECONDS.labels(
+            request.method,
+            getattr(route, "path", "unmatched"),
+            str(status),
+        ).observe(time.perf_counter() - started)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus metrics for the API and, in multiprocess mode, the pipeline worker."""
+    body, content_type = render()
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/health")
 def health_check():
     """Health check endpoint."""
@@ -50,23 +81,42 @@ def health_check():
 
 @app.on_event("startup")
 def startup():
-    """Initialize database, seed sports, and start scheduler."""
+    """Initialize database, seed sports, and start scheduler.
+
+    With ``API_ONLY=1`` the scheduler is not started, and schema creation
+    and seeding are skipped when the database already matches the models.
+    """
     if os.getenv("TESTING"):
         return
     logger.info("Starting up...")
-    init_db()
-    db = next(get_db())
-    try:
-        seed_sports(db)
-        db.commit()
-    finally:
-        db.close()
+    if API_ONLY and schema_is_current():
+        logger.info("Schema is current; skipping initialization")
+    else:
+        init_db()
+        db = next(get_db())
+        try:
+            seed_sports(db)
+            db.commit()
+        finally:
+            db.close()
     start_scheduler()
     logger.info("Startup complete")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop the article stream poller."""
+    await broadcaster.stop()
+
+
 from app.api.sports import router as sports_router
 from app.api.articles import router as articles_router
+from app.api.pipeline import router as pipeline_router
+from app.api.stream import router as stream_router
+
+# Before the article routers, whose /articles/{article_id} would shadow it
+app.include_router(stream_router)
 
 app.include_router(sports_router)
 app.include_router(articles_router)
+app.include_router(pipeline_router)
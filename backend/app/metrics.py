@@ -0,0 +1,40 @@
+"""Prometheus metrics for the API and the /metrics exposition."""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+
+REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "API request latency, by route template",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+STREAM_CONNECTIONS = Gauge(
+    "article_stream_connections",
+    "Open /api/articles/stream connections",
+    multiprocess_mode="livesum",
+)
+
+
+def render() -> tuple[bytes, str]:
+    """Serialize all metrics; with PROMETHEUS_MULTIPROC_DIR, across every process.
+
+    Multiprocess mode aggregates the API workers and the pipeline worker
+    (which writes its metrics into the same directory).
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
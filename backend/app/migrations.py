@@ -0,0 +1,110 @@
+"""Idempotent, additive schema migrations for databases created by older versions."""
+import logging
+import zlib
+
+from sqlalchemy import MetaData, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+# Article listing sort: published_at DESC NULLS LAST, created_at DESC, id DESC.
+# SQLite already sorts NULLs last under DESC and rejects NULLS LAST in index
+# definitions; Postgres needs it spelled out for the index to serve the sort.
+_LISTING_ORDER = {
+    "postgresql": "published_at DESC NULLS LAST, created_at DESC, id DESC",
+}
+_DEFAULT_LISTING_ORDER = "published_at DESC, created_at DESC, id DESC"
+
+# (index name, leading equality columns) for the listing and sport-filtered listing.
+_LISTING_INDEXES = (
+    ("ix_articles_listing", ""),
+    ("ix_articles_sport_listing", "sport_id, "),
+)
+
+
+def _add_listing_indexes(engine: Engine) -> None:
+    """Composite indexes matching /api/articles ordering and its sport/date filters."""
+    order = _LISTING_ORDER.get(engine.dialect.name, _DEFAULT_LISTING_ORDER)
+    with engine.begin() as conn:
+        for name, prefix in _LISTING_INDEXES:
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON articles ({prefix}{order})"))
+
+
+_SQLITE_FTS = (
+    "CREATE VIRTUAL TABLE articles_fts USING fts5("
+    " headline, summary, content='articles', content_rowid='id',"
+    " tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN"
+    " INSERT INTO articles_fts(rowid, headline, summary)"
+    " VALUES (new.id, new.headline, new.summary); END",
+    "CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN"
+    " INSERT INTO articles_fts(articles_fts, rowid, headline, summary)"
+    " VALUES ('delete', old.id, old.headline, old.summary); END",
+    "CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE OF headline, summary ON articles BEGIN"
+    " INSERT INTO articles_fts(articles_fts, rowid, headline, summary)"
+    " VALUES ('delete', old.id, old.headline, old.summary);"
+    " INSERT INTO articles_fts(rowid, headline, summary)"
+    " VALUES (new.id, new.headline, new.summary); END",
+)
+
+# Must match the expression used by app.search so Postgres can use the index.
+PG_SEARCH_VECTOR = "to_tsvector('english', coalesce(headline, '') || ' ' || coalesce(summary, ''))"
+
+
+def has_sqlite_fts(conn) -> bool:
+    """Whether the ``articles_fts`` table exists on this SQLite connection or session."""
+    return conn.execute(text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+    )).first() is not None
+
+
+def _add_fulltext_index(engine: Engine) -> None:
+    """Full-text index over headline and summary, kept in sync on insert.
+
+    SQLite: an external-content FTS5 table maintained by triggers (backfilled
+    once when created). Postgres: a GIN expression index, which the database
+    maintains itself. SQLite builds without FTS5 get no index; search then
+    falls back to substring matching.
+    """
+    if engine.dialect.name == "sqlite":
+        try:
+            with engine.begin() as conn:
+                if not has_sqlite_fts(conn):
+                    conn.execute(text(_SQLITE_FTS[0]))
+                    conn.execute(text("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')"))
+                    logger.info("Created articles_fts full-text index")
+                for statement in _SQLITE_FTS[1:]:
+                    conn.execute(text(statement))
+        except OperationalError as exc:
+            logger.warning("SQLite FTS5 unavailable, skipping full-text index: %s", exc)
+    elif engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_articles_fts ON articles USING GIN ({PG_SEARCH_VECTOR})"
+            ))
+
+
+def schema_fingerprint(metadata: MetaData) -> int:
+    """Checksum of the model tables and the migrations; changes with either.
+
+    Kept to 31 bits so it fits the ``app_state`` integer column on Postgres.
+    """
+    tables = [
+        (
+            table.name,
+            sorted((c.name, str(c.type)) for c in table.columns),
+            sorted(index.name for index in table.indexes),
+        )
+        for table in sorted(metadata.tables.values(), key=lambda t: t.name)
+    ]
+    migrations = (
+        _LISTING_ORDER, _DEFAULT_LISTING_ORDER, _LISTING_INDEXES, _SQLITE_FTS, PG_SEARCH_VECTOR
+    )
+    return zlib.crc32(repr((tables, migrations)).encode()) & 0x7FFFFFFF
+
+
+def run_migrations(engine: Engine) -> None:
+    """Bring an existing schema up to date; safe to run on every startup."""
+    _add_listing_indexes(engine)
+    _add_fulltext_index(engine)
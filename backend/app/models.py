@@ -1,7 +1,16 @@
 """SQLAlchemy models for sports and articles."""
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -37,3 +46,91 @@ class Article(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     sport = relationship("Sport", back_populates="articles")
+    alternate_sources = relationship(
+        "ArticleSource", back_populates="article", order_by="ArticleSource.id"
+    )
+
+
+class ArticleSource(Base):
+    """Another URL that carried the same story as an article (near-duplicate)."""
+
+    __tablename__ = "article_sources"
+    __table_args__ = (UniqueConstraint("source_url", name="uq_article_source_alt_url"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, index=True)
+    source_url = Column(String(2000), nullable=False)
+    source_name = Column(String(200), nullable=False)
+    published_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    article = relationship("Article", back_populates="alternate_sources")
+
+
+class ArticleSignature(Base):
+    """64-bit SimHash of an article's text, split into four 16-bit lookup bands."""
+
+    __tablename__ = "article_signatures"
+
+    article_id = Column(Integer, ForeignKey("articles.id"), primary_key=True)
+    simhash = Column(BigInteger, nullable=False)
+    band0 = Column(Integer, nullable=False, index=True)
+    band1 = Column(Integer, nullable=False, index=True)
+    band2 = Column(Integer, nullable=False, index=True)
+    band3 = Column(Integer, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+
+class AppState(Base):
+    """Small key/value counters shared between the pipeline and the API."""
+
+    __tablename__ = "app_state"
+
+    key = Column(String(50), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+
+class PipelineCheckpoint(Base):
+    """Per-candidate stage state for an in-progress pipeline run."""
+
+    __tablename__ = "pipeline_checkpoints"
+    __table_args__ = (UniqueConstraint("run_id", "url", name="uq_checkpoint_run_url"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    run_id = Column(String(36), nullable=False, index=True)
+    url = Column(String(2000), nullable=False)
+    stage = Column(String(20), nullable=False, default="pending")
+    candidate = Column(Text, nullable=False)
+    result = Column(Text, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class PipelineRun(Base):
+    """One pipeline execution, from request through completion."""
+
+    __tablename__ = "pipeline_runs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    status = Column(String(20), nullable=False, default="queued", index=True)
+    trigger = Column(String(20), nullable=False, default="schedule")
+    worker = Column(String(200), nullable=True)
+    requested_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    discovered = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    saved = Column(Integer, nullable=False, default=0)
+    skipped = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    llm_calls = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+
+
+class Lease(Base):
+    """Named, expiring lock held by one worker at a time."""
+
+    __tablename__ = "leases"
+
+    name = Column(String(50), primary_key=True)
+    owner = Column(String(200), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
@@ -0,0 +1,125 @@
+"""Bulk, idempotent article persistence shared by the pipeline and importers."""
+import logging
+from typing import Iterable
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import AppState, Article, Sport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+
+DATA_VERSION_KEY = "data_version"
+
+_ARTICLE_FIELDS = ("sport_id", "headline", "summary", "source_url", "source_name", "published_at")
+
+
+def sport_ids(db: Session) -> dict[str, int]:
+    """Map sport slug -> id."""
+    return {slug: sport_id for sport_id, slug in db.query(Sport.id, Sport.slug).all()}
+
+
+def get_data_version(db: Session) -> int:
+    """Counter bumped whenever articles are inserted; used for cache invalidation."""
+    value = db.execute(
+        select(AppState.value).where(AppState.key == DATA_VERSION_KEY)
+    ).scalar_one_or_none()
+    return value or 0
+
+
+def bump_data_version(db: Session) -> None:
+    """Increment the data version inside the caller's transaction."""
+    result = db.execute(
+        update(AppState)
+        .where(AppState.key == DATA_VERSION_KEY)
+        .values(value=AppState.value + 1)
+    )
+    if result.rowcount == 0:
+        db.add(AppState(key=DATA_VERSION_KEY, value=1))
+        db.flush()
+
+
+def _prepare(db: Session, rows: Iterable[dict]) -> list[dict]:
+    """Resolve sport slugs, truncate to column sizes and drop in-batch duplicates."""
+    slugs = None
+    prepared = []
+    seen: set[str] = set()
+    for row in rows:
+        sport_id = row.get("sport_id")
+        if sport_id is None:
+            if slugs is None:
+                slugs = sport_ids(db)
+            sport_id = slugs.get(row.get("sport_slug"))
+        url = (row.get("source_url") or "")[:2000]
+        if not sport_id or not url or url in seen:
+            continue
+        seen.add(url)
+        values = {key: row.get(key) for key in _ARTICLE_FIELDS}
+        values.update(
+            sport_id=sport_id,
+            source_url=url,
+            headline=(row.get("headline") or "")[:500],
+            source_name=(row.get("source_name") or "")[:200],
+        )
+        prepared.append(values)
+    return prepared
+
+
+def _insert_chunk(db: Session, chunk: list[dict]) -> int:
+    """Insert one chunk, ignoring rows whose source_url already exists."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        stmt = postgresql.insert(Article).on_conflict_do_nothing(constraint="uq_article_source_url")
+    elif dialect == "sqlite":
+        stmt = sqlite.insert(Article).on_conflict_do_nothing(index_elements=["source_url"])
+    else:
+        return _insert_chunk_portable(db, chunk)
+    result = db.execute(stmt.values(chunk).returning(Article.id))
+    return len(result.all())
+
+
+def _insert_chunk_portable(db: Session, chunk: list[dict]) -> int:
+    """Row-by-row fallback for dialects without ON CONFLICT support."""
+    inserted = 0
+    for values in chunk:
+        try:
+            with db.begin_nested():
+                db.execute(insert(Article).values(values))
+            inserted += 1
+        except IntegrityError:
+            continue
+    return inserted
+
+
+def bulk_insert_articles(
+    db: Session,
+    rows: Iterable[dict],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Insert article rows idempotently and return how many were actually inserted.
+
+    Rows are dicts of Article columns, with either ``sport_id`` or
+    ``sport_slug``; rows for unknown sports are skipped. Duplicates of an
+    existing ``source_url`` are ignored via ``ON CONFLICT DO NOTHING`` on
+    ``uq_article_source_url``. Each chunk is committed on its own, so a failing
+    chunk is rolled back without losing the chunks before it. Chunks that
+    insert anything bump the data version in the same transaction.
+    """
+    prepared = _prepare(db, rows)
+    inserted = 0
+    for start in range(0, len(prepared), chunk_size):
+        chunk = prepared[start:start + chunk_size]
+        try:
+            count = _insert_chunk(db, chunk)
+            if count:
+                bump_data_version(db)
+            db.commit()
+            inserted += count
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to insert article chunk of %d rows", len(chunk))
+    return inserted
@@ -1,34 +1,64 @@
-"""APScheduler job to run agent pipeline periodically."""
+"""APScheduler job that launches the pipeline worker on an interval.
+
+The pipeline itself never runs in the API process: each job starts
+``python -m app.worker`` as a subprocess, and the worker's database lease
+keeps runs from overlapping even when several API processes (``--reload``,
+``--workers N``) each run this scheduler. Deployments with a dedicated
+worker service set ``DISABLE_SCHEDULER=1`` (or ``API_ONLY=1``) on the API.
+"""
+import logging
 import os
+import subprocess
 import sys
+import threading
 from pathlib import Path
 
-from apscheduler.schedulers.background import BackgroundScheduler
+logger = logging.getLogger(__name__)
+
+_backend_dir = Path(__file__).resolve().parents[1]
+
+
+def scheduler_enabled() -> bool:
+    return not (
+        os.getenv("TESTING") or os.getenv("DISABLE_SCHEDULER") or os.getenv("API_ONLY") == "1"
+    )
 
-# Add project root for agent imports
-_root = Path(__file__).resolve().parents[2]
-if str(_root) not in sys.path:
-    sys.path.insert(0, str(_root))
-if str(_root / "backend") not in sys.path:
-    sys.path.insert(0, str(_root / "backend"))
+
+def launch_worker(trigger: str = "") -> subprocess.Popen:
+    """Start a worker subprocess that drains queued runs (queueing one for ``trigger``).
+
+    A daemon thread waits on the child so it is reaped even when the caller
+    never does.
+    """
+    cmd = [sys.executable, "-m", "app.worker", "--once"]
+    if trigger:
+        cmd += ["--enqueue", trigger]
+    proc = subprocess.Popen(cmd, cwd=_backend_dir)
+    threading.Thread(target=proc.wait, name="worker-reaper", daemon=True).start()
+    return proc
 
 
 def run_agent_pipeline():
-    """Job: run the agent pipeline."""
+    """Job: run the agent pipeline in a worker subprocess and wait for it."""
     try:
-        from agent.crew.crew import run_pipeline_sync
-        saved = run_pipeline_sync()
-        print(f"Scheduled pipeline: saved {saved} articles")
+        code = launch_worker("schedule").wait()
+        if code:
+            logger.error(f"Scheduled pipeline worker exited with status {code}")
     except Exception as e:
-        print(f"Scheduled pipeline error: {e}")
+        logger.error(f"Scheduled pipeline error: {e}")
 
 
 def start_scheduler():
     """Start background scheduler for agent pipeline."""
-    if os.getenv("TESTING") or os.getenv("DISABLE_SCHEDULER"):
+    if not scheduler_enabled():
         return None
+    # Only processes that run the schedule pay for importing APScheduler
+    from apscheduler.schedulers.background import BackgroundScheduler
+
     interval_hours = int(os.getenv("PIPELINE_INTERVAL_HOURS", "5"))
     scheduler = BackgroundScheduler()
-    scheduler.add_job(run_agent_pipeline, "interval", hours=interval_hours)
+    scheduler.add_job(
+        run_agent_pipeline, "interval", hours=interval_hours, max_instances=1, coalesce=True
+    )
     scheduler.start()
     return scheduler
@@ -1,6 +1,6 @@
 """Pydantic schemas for API."""
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -38,3 +38,62 @@ class ArticleResponse(ArticleBase):
 
 class ArticleWithSport(ArticleResponse):
     sport: SportResponse
+
+
+class ArticleSourceResponse(BaseModel):
+    source_url: str
+    source_name: str
+    published_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ArticleDetail(ArticleWithSport):
+    alternate_sources: List[ArticleSourceResponse] = []
+
+
+class ArticlePage(BaseModel):
+    items: List[ArticleWithSport]
+    next_cursor: Optional[str] = None
+
+
+class ArticleListItem(BaseModel):
+    """Projected article row for list views; only the fields requested via
+    ``fields=`` are present."""
+    id: Optional[int] = None
+    headline: Optional[str] = None
+    summary: Optional[str] = None
+    source_url: Optional[str] = None
+    source_name: Optional[str] = None
+    published_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    sport_id: Optional[int] = None
+    sport_slug: Optional[str] = None
+    sport_name: Optional[str] = None
+
+
+class ArticleListPage(BaseModel):
+    items: List[ArticleListItem]
+    next_cursor: Optional[str] = None
+
+
+class PipelineRunResponse(BaseModel):
+    id: int
+    status: str
+    trigger: str
+    worker: Optional[str] = None
+    requested_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    discovered: int
+    processed: int
+    saved: int
+    skipped: int
+    failed: int
+    llm_calls: int
+    error: Optional[str] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,97 @@
+"""Full-text article search backed by SQLite FTS5 or a Postgres tsvector index.
+
+Other databases (and SQLite without FTS5) fall back to unranked, case-insensitive substring matching.
+"""
+import re
+from typing import Optional
+
+from sqlalchemy import func, or_, text
+from sqlalchemy.orm import Session, joinedload
+
+from app.migrations import PG_SEARCH_VECTOR, has_sqlite_fts
+from app.models import Article, Sport
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+
+def fts5_query(q: str) -> str:
+    """Turn free text into a safe FTS5 MATCH expression (all terms, last one as prefix)."""
+    terms = _TERM.findall(q)
+    if not terms:
+        return ""
+    quoted = [f'"{t}"' for t in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _like_search_ids(
+    db: Session, q: str, sport: Optional[str], limit: int, offset: int
+) -> list[int]:
+    """Ids of articles containing every term of ``q`` in headline or summary, newest first."""
+    terms = _TERM.findall(q)
+    if not terms:
+        return []
+    query = db.query(Article.id)
+    for term in terms:
+        pattern = "%" + term.lower().replace("_", "\\_") + "%"
+        query = query.filter(or_(
+            func.lower(Article.headline).like(pattern, escape="\\"),
+            func.lower(Article.summary).like(pattern, escape="\\"),
+        ))
+    if sport:
+        query = query.join(Sport, Sport.id == Article.sport_id).filter(Sport.slug == sport)
+    query = query.order_by(Article.published_at.desc(), Article.id.desc())
+    return [row[0] for row in query.offset(offset).limit(limit)]
+
+
+def search_articles(
+    db: Session,
+    q: str,
+    sport: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> list[Article]:
+    """Return articles matching ``q``, best match first.
+
+    Ranking is BM25 (headline weighted over summary) on SQLite and
+    ``ts_rank_cd`` on Postgres; ties fall back to newest first. Other
+    databases, and SQLite builds without FTS5, match terms as substrings and
+    return newest first.
+    """
+    dialect = db.get_bind().dialect.name
+    params = {"limit": limit, "offset": offset, "sport": sport}
+    sport_filter = (
+        " AND articles.sport_id = (SELECT id FROM sports WHERE slug = :sport)" if sport else ""
+    )
+    if dialect == "sqlite" and has_sqlite_fts(db):
+        params["q"] = fts5_query(q)
+        if not params["q"]:
+            return []
+        sql = (
+            "SELECT articles.id FROM articles_fts JOIN articles ON articles.id = articles_fts.rowid"
+            " WHERE articles_fts MATCH :q" + sport_filter +
+            " ORDER BY bm25(articles_fts, 2.0, 1.0), articles.published_at DESC, articles.id DESC"
+            " LIMIT :limit OFFSET :offset"
+        )
+    elif dialect == "postgresql":
+        params["q"] = q
+        sql = (
+            "SELECT articles.id FROM articles, websearch_to_tsquery('english', :q) query"
+            f" WHERE {PG_SEARCH_VECTOR} @@ query" + sport_filter +
+            f" ORDER BY ts_rank_cd({PG_SEARCH_VECTOR}, query) DESC,"
+            " articles.published_at DESC NULLS LAST, articles.id DESC"
+            " LIMIT :limit OFFSET :offset"
+        )
+    else:
+        return _load_in_order(db, _like_search_ids(db, q, sport, limit, offset))
+    return _load_in_order(db, [row[0] for row in db.execute(text(sql), params)])
+
+
+def _load_in_order(db: Session, ids: list[int]) -> list[Article]:
+    if not ids:
+        return []
+    by_id = {
+        a.id: a
+        for a in db.query(Article).options(joinedload(Article.sport)).filter(Article.id.in_(ids))
+    }
+    return [by_id[i] for i in ids if i in by_id]
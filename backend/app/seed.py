@@ -8,7 +8,7 @@ def seed_sports(session):
         Sport(name="Cricket", slug="cricket"),
         Sport(name="Soccer", slug="soccer"),
     ]
+    existing = {slug for (slug,) in session.query(Sport.slug).all()}
     for sport in sports:
-        existing = session.query(Sport).filter_by(slug=sport.slug).first()
-        if not existing:
+        if sport.slug not in existing:
             session.add(sport)
@@ -0,0 +1,177 @@
+"""Fan-out of newly stored articles to Server-Sent Events subscribers.
+
+The pipeline writes from another process, so each API process runs one
+``ArticleBroadcaster`` task that polls the data version (a single-row
+read) and, when it changes, loads the articles with ids above the last
+one it has seen. Each article is serialized once and offered to every
+subscriber's queue. An idle connection costs a queue and a suspended
+coroutine; no thread or database connection is held per client.
+
+Article ids are the SSE event ids. They increase in commit order because
+only the lease-holding pipeline worker inserts articles, so a reconnecting
+client's ``Last-Event-ID`` resumes exactly after the last article it saw.
+"""
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
+
+from app.database import SessionLocal
+from app.models import Article, Sport
+from app.persistence import get_data_version
+from app.schemas import ArticleWithSport
+
+logger = logging.getLogger(__name__)
+
+_POLL_SECONDS = float(os.getenv("STREAM_POLL_SECONDS", "2"))
+_BACKFILL_LIMIT = int(os.getenv("STREAM_BACKFILL_LIMIT", "500"))
+_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "1000"))
+
+
+@dataclass(frozen=True)
+class ArticleEvent:
+    id: int
+    sport: str
+    data: str
+
+
+def _events(rows: list[Article]) -> list[ArticleEvent]:
+    return [
+        ArticleEvent(a.id, a.sport.slug, ArticleWithSport.model_validate(a).model_dump_json())
+        for a in rows
+    ]
+
+
+def _articles_after(db: Session, after_id: int, limit: int, sport: Optional[str] = None):
+    q = (
+        db.query(Article)
+        .options(joinedload(Article.sport))
+        .filter(Article.id > after_id)
+    )
+    if sport:
+        q = q.join(Sport, Sport.id == Article.sport_id).filter(Sport.slug == sport)
+    return q.order_by(Article.id).limit(limit).all()
+
+
+class Subscription:
+    """One connected client: a bounded queue of events for its sport filter."""
+
+    def __init__(self, sport: Optional[str], maxsize: int):
+        self.sport = sport
+        self.queue: asyncio.Queue[ArticleEvent] = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def offer(self, event: ArticleEvent) -> None:
+        if self.sport and event.sport != self.sport:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # The client is too slow; its stream ends and it resumes via Last-Event-ID.
+            self.overflowed = True
+
+
+class ArticleBroadcaster:
+    """Polls for new articles and pushes them to every ``Subscription``."""
+
+    def __init__(
+        self,
+        poll_interval: float = _POLL_SECONDS,
+        backfill_limit: int = _BACKFILL_LIMIT,
+        queue_size: int = _QUEUE_SIZE,
+    ):
+        self.poll_interval = poll_interval
+        self.backfill_limit = backfill_limit
+        self.queue_size = queue_size
+        self.last_id = 0
+        self._version: Optional[int] = None
+        self._subscribers: set[Subscription] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    async def subscribe(self, sport: Optional[str] = None) -> Subscription:
+        await self._ensure_running()
+        subscription = Subscription(sport, self.queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    async def backfill(
+        self, after_id: int, sport: Optional[str] = None
+    ) -> tuple[list[ArticleEvent], bool]:
+        """Articles after ``after_id`` for a resuming client, and whether more were skipped."""
+        def load() -> list[ArticleEvent]:
+            db = SessionLocal()
+            try:
+                return _events(_articles_after(db, after_id, self.backfill_limit + 1, sport))
+            finally:
+                db.close()
+
+        events = await asyncio.to_thread(load)
+        return events[:self.backfill_limit], len(events) > self.backfill_limit
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        running = (
+            self._task is not None and not self._task.done() and self._task.get_loop() is loop
+        )
+        if not running or not self._subscribers:
+            # Nothing is polled while nobody listens, so start from the current state
+            self._version, self.last_id = await asyncio.to_thread(self._snapshot)
+        if not running:
+            self._task = loop.create_task(self._run())
+
+    def _snapshot(self) -> tuple[int, int]:
+        db = SessionLocal()
+        try:
+            return get_data_version(db), db.query(func.max(Article.id)).scalar() or 0
+        finally:
+            db.close()
+
+    def _poll(self) -> list[ArticleEvent]:
+        db = SessionLocal()
+        try:
+            version = get_data_version(db)
+            if version == self._version:
+                return []
+            rows = _articles_after(db, self.last_id, self.queue_size)
+            events = _events(rows)
+            if len(rows) < self.queue_size:
+                # Only mark the version seen once every new row has been read
+                self._version = version
+            if rows:
+                self.last_id = rows[-1].id
+            return events
+        finally:
+            db.close()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            if not self._subscribers:
+                continue
+            try:
+                events = await asyncio.to_thread(self._poll)
+            except Exception:
+                logger.exception("Article stream poll failed")
+                continue
+            for event in events:
+                for subscription in list(self._subscribers):
+                    subscription.offer(event)
+
+
+broadcaster = ArticleBroadcaster()
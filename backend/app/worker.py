@@ -0,0 +1,311 @@
+"""Pipeline worker: runs agent pipeline jobs outside the API process.
+
+Runs are rows in ``pipeline_runs``. The API and the schedule only enqueue
+them; a worker executes them while holding the ``pipeline`` lease in the
+``leases`` table, so at most one run is active across every process and
+host sharing the database. The lease is renewed while a run is in
+progress; if a worker dies, the lease expires and the next worker marks
+the orphaned run failed (its checkpoints resume in the next run). A
+worker that loses the lease (taken over, or not renewed before it
+expired) cancels its run and stops claiming new ones.
+
+    python -m app.worker            # long-running worker with its own schedule
+    python -m app.worker --once     # drain queued runs and exit
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from contextlib import contextmanager, suppress
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, Optional
+
+# Add project root for agent imports
+_root = Path(__file__).resolve().parents[2]
+if str(_root) not in sys.path:
+    sys.path.insert(0, str(_root))
+if str(_root / "backend") not in sys.path:
+    sys.path.insert(0, str(_root / "backend"))
+
+from sqlalchemy import func, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, init_db
+from app.models import Lease, PipelineRun
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+LEASE_NAME = "pipeline"
+_LEASE_SECONDS = int(os.getenv("WORKER_LEASE_SECONDS", "300"))
+_POLL_SECONDS = float(os.getenv("WORKER_POLL_SECONDS", "10"))
+_INTERVAL_HOURS = int(os.getenv("PIPELINE_INTERVAL_HOURS", "5"))
+
+
+class LeaseLost(Exception):
+    """The worker no longer holds the pipeline lease."""
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def acquire_lease(
+    db: Session,
+    owner: str,
+    ttl: int = _LEASE_SECONDS,
+    name: str = LEASE_NAME,
+) -> bool:
+    """Take or renew lease ``name`` for ``owner``; False if someone else holds it."""
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=ttl)
+    result = db.execute(
+        update(Lease)
+        .where(Lease.name == name, or_(Lease.owner == owner, Lease.expires_at < now))
+        .values(owner=owner, expires_at=expires_at)
+    )
+    if result.rowcount:
+        db.commit()
+        return True
+    try:
+        db.add(Lease(name=name, owner=owner, expires_at=expires_at))
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return False
+
+
+def release_lease(db: Session, owner: str, name: str = LEASE_NAME) -> None:
+    db.query(Lease).filter_by(name=name, owner=owner).delete()
+    db.commit()
+
+
+@contextmanager
+def _renewing(owner: str, ttl: int = _LEASE_SECONDS) -> Iterator[threading.Event]:
+    """Renew the lease in the background every ttl/3 seconds until exit.
+
+    Yields an event that is set once the lease is lost: another worker took
+    it, or renewals kept failing until it expired. Renewal stops then.
+    """
+    stop = threading.Event()
+    lost = threading.Event()
+
+    def renew() -> None:
+        renewed = time.monotonic()
+        while not stop.wait(ttl / 3):
+            db = SessionLocal()
+            try:
+                if acquire_lease(db, owner, ttl):
+                    renewed = time.monotonic()
+                else:
+                    logger.error("Lost the pipeline lease to another worker")
+                    lost.set()
+                    return
+            except Exception:
+                logger.exception("Failed to renew the pipeline lease")
+                if time.monotonic() - renewed >= ttl:
+                    logger.error("Pipeline lease expired before it could be renewed")
+                    lost.set()
+                    return
+            finally:
+                db.close()
+
+    thread = threading.Thread(target=renew, name="lease-renewal", daemon=True)
+    thread.start()
+    try:
+        yield lost
+    finally:
+        stop.set()
+        thread.join()
+
+
+def enqueue_run(db: Session, trigger: str) -> tuple[PipelineRun, bool]:
+    """Queue a run unless one is already waiting; returns (run, created)."""
+    queued = (
+        db.query(PipelineRun)
+        .filter(PipelineRun.status == QUEUED)
+        .order_by(PipelineRun.id)
+        .first()
+    )
+    if queued is not None:
+        return queued, False
+    run = PipelineRun(status=QUEUED, trigger=trigger)
+    db.add(run)
+    db.commit()
+    db.refresh(run)
+    return run, True
+
+
+def _fail_orphaned_runs(db: Session) -> None:
+    """Mark runs left 'running' by a worker whose lease expired."""
+    count = (
+        db.query(PipelineRun)
+        .filter(PipelineRun.status == RUNNING)
+        .update(
+            {
+                PipelineRun.status: FAILED,
+                PipelineRun.finished_at: datetime.utcnow(),
+                PipelineRun.error: "Worker stopped before the run finished",
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    if count:
+        logger.warning(f"Marked {count} orphaned pipeline run(s) as failed")
+
+
+def _claim_next(db: Session, owner: str) -> Optional[PipelineRun]:
+    run = (
+        db.query(PipelineRun)
+        .filter(PipelineRun.status == QUEUED)
+        .order_by(PipelineRun.id)
+        .first()
+    )
+    if run is None:
+        return None
+    run.status = RUNNING
+    run.worker = owner
+    run.started_at = datetime.utcnow()
+    db.commit()
+    return run
+
+
+async def _run_while_leased(stats, lost: threading.Event) -> None:
+    """Run the pipeline, cancelling it if the lease is lost part-way."""
+    from agent.crew.crew import run_pipeline
+
+    pipeline = asyncio.create_task(run_pipeline(stats=stats))
+    while not lost.is_set():
+        done, _ = await asyncio.wait({pipeline}, timeout=1)
+        if done:
+            return pipeline.result()
+    pipeline.cancel()
+    with suppress(asyncio.CancelledError):
+        await pipeline
+    raise LeaseLost("Pipeline lease lost; run cancelled")
+
+
+def _execute(db: Session, run: PipelineRun, lost: threading.Event) -> None:
+    from agent.crew.crew import PipelineStats
+    from agent.crew.metrics import RUN_SECONDS, RUNS
+
+    logger.info(f"Starting pipeline run {run.id} (trigger={run.trigger})")
+    stats = PipelineStats()
+    try:
+        asyncio.run(_run_while_leased(stats, lost))
+        run.status = SUCCEEDED
+    except BaseException as e:
+        logger.exception(f"Pipeline run {run.id} failed")
+        run.status = FAILED
+        run.error = f"{type(e).__name__}: {e}"[:2000]
+        if not isinstance(e, Exception):
+            raise
+    finally:
+        run.finished_at = datetime.utcnow()
+        run.discovered = stats.discovered
+        run.processed = stats.processed
+        run.saved = stats.saved
+        run.skipped = stats.skipped + stats.known_skipped + stats.duplicates
+        run.failed = stats.failed
+        run.llm_calls = stats.llm_calls
+        db.commit()
+        RUNS.labels(run.status).inc()
+        RUN_SECONDS.observe((run.finished_at - run.started_at).total_seconds())
+        logger.info(f"Pipeline run {run.id} {run.status}: saved {run.saved} articles")
+
+
+def run_pending(owner: Optional[str] = None, trigger: Optional[str] = None) -> int:
+    """Run queued pipeline runs under the lease; returns how many ran.
+
+    With ``trigger``, a run is queued first (deduplicated against one
+    already waiting). Does nothing if another worker holds the lease; that
+    worker drains the queue before it lets go.
+    """
+    owner = owner or worker_id()
+    db = SessionLocal()
+    try:
+        if not acquire_lease(db, owner):
+            logger.info("Another worker holds the pipeline lease; not starting a run")
+            return 0
+        try:
+            with _renewing(owner) as lost:
+                _fail_orphaned_runs(db)
+                if trigger:
+                    enqueue_run(db, trigger)
+                ran = 0
+                while not lost.is_set() and (run := _claim_next(db, owner)) is not None:
+                    _execute(db, run, lost)
+                    ran += 1
+                return ran
+        finally:
+            release_lease(db, owner)
+    finally:
+        db.close()
+
+
+def _schedule_due(db: Session, since: datetime, interval_hours: int) -> bool:
+    last = (
+        db.query(func.max(PipelineRun.requested_at))
+        .filter(PipelineRun.trigger == "schedule")
+        .scalar()
+    )
+    return (last or since) + timedelta(hours=interval_hours) <= datetime.utcnow()
+
+
+def serve(poll_seconds: float = _POLL_SECONDS, interval_hours: int = _INTERVAL_HOURS) -> None:
+    """Poll for queued runs forever, queueing a scheduled run every interval."""
+    owner = worker_id()
+    started = datetime.utcnow()
+    logger.info(
+        f"Pipeline worker {owner} started (interval={interval_hours}h, poll={poll_seconds}s)"
+    )
+    while True:
+        db = SessionLocal()
+        try:
+            if _schedule_due(db, started, interval_hours):
+                enqueue_run(db, "schedule")
+            pending = db.query(PipelineRun.id).filter(PipelineRun.status == QUEUED).first()
+        finally:
+            db.close()
+        if pending is not None:
+            run_pending(owner)
+        time.sleep(poll_seconds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run agent pipeline jobs out of the API process")
+    parser.add_argument("--once", action="store_true", help="Drain queued runs and exit")
+    parser.add_argument("--enqueue", metavar="TRIGGER", help="Queue a run with this trigger first")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    # Let `docker stop` unwind normally so the run is recorded and the lease released
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    init_db()
+    if args.once or args.enqueue:
+        run_pending(trigger=args.enqueue)
+        return
+    try:
+        serve()
+    except (KeyboardInterrupt, SystemExit):
+        logger.info("Pipeline worker stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Benchmark /api/articles latency against a large seeded database.
+
+Seeds a SQLite database with ``--rows`` synthetic articles (reused across
+runs via ``--db``), serves the API with uvicorn on a local port and
+measures p50/p99 latency per scenario over real HTTP, with the response
+cache bypassed and warm.
+
+    python benchmarks/api_bench.py --rows 1000000 --db /tmp/articles-1m.db --output api.json
+"""
+import argparse
+import json
+import os
+import random
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_root / "backend"))
+
+from standins import percentile, timed_calls
+
+_WORDS = (
+    "india australia england kohli root wicket century innings test odi arsenal chelsea "
+    "liverpool madrid goal penalty striker keeper derby transfer manager injury final"
+).split()
+
+
+def seed_articles(rows: int) -> None:
+    from app.database import SessionLocal, init_db
+    from app.models import Article
+    from app.persistence import bulk_insert_articles
+    from app.seed import seed_sports
+
+    init_db()
+    db = SessionLocal()
+    try:
+        seed_sports(db)
+        db.commit()
+        existing = db.query(Article).count()
+        if existing >= rows:
+            print(f"Reusing {existing} seeded articles")
+            return
+        rng = random.Random(42)
+        start = datetime(2020, 1, 1)
+        started = time.perf_counter()
+        for offset in range(existing, rows, 10_000):
+            batch = [
+                {
+                    "headline": " ".join(rng.choice(_WORDS) for _ in range(8)),
+                    "summary": " ".join(rng.choice(_WORDS) for _ in range(50)),
+                    "source_url": f"https://example.com/{i}",
+                    "source_name": f"Source {i % 20}",
+                    "published_at": start + timedelta(minutes=i),
+                    "sport_slug": "cricket" if i % 2 else "soccer",
+                }
+                for i in range(offset, min(rows, offset + 10_000))
+            ]
+            bulk_insert_articles(db, batch)
+        print(f"Seeded {rows - existing} articles in {time.perf_counter() - started:.1f}s")
+    finally:
+        db.close()
+
+
+def _serve() -> str:
+    import uvicorn
+
+    from app.main import app
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+def _deep_page(client, pages: int):
+    def run():
+        cursor = None
+        for _ in range(pages):
+            params = {"limit": 50, **({"cursor": cursor} if cursor else {})}
+            cursor = client.get("/api/articles", params=params).json()["next_cursor"]
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--db", type=Path, help="SQLite file to seed or reuse (default: temp)")
+    parser.add_argument("--repeat", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+
+    db_path = args.db or Path(tempfile.mkdtemp(prefix="api-bench-")) / "bench.db"
+    os.environ.update(DATABASE_URL=f"sqlite:///{db_path}", DISABLE_SCHEDULER="1")
+    os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    seed_articles(args.rows)
+
+    import httpx
+
+    from app.cache import MemoryBackend, response_cache
+
+    base_url = _serve()
+    scenarios = {
+        "latest": {"limit": 50},
+        "sport": {"sport": "cricket", "limit": 50},
+        "date_range": {"from": "2020-06-01", "to": "2020-06-30", "limit": 50},
+        "sport_date_range": {
+            "sport": "soccer", "from": "2021-01-01", "to": "2021-01-31", "limit": 50,
+        },
+    }
+    results: dict = {"rows": args.rows, "repeat": args.repeat, "scenarios": {}}
+    with httpx.Client(base_url=base_url) as client:
+        # max_entries=0 evicts every response as soon as it is stored
+        modes = (("uncached", MemoryBackend(max_entries=0)), ("cached", MemoryBackend()))
+        for mode, backend in modes:
+            response_cache.backend = backend
+            runs = {
+                name: (lambda p=params: client.get("/api/articles", params=p).raise_for_status())
+                for name, params in scenarios.items()
+            }
+            runs["keyset_20_pages"] = _deep_page(client, 20)
+            for name, fn in runs.items():
+                fn()  # warm-up
+                repeat = args.repeat if name != "keyset_20_pages" else max(1, args.repeat // 20)
+                samples = timed_calls(fn, repeat)
+                row = {
+                    "p50_ms": round(statistics.median(samples) * 1000, 2),
+                    "p99_ms": round(percentile(samples, 0.99) * 1000, 2),
+                }
+                results["scenarios"][f"{mode}:{name}"] = row
+                print(f"{mode:>9} {name:<18} p50 {row['p50_ms']:>8.2f} ms  p99 {row['p99_ms']:>8.2f} ms")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
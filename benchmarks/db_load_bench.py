@@ -0,0 +1,213 @@
+"""Concurrent load test of the sync and async database paths of the API.
+
+Seeds a SQLite database (reused via ``--db``), then for each mode starts
+the API under uvicorn in a subprocess (``DB_ASYNC=0`` / ``DB_ASYNC=1``,
+response cache disabled) and drives it with ``--clients`` concurrent
+clients for ``--duration`` seconds. With ``--writer``, a background thread
+inserts article batches the way the pipeline does, to show readers and a
+writer sharing the database (compare ``--journal-mode DELETE`` and ``WAL``).
+The async mode needs ``aiosqlite``.
+
+    python benchmarks/db_load_bench.py --rows 100000 --clients 64 --writer --output load.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_root / "backend"))
+
+from api_bench import seed_articles
+from standins import percentile
+
+_PATHS = (
+    ("/api/articles", {"limit": 50}),
+    ("/api/articles", {"sport": "cricket", "limit": 50}),
+    ("/api/articles", {"from": "2020-06-01", "to": "2020-06-30", "limit": 50}),
+    ("/api/sports", {}),
+    ("/api/articles/1", {}),
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_api(env: dict) -> tuple[subprocess.Popen, str]:
+    import httpx
+
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=_root / "backend",
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"API exited with status {proc.returncode}")
+        try:
+            httpx.get(f"{base_url}/health").raise_for_status()
+            return proc, base_url
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("API did not start within 30s")
+
+
+async def _drive(base_url: str, clients: int, duration: float) -> dict:
+    import httpx
+
+    samples: list[float] = []
+    errors = 0
+    deadline = time.monotonic() + duration
+
+    async def client_loop(n: int) -> None:
+        nonlocal errors
+        limits = httpx.Limits(max_connections=1)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+            i = n
+            while time.monotonic() < deadline:
+                path, params = _PATHS[i % len(_PATHS)]
+                i += 1
+                started = time.perf_counter()
+                try:
+                    (await client.get(path, params=params)).raise_for_status()
+                    samples.append(time.perf_counter() - started)
+                except httpx.HTTPError:
+                    errors += 1
+
+    started = time.monotonic()
+    await asyncio.gather(*(client_loop(n) for n in range(clients)))
+    elapsed = time.monotonic() - started
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "requests_per_second": round(len(samples) / elapsed, 1),
+        "p50_ms": round(statistics.median(samples) * 1000, 2) if samples else None,
+        "p99_ms": round(percentile(samples, 0.99) * 1000, 2) if samples else None,
+    }
+
+
+class _Writer(threading.Thread):
+    """Inserts ``batch`` articles every ``interval`` seconds until stopped."""
+
+    def __init__(self, batch: int = 200, interval: float = 0.2):
+        super().__init__(daemon=True)
+        self.batch = batch
+        self.interval = interval
+        self.samples: list[float] = []
+        self.errors = 0
+        self._done = threading.Event()
+        self._next = 0
+
+    def run(self) -> None:
+        from app.database import SessionLocal
+        from app.persistence import bulk_insert_articles
+
+        while not self._done.wait(self.interval):
+            rows = [
+                {
+                    "headline": f"Load test article {self._next + i}",
+                    "summary": "Inserted while the API is under read load.",
+                    "source_url": f"https://load.example.com/{time.time_ns()}/{i}",
+                    "source_name": "Load",
+                    "published_at": datetime.utcnow(),
+                    "sport_slug": "cricket",
+                }
+                for i in range(self.batch)
+            ]
+            self._next += self.batch
+            db = SessionLocal()
+            started = time.perf_counter()
+            try:
+                bulk_insert_articles(db, rows)
+                self.samples.append(time.perf_counter() - started)
+            except Exception:
+                db.rollback()
+                self.errors += 1
+            finally:
+                db.close()
+
+    def stop(self) -> dict:
+        self._done.set()
+        self.join()
+        return {
+            "batches": len(self.samples),
+            "errors": self.errors,
+            "p50_ms": round(statistics.median(self.samples) * 1000, 2) if self.samples else None,
+            "p99_ms": round(percentile(self.samples, 0.99) * 1000, 2) if self.samples else None,
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--db", type=Path, help="SQLite file to seed or reuse (default: temp)")
+    parser.add_argument("--clients", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per mode")
+    parser.add_argument("--modes", default="sync,async", help="Comma-separated: sync, async")
+    parser.add_argument("--journal-mode", default="WAL", help="SQLITE_JOURNAL_MODE for all connections")
+    parser.add_argument("--writer", action="store_true", help="Insert articles during the load")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+
+    db_path = args.db or Path(tempfile.mkdtemp(prefix="db-load-bench-")) / "bench.db"
+    os.environ.update(
+        DATABASE_URL=f"sqlite:///{db_path}",
+        DISABLE_SCHEDULER="1",
+        SQLITE_JOURNAL_MODE=args.journal_mode,
+    )
+    os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    seed_articles(args.rows)
+
+    results: dict = {
+        "config": {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items()},
+        "modes": {},
+    }
+    for mode in args.modes.split(","):
+        env = {
+            **os.environ,
+            "DB_ASYNC": "1" if mode == "async" else "0",
+            "API_CACHE_MAX_ENTRIES": "0",
+        }
+        proc, base_url = _start_api(env)
+        writer = _Writer() if args.writer else None
+        try:
+            if writer:
+                writer.start()
+            row = asyncio.run(_drive(base_url, args.clients, args.duration))
+            if writer:
+                row["writer"] = writer.stop()
+        finally:
+            proc.terminate()
+            proc.wait()
+        results["modes"][mode] = row
+        print(
+            f"{mode:>6} {row['requests_per_second']:>8.1f} req/s  p50 {row['p50_ms']} ms"
+            f"  p99 {row['p99_ms']} ms  errors {row['errors']}"
+            + (f"  writes p99 {row['writer']['p99_ms']} ms" if writer else "")
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Compare article extraction engines on the saved-page fixture corpus.
+
+For every page under ``benchmarks/fixtures/pages`` (or ``--pages``), runs
+each available engine and reports agreement with the reference ``bs4``
+output (word-level similarity), median parse time and peak Python heap
+allocation (tracemalloc; libxml2's own C allocations are not included).
+
+    python benchmarks/extraction_bench.py --repeat 20 --output extraction.json
+"""
+import argparse
+import difflib
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_root))
+
+from agent.crew.extraction import ENGINES, extract_bs4
+
+_FIXTURES = Path(__file__).resolve().parent / "fixtures" / "pages"
+
+
+def _available() -> dict:
+    engines = {}
+    for name, fn in ENGINES.items():
+        try:
+            fn("<html><body><p>probe</p></body></html>")
+        except ImportError:
+            print(f"Skipping {name}: dependency not installed")
+            continue
+        engines[name] = fn
+    return engines
+
+
+def _similarity(a: str, b: str) -> float:
+    return difflib.SequenceMatcher(None, a.split(), b.split(), autojunk=False).ratio()
+
+
+def _measure(fn, html: str, repeat: int) -> tuple[str, float, int]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = fn(html)
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    fn(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return text, statistics.median(timings), peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=Path, default=_FIXTURES)
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per page and engine")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+
+    engines = _available()
+    pages = sorted(args.pages.glob("*.html"))
+    results: dict = {"pages": {}, "totals": {}}
+    print(f"{'page':<22}" + "".join(f"{name:>30}" for name in engines))
+    for page in pages:
+        html = page.read_text(encoding="utf-8", errors="replace")
+        reference = extract_bs4(html)
+        row = {}
+        for name, fn in engines.items():
+            text, seconds, peak = _measure(fn, html, args.repeat)
+            row[name] = {
+                "similarity": round(_similarity(reference, text), 4),
+                "ms": round(seconds * 1000, 2),
+                "peak_kib": round(peak / 1024, 1),
+                "chars": len(text),
+            }
+        results["pages"][page.stem] = row
+        print(f"{page.stem:<22}" + "".join(
+            f"{r['ms']:>9.2f} ms {r['peak_kib']:>8.0f} KiB {r['similarity']:>6.1%}"
+            for r in row.values()
+        ))
+
+    for name in engines:
+        rows = [page[name] for page in results["pages"].values()]
+        if not rows:
+            continue
+        results["totals"][name] = {
+            "median_ms": round(statistics.median(r["ms"] for r in rows), 2),
+            "max_peak_kib": max(r["peak_kib"] for r in rows),
+            "min_similarity": min(r["similarity"] for r in rows),
+        }
+    print(json.dumps(results["totals"], indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
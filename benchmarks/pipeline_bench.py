@@ -0,0 +1,132 @@
+"""Offline end-to-end pipeline benchmark.
+
+Runs ``run_pipeline`` against a local fixture site (RSS feeds + article
+pages) and a fake chat-completions endpoint, in a throwaway database, and
+reports throughput, per-stage time, model calls/tokens and peak memory.
+
+    python benchmarks/pipeline_bench.py --feeds 10 --model-latency 0.8 --output run.json
+    python benchmarks/pipeline_bench.py --concurrency 16 --summary-batch-size 4
+    python benchmarks/pipeline_bench.py --model-rpm 120 --model-error-rate 0.05 --llm-rpm 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_root))
+sys.path.insert(0, str(_root / "backend"))
+
+from standins import FakeOpenAI, FixtureSite
+
+
+def _stage_breakdown() -> dict:
+    from prometheus_client import REGISTRY
+
+    stages: dict = {}
+    for metric in REGISTRY.collect():
+        if metric.name not in (
+            "pipeline_stage_seconds", "pipeline_llm_seconds", "pipeline_llm_wait_seconds"
+        ):
+            continue
+        label = "stage" if metric.name == "pipeline_stage_seconds" else "agent"
+        for sample in metric.samples:
+            if sample.name.endswith(("_sum", "_count")):
+                key = f"{metric.name.removeprefix('pipeline_')}:{sample.labels[label]}"
+                field = "seconds" if sample.name.endswith("_sum") else "calls"
+                stages.setdefault(key, {})[field] = round(sample.value, 3)
+    return stages
+
+
+def _retries() -> dict:
+    from prometheus_client import REGISTRY
+
+    return {
+        f"{s.labels['agent']}:{s.labels['reason']}": int(s.value)
+        for metric in REGISTRY.collect() if metric.name == "pipeline_llm_retries"
+        for s in metric.samples if s.name.endswith("_total")
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feeds", type=int, default=5, help="Feeds per sport (15 articles each)")
+    parser.add_argument("--page-kib", type=int, default=60, help="Approximate article page size")
+    parser.add_argument("--site-latency", type=float, default=0.05, help="Seconds per HTTP request")
+    parser.add_argument("--model-latency", type=float, default=0.5, help="Seconds per model call")
+    parser.add_argument("--concurrency", type=int, help="PIPELINE_CONCURRENCY override")
+    parser.add_argument("--summary-batch-size", type=int, help="SUMMARY_BATCH_SIZE override")
+    parser.add_argument("--fused", action="store_true", help="Use the fused agent stage")
+    parser.add_argument("--classifier-threshold", type=float, help="Local classifier threshold")
+    parser.add_argument("--model-rpm", type=int, help="Requests/min the fake endpoint allows")
+    parser.add_argument("--model-error-rate", type=float, default=0.0,
+                        help="Fraction of fake model requests answered with a 429")
+    parser.add_argument("--llm-rpm", type=float, help="LLM_REQUESTS_PER_MINUTE override")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="pipeline-bench-"))
+    os.environ.update(
+        DATABASE_URL=f"sqlite:///{workdir}/bench.db",
+        AGENT_CACHE="0",
+        AGENT_CACHE_DIR=str(workdir / "cache"),
+        OPENAI_API_KEY="fake",
+    )
+    os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    if args.llm_rpm:
+        os.environ["LLM_REQUESTS_PER_MINUTE"] = str(args.llm_rpm)
+
+    from agent.crew.crew import PipelineStats, run_pipeline
+
+    with FixtureSite(args.feeds, page_kib=args.page_kib, latency=args.site_latency) as site, \
+            FakeOpenAI(
+                latency=args.model_latency, rpm=args.model_rpm, error_rate=args.model_error_rate
+            ) as model:
+        model.install()
+        sources = site.write_sources(workdir / "sources.yaml")
+        stats = PipelineStats()
+        started = time.perf_counter()
+        saved = asyncio.run(run_pipeline(
+            sources,
+            max_concurrency=args.concurrency,
+            classifier_threshold=args.classifier_threshold,
+            summary_batch_size=args.summary_batch_size,
+            fused=args.fused or None,
+            stats=stats,
+        ))
+        elapsed = time.perf_counter() - started
+
+    results = {
+        "config": {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items()},
+        "articles": site.article_count,
+        "saved": saved,
+        "elapsed_seconds": round(elapsed, 2),
+        "articles_per_minute": round(stats.processed / elapsed * 60, 1),
+        "processed": stats.processed,
+        "skipped": stats.skipped,
+        "failed": stats.failed,
+        "deferred": stats.deferred,
+        "local_classified": stats.local_classified,
+        "llm_calls": stats.llm_calls,
+        "model_requests": model.requests,
+        "model_rate_limited": model.rate_limited,
+        "llm_retries": _retries(),
+        "prompt_tokens": model.prompt_tokens,
+        "completion_tokens": model.completion_tokens,
+        "site_requests": site.requests,
+        # ru_maxrss is KiB on Linux
+        "peak_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "stages": _stage_breakdown(),
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Per-request CPU time and payload size of /api/articles list variants.
+
+Seeds a SQLite database (reused via ``--db``) and builds the response body
+the way the route does on a cache miss, in process, for the full
+``ArticleWithSport`` page and for ``fields=`` projections. CPU time is
+process time per request (query, row handling and encoding), so it is not
+skewed by HTTP overhead.
+
+    python benchmarks/projection_bench.py --rows 100000 --limit 50 --output projection.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_root / "backend"))
+
+from api_bench import seed_articles
+
+_VARIANTS = {
+    "full": None,
+    "compact": "compact",
+    "headlines": "id,headline,sport_slug",
+    "with_summary": "id,headline,summary,source_name,published_at,sport_slug",
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--db", type=Path, help="SQLite file to seed or reuse (default: temp)")
+    parser.add_argument("--limit", type=int, default=50, help="Page size")
+    parser.add_argument("--repeat", type=int, default=300, help="Requests per variant")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+
+    db_path = args.db or Path(tempfile.mkdtemp(prefix="projection-bench-")) / "bench.db"
+    os.environ.update(DATABASE_URL=f"sqlite:///{db_path}", DISABLE_SCHEDULER="1")
+    seed_articles(args.rows)
+
+    from app.api.articles import _article_page, _projected_page, parse_fields
+    from app.cache import ResponseCache
+    from app.database import SessionLocal
+
+    results: dict = {"rows": args.rows, "limit": args.limit, "variants": {}}
+    db = SessionLocal()
+    try:
+        for name, fields in _VARIANTS.items():
+            projection = parse_fields(fields)
+            for sport in (None, "cricket"):
+                def build():
+                    if projection:
+                        return _projected_page(db, projection, sport, None, None, args.limit, None)
+                    page = _article_page(db, sport, None, None, args.limit, None)
+                    return ResponseCache._serialize(page)
+
+                body = build()  # warm-up
+                samples = []
+                for _ in range(args.repeat):
+                    started = time.process_time()
+                    build()
+                    samples.append(time.process_time() - started)
+                    db.expunge_all()
+                key = f"{name}{':' + sport if sport else ''}"
+                row = {
+                    "fields": fields,
+                    "cpu_ms_per_request": round(statistics.mean(samples) * 1000, 3),
+                    "payload_bytes": len(body),
+                    "bytes_per_item": round(len(body) / args.limit),
+                }
+                results["variants"][key] = row
+                print(
+                    f"{key:<22} {row['cpu_ms_per_request']:>8.3f} ms cpu  "
+                    f"{row['payload_bytes']:>8} bytes"
+                )
+    finally:
+        db.close()
+
+    for key, row in results["variants"].items():
+        base = results["variants"]["full:cricket" if key.endswith(":cricket") else "full"]
+        row["cpu_vs_full"] = round(row["cpu_ms_per_request"] / base["cpu_ms_per_request"], 3)
+        row["size_vs_full"] = round(row["payload_bytes"] / base["payload_bytes"], 3)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
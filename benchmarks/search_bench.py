@@ -0,0 +1,105 @@
+"""Benchmark /api/articles/search against a large synthetic corpus.
+
+Builds a throwaway SQLite database of synthetic articles (FTS index kept in
+sync by the insert triggers), then compares ranked full-text search with a
+naive ``LIKE`` scan over headline and summary.
+
+    python benchmarks/search_bench.py --rows 200000 --output search.json
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_root / "backend"))
+
+from standins import percentile
+
+_WORDS = (
+    "india australia england pakistan kohli root smith babar wicket century innings "
+    "test odi t20 ipl bowler spinner seamer chase collapse arsenal chelsea liverpool "
+    "madrid barcelona bayern inter milan goal penalty striker keeper derby transfer "
+    "manager injury league cup final semi quarter draw win loss comeback record "
+    "captain debut season title relegation fixture stadium crowd umpire referee var"
+).split()
+# "hattrick" appears in ~0.1% of rows: the case where a LIKE scan reads the whole table.
+_QUERIES = ["kohli century", "arsenal", "penalty derby", "transfer", "hattrick", "hattrick derby"]
+
+
+def _text(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(n))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="search-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmpdir}/bench.db"
+
+    from sqlalchemy import or_
+
+    from app.database import SessionLocal, init_db
+    from app.models import Article
+    from app.persistence import bulk_insert_articles
+    from app.search import search_articles
+    from app.seed import seed_sports
+
+    init_db()
+    db = SessionLocal()
+    seed_sports(db)
+    db.commit()
+
+    rng = random.Random(42)
+    started = time.perf_counter()
+    batch = []
+    for i in range(args.rows):
+        batch.append({
+            "headline": _text(rng, 8) + (" hattrick" if i % 1000 == 0 else ""),
+            "summary": _text(rng, 50),
+            "source_url": f"https://example.com/{i}",
+            "source_name": "Synthetic",
+            "sport_slug": rng.choice(("cricket", "soccer")),
+        })
+        if len(batch) == 5000:
+            bulk_insert_articles(db, batch)
+            batch = []
+    bulk_insert_articles(db, batch)
+    insert_seconds = time.perf_counter() - started
+
+    results = {"rows": args.rows, "insert_seconds": round(insert_seconds, 2), "queries": {}}
+    for q in _QUERIES:
+        fts, like = [], []
+        for _ in range(args.repeat):
+            t = time.perf_counter()
+            search_articles(db, q, limit=20)
+            fts.append(time.perf_counter() - t)
+        for _ in range(max(1, args.repeat // 5)):
+            t = time.perf_counter()
+            terms = [or_(Article.headline.ilike(f"%{w}%"), Article.summary.ilike(f"%{w}%"))
+                     for w in q.split()]
+            db.query(Article).filter(*terms).order_by(Article.id.desc()).limit(20).all()
+            like.append(time.perf_counter() - t)
+        results["queries"][q] = {
+            "fts_p50_ms": round(statistics.median(fts) * 1000, 2),
+            "fts_p99_ms": round(percentile(fts, 0.99) * 1000, 2),
+            "like_p50_ms": round(statistics.median(like) * 1000, 2),
+        }
+    db.close()
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
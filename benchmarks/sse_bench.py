@@ -0,0 +1,194 @@
+"""Connection-count scaling of the /api/articles/stream SSE endpoint.
+
+Starts the API under uvicorn in a subprocess and ramps up idle SSE
+connections (raw asyncio sockets, so the client side stays cheap). At
+each level it records the API process's resident memory and its CPU use
+while the connections sit idle, then inserts one article and measures how
+long it takes to reach every connected client.
+
+    python benchmarks/sse_bench.py --levels 100,1000,5000 --output sse.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(_root / "backend"))
+
+from db_load_bench import _start_api
+from standins import percentile
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK")
+
+
+def _rss_mib(pid: int) -> float:
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _cpu_seconds(pid: int) -> float:
+    fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / _CLK_TCK
+
+
+class _Client:
+    """One SSE connection that records when it sees each event id."""
+
+    def __init__(self):
+        self.received: dict[int, float] = {}
+        self.ready = asyncio.Event()
+        self._writer = None
+
+    async def run(self, host: str, port: int) -> None:
+        reader, self._writer = await asyncio.open_connection(host, port)
+        self._writer.write(
+            f"GET /api/articles/stream HTTP/1.1\r\nHost: {host}\r\n"
+            "Accept: text/event-stream\r\n\r\n".encode()
+        )
+        await self._writer.drain()
+        while line := await reader.readline():
+            if line.startswith(b"retry:"):
+                self.ready.set()
+            elif line.startswith(b"id:"):
+                self.received[int(line[3:])] = time.perf_counter()
+
+    def close(self) -> None:
+        if self._writer:
+            self._writer.close()
+
+
+def _insert_article(n: int) -> int:
+    from app.database import SessionLocal
+    from app.models import Article
+    from app.persistence import bulk_insert_articles
+
+    db = SessionLocal()
+    try:
+        url = f"https://sse-bench.example.com/{n}/{time.time_ns()}"
+        bulk_insert_articles(db, [{
+            "headline": f"SSE bench article {n}",
+            "summary": "Pushed to every open stream.",
+            "source_url": url,
+            "source_name": "Bench",
+            "published_at": datetime.utcnow(),
+            "sport_slug": "cricket",
+        }])
+        return db.query(Article.id).filter(Article.source_url == url).scalar()
+    finally:
+        db.close()
+
+
+async def _run(pid: int, host: str, port: int, levels: list[int], idle: float) -> list[dict]:
+    clients: list[_Client] = []
+    tasks: list[asyncio.Task] = []
+    results = []
+    try:
+        for level in levels:
+            started = time.perf_counter()
+            while len(clients) < level:
+                client = _Client()
+                clients.append(client)
+                tasks.append(asyncio.create_task(client.run(host, port)))
+                if len(clients) % 200 == 0:
+                    await asyncio.sleep(0)  # let connections complete in waves
+            await asyncio.wait_for(
+                asyncio.gather(*(c.ready.wait() for c in clients)), timeout=120
+            )
+            connect_seconds = time.perf_counter() - started
+
+            cpu_before = _cpu_seconds(pid)
+            await asyncio.sleep(idle)
+            idle_cpu = (_cpu_seconds(pid) - cpu_before) / idle
+
+            inserted_at = time.perf_counter()
+            article_id = await asyncio.to_thread(_insert_article, level)
+            deadline = time.monotonic() + 60
+            while time.monotonic() < deadline:
+                if all(article_id in c.received for c in clients):
+                    break
+                await asyncio.sleep(0.01)
+            delays = [
+                c.received[article_id] - inserted_at for c in clients if article_id in c.received
+            ]
+            row = {
+                "connections": level,
+                "connect_seconds": round(connect_seconds, 2),
+                "rss_mib": round(_rss_mib(pid), 1),
+                "idle_cpu_percent": round(idle_cpu * 100, 1),
+                "delivered": len(delays),
+                "delivery_p50_ms": round(statistics.median(delays) * 1000, 1) if delays else None,
+                "delivery_max_ms": round(max(delays) * 1000, 1) if delays else None,
+                "delivery_p99_ms": round(percentile(delays, 0.99) * 1000, 1) if delays else None,
+            }
+            results.append(row)
+            print(
+                f"{level:>6} conns  rss {row['rss_mib']:>7.1f} MiB  idle cpu "
+                f"{row['idle_cpu_percent']:>5.1f}%  delivered {row['delivered']:>6}  "
+                f"p50 {row['delivery_p50_ms']} ms  max {row['delivery_max_ms']} ms"
+            )
+    finally:
+        for client in clients:
+            client.close()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--levels", default="100,1000,5000", help="Connection counts to reach")
+    parser.add_argument("--idle", type=float, default=5.0, help="Seconds to sample idle CPU")
+    parser.add_argument("--poll", type=float, default=0.5, help="STREAM_POLL_SECONDS for the API")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+    levels = sorted(int(n) for n in args.levels.split(","))
+
+    # Both this process and the API (which inherits the limit) hold one fd per connection
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = levels[-1] + 256
+    if soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(wanted, hard), hard))
+
+    workdir = Path(tempfile.mkdtemp(prefix="sse-bench-"))
+    os.environ.update(DATABASE_URL=f"sqlite:///{workdir}/bench.db", DISABLE_SCHEDULER="1")
+    os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+
+    from app.database import SessionLocal, init_db
+    from app.seed import seed_sports
+
+    init_db()
+    db = SessionLocal()
+    try:
+        seed_sports(db)
+        db.commit()
+    finally:
+        db.close()
+
+    proc, base_url = _start_api({**os.environ, "STREAM_POLL_SECONDS": str(args.poll)})
+    host, port = base_url.removeprefix("http://").split(":")
+    try:
+        rows = asyncio.run(_run(proc.pid, host, int(port), levels, args.idle))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    results = {"poll_seconds": args.poll, "levels": rows}
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+"""Local stand-ins for the pipeline's external services, for offline benchmarks.
+
+``FixtureSite`` serves generated RSS feeds and article pages over HTTP with
+a configurable per-request latency. ``FakeOpenAI`` is a minimal
+OpenAI-compatible chat-completions endpoint that answers every agent in
+``agent/crew/agents.py`` with a valid structured output after a simulated
+delay, optionally rejecting requests with 429s the way a rate-limited
+provider does; ``install()`` points the Agents SDK at it.
+"""
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Optional
+
+import yaml
+
+_SPORT_WORDS = {
+    "cricket": "wicket innings century bowler batsman over test odi t20 spinner umpire".split(),
+    "soccer": "goal penalty striker keeper premier league midfielder derby offside var".split(),
+}
+_FILLER = (
+    "the side said after the match that they had been outplayed early but recovered "
+    "well and the crowd stayed until the end as the coach defended his selection"
+).split()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _send(
+        self, status: int, body: bytes, content_type: str, headers: Optional[dict] = None
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self.server.owner.handle_get(self)
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.server.owner.handle_post(self, body)
+
+
+class _Server:
+    """Threaded HTTP server on an ephemeral localhost port."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.owner = self
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _delay(self, extra: float = 0.0) -> None:
+        with self._lock:
+            self.requests += 1
+            spread = self._rng.uniform(-self.jitter, self.jitter)
+        time.sleep(max(0.0, self.latency * (1 + spread) + extra))
+
+    def handle_get(self, handler: _Handler) -> None:
+        handler._send(404, b"not found", "text/plain")
+
+    def handle_post(self, handler: _Handler, body: bytes) -> None:
+        handler._send(404, b"not found", "text/plain")
+
+
+class FixtureSite(_Server):
+    """RSS feeds and article pages for ``feeds_per_sport`` sources per sport.
+
+    Each feed lists ``entries`` articles under ``/articles/<sport>/<feed>/<n>``;
+    pages are roughly ``page_kib`` KiB with navigation, scripts and an
+    ``<article>`` body containing sport keywords.
+    """
+
+    def __init__(
+        self,
+        feeds_per_sport: int = 5,
+        entries: int = 15,
+        page_kib: int = 60,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+    ):
+        super().__init__(latency, jitter)
+        self.feeds_per_sport = feeds_per_sport
+        self.entries = entries
+        self.page_kib = page_kib
+
+    @property
+    def article_count(self) -> int:
+        return len(_SPORT_WORDS) * self.feeds_per_sport * self.entries
+
+    def write_sources(self, path: Path) -> Path:
+        """Write a sources.yaml pointing every sport at this site's feeds."""
+        config = {
+            sport: {
+                "name": sport.title(),
+                "rss": [
+                    {"name": f"Fixture {sport} {i}", "url": f"{self.url}/feeds/{sport}/{i}.xml"}
+                    for i in range(self.feeds_per_sport)
+                ],
+            }
+            for sport in _SPORT_WORDS
+        }
+        path.write_text(yaml.safe_dump(config))
+        return path
+
+    def handle_get(self, handler: _Handler) -> None:
+        self._delay()
+        match = re.fullmatch(r"/(feeds|articles)/(\w+)/(\d+)(?:\.xml|/(\d+))", handler.path)
+        if not match or match.group(2) not in _SPORT_WORDS:
+            handler._send(404, b"not found", "text/plain")
+        elif match.group(1) == "feeds":
+            handler._send(200, self._feed(match.group(2), int(match.group(3))), "application/rss+xml")
+        else:
+            page = self._page(match.group(2), int(match.group(3)), int(match.group(4)))
+            handler._send(200, page, "text/html; charset=utf-8")
+
+    def _headline(self, sport: str, feed: int, n: int) -> str:
+        rng = random.Random(f"{sport}-{feed}-{n}")
+        return " ".join(rng.choice(_SPORT_WORDS[sport]) for _ in range(6)).capitalize()
+
+    def _feed(self, sport: str, feed: int) -> bytes:
+        now = datetime(2026, 1, 1)
+        items = "".join(
+            f"<item><title>{self._headline(sport, feed, n)}</title>"
+            f"<link>{self.url}/articles/{sport}/{feed}/{n}</link>"
+            f"<pubDate>{format_datetime(now - timedelta(minutes=n))}</pubDate></item>"
+            for n in range(self.entries)
+        )
+        return (
+            f'<?xml version="1.0"?><rss version="2.0"><channel>'
+            f"<title>Fixture {sport} {feed}</title>{items}</channel></rss>"
+        ).encode()
+
+    def _page(self, sport: str, feed: int, n: int) -> bytes:
+        rng = random.Random(f"page-{sport}-{feed}-{n}")
+        words = _SPORT_WORDS[sport] + _FILLER * 3
+        paragraphs = "".join(
+            "<p>" + " ".join(rng.choice(words) for _ in range(60)) + ".</p>" for _ in range(12)
+        )
+        nav = "<nav>" + "".join(f'<a href="/s/{i}">Section {i}</a>' for i in range(50)) + "</nav>"
+        body = f"{nav}<article><h1>{self._headline(sport, feed, n)}</h1>{paragraphs}</article>"
+        padding = max(0, self.page_kib * 1024 - len(body))
+        script = f"<script>window.__state = '{'x' * padding}';</script>"
+        return f"<!DOCTYPE html><html><head>{script}</head><body>{body}</body></html>".encode()
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def _field(prompt: str, name: str) -> str:
+    match = re.search(rf"^{name}:\s*(.*)$", prompt, re.MULTILINE)
+    return match.group(1).strip() if match else ""
+
+
+def _summary(prompt: str) -> str:
+    content = prompt.split("Article content:", 1)[-1].split()
+    return " ".join(content[:45]) + "."
+
+
+def _sport(prompt: str) -> str:
+    return _field(prompt, "Candidate sport from RSS source") or "soccer"
+
+
+def _answer_for(schema: dict, prompt: str) -> dict:
+    """Build an output matching the agent's schema from its prompt."""
+    props = set(schema.get("properties", {}))
+    if "items" in props:
+        sections = re.split(r"^### Article id=(\S+)\n", prompt, flags=re.MULTILINE)[1:]
+        return {"items": [
+            {"id": item_id, "headline": _field(body, "Headline"), "summary": _summary(body)}
+            for item_id, body in zip(sections[::2], sections[1::2])
+        ]}
+    answer: dict = {}
+    if "summary" in props:
+        answer.update(headline=_field(prompt, "Headline"), summary=_summary(prompt))
+    if "sport_slug" in props:
+        answer.update(sport_slug=_sport(prompt), confidence="high", reasoning="fixture")
+    if not answer:
+        raise ValueError(f"No fake answer for schema with properties {sorted(props)}")
+    return answer
+
+
+class FakeOpenAI(_Server):
+    """Chat-completions endpoint returning structured outputs after ``latency`` seconds.
+
+    ``per_token`` adds simulated generation time per output token. Token
+    usage is estimated from prompt and answer length and reported in the
+    response, so usage metrics see realistic numbers.
+
+    ``rpm`` enforces a rolling requests-per-minute limit, reported in
+    ``x-ratelimit-*`` headers; requests over it get a 429 with
+    ``retry-after`` set to when the window frees up. ``error_rate`` rejects
+    that fraction of the remaining requests with a 429 and a
+    ``retry_after`` of its own. ``rate_limited`` counts the 429s sent.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.5,
+        jitter: float = 0.2,
+        per_token: float = 0.0,
+        rpm: Optional[int] = None,
+        error_rate: float = 0.0,
+        retry_after: float = 1.0,
+    ):
+        super().__init__(latency, jitter, seed=1)
+        self.per_token = per_token
+        self.rpm = rpm
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.rate_limited = 0
+        self._window: deque[float] = deque()
+
+    def install(self) -> None:
+        """Route the Agents SDK's default client, and those of later pipeline runs, here."""
+        from agents import set_default_openai_api, set_tracing_disabled
+
+        from agent.crew.ratelimit import install_openai_client
+
+        os.environ.update(OPENAI_BASE_URL=f"{self.url}/v1", OPENAI_API_KEY="fake")
+        install_openai_client()
+        set_default_openai_api("chat_completions")
+        set_tracing_disabled(True)
+
+    def _admit(self) -> tuple[Optional[float], dict]:
+        """(retry-after seconds if rejected, rate-limit headers) for one request."""
+        with self._lock:
+            now = time.monotonic()
+            while self._window and now - self._window[0] >= 60:
+                self._window.popleft()
+            headers = {}
+            retry_after = None
+            if self.rpm:
+                reset = 60 - (now - self._window[0]) if self._window else 0.0
+                if len(self._window) >= self.rpm:
+                    retry_after = reset
+            if retry_after is None and self._rng.random() < self.error_rate:
+                retry_after = self.retry_after
+            if retry_after is None:
+                self._window.append(now)
+            else:
+                self.rate_limited += 1
+            if self.rpm:
+                headers.update({
+                    "x-ratelimit-limit-requests": str(self.rpm),
+                    "x-ratelimit-remaining-requests": str(max(0, self.rpm - len(self._window))),
+                    "x-ratelimit-reset-requests": f"{reset:.3f}s",
+                })
+            if retry_after is not None:
+                headers["retry-after"] = f"{retry_after:.3f}"
+            return retry_after, headers
+
+    def handle_post(self, handler: _Handler, body: bytes) -> None:
+        retry_after, headers = self._admit()
+        if retry_after is not None:
+            error = {"error": {
+                "message": "Rate limit reached for requests",
+                "type": "requests",
+                "code": "rate_limit_exceeded",
+            }}
+            handler._send(429, json.dumps(error).encode(), "application/json", headers)
+            return
+
+        request = json.loads(body)
+        messages = request.get("messages", [])
+        prompt = next(
+            (m["content"] for m in reversed(messages) if m.get("role") == "user"), ""
+        )
+        if isinstance(prompt, list):
+            prompt = "".join(part.get("text", "") for part in prompt)
+        schema = (request.get("response_format") or {}).get("json_schema", {}).get("schema", {})
+        try:
+            content = json.dumps(_answer_for(schema, prompt))
+        except ValueError as e:
+            handler._send(400, json.dumps({"error": {"message": str(e)}}).encode(), "application/json")
+            return
+
+        prompt_tokens = sum(_estimate_tokens(str(m.get("content", ""))) for m in messages)
+        completion_tokens = _estimate_tokens(content)
+        with self._lock:
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+        self._delay(self.per_token * completion_tokens)
+        response = {
+            "id": f"chatcmpl-fake-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+        handler._send(200, json.dumps(response).encode(), "application/json", headers)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def timed_calls(fn: Callable[[], object], repeat: int) -> list[float]:
+    """Wall time of ``repeat`` calls to ``fn``, in seconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
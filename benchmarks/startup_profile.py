@@ -0,0 +1,151 @@
+"""Import time, startup time and memory of the API process, checked against a budget.
+
+Each sample is a fresh interpreter that imports ``app.main`` and runs the
+application's startup and shutdown the way the server does, against a
+throwaway SQLite database initialized beforehand. Reports the median import
+and startup times, the resident memory once started, the slowest imports
+under ``app.main`` (from one extra ``python -X importtime`` run), and any
+pipeline-only modules that were loaded. Exits with status 1 when a budget
+is exceeded, so it can guard against regressions in CI.
+
+    python benchmarks/startup_profile.py --repeat 5 --output startup.json
+    python benchmarks/startup_profile.py --full --max-import-ms 1500
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+_root = Path(__file__).resolve().parents[1]
+
+# Needed only by the pipeline worker; none may load in the API process
+_PIPELINE_MODULES = ("agent", "agents", "openai", "feedparser", "bs4", "requests", "yaml", "lxml")
+
+_CHILD = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+
+async def lifespan():
+    async with app.router.lifespan_context(app):
+        return time.perf_counter()
+
+ready = asyncio.run(lifespan())
+status = dict(
+    line.split(":", 1) for line in open("/proc/self/status").read().splitlines() if ":" in line
+)
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (ready - imported) * 1000,
+    "rss_mib": int(status["VmRSS"].split()[0]) / 1024,
+    "modules": sorted({name.split(".")[0] for name in sys.modules}),
+}))
+"""
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _slowest_imports(stderr: str, top: int) -> list[dict]:
+    """Direct imports of ``app.main`` and the modules they pull in, by cumulative time."""
+    rows = []
+    depth = None
+    for line in reversed(stderr.splitlines()):
+        match = _IMPORTTIME.match(line)
+        if not match:
+            continue
+        indent = len(match[3])
+        if match[4] == "app.main":
+            depth = indent
+        elif depth is not None and indent <= depth:
+            break
+        elif depth is not None and indent == depth + 2:
+            rows.append({"module": match[4], "cumulative_ms": int(match[2]) / 1000})
+    rows.sort(key=lambda r: r["cumulative_ms"], reverse=True)
+    return rows[:top]
+
+
+def _sample(env: dict, importtime: bool = False) -> tuple[dict, str]:
+    proc = subprocess.run(
+        [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", _CHILD],
+        cwd=_root / "backend",
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode:
+        raise RuntimeError(f"API startup failed:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh processes to sample")
+    parser.add_argument(
+        "--full", action="store_true",
+        help="Profile the default mode (schema init, scheduler) instead of API_ONLY=1",
+    )
+    parser.add_argument("--max-import-ms", type=float, default=1500, help="Budget: import time")
+    parser.add_argument("--max-startup-ms", type=float, default=250, help="Budget: startup time")
+    parser.add_argument("--max-rss-mib", type=float, default=120, help="Budget: resident memory")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="startup-profile-"))
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{workdir}/bench.db",
+        "PYTHONPATH": str(_root / "backend"),
+        "LOG_LEVEL": "WARNING",
+    }
+    for name in ("TESTING", "PROMETHEUS_MULTIPROC_DIR", "DISABLE_SCHEDULER"):
+        env.pop(name, None)
+    env["API_ONLY"] = "0" if args.full else "1"
+
+    _sample(env)  # creates and seeds the database, like a first deploy
+    runs = [_sample(env)[0] for _ in range(args.repeat)]
+    _, importtime = _sample(env, importtime=True)
+    loaded = set(runs[0]["modules"])
+    forbidden = [name for name in _PIPELINE_MODULES if name in loaded]
+    if not args.full and "apscheduler" in loaded:
+        forbidden.append("apscheduler")
+
+    results = {
+        "mode": "full" if args.full else "api_only",
+        "repeat": args.repeat,
+        "import_ms": round(statistics.median(r["import_ms"] for r in runs), 1),
+        "startup_ms": round(statistics.median(r["startup_ms"] for r in runs), 1),
+        "rss_mib": round(statistics.median(r["rss_mib"] for r in runs), 1),
+        "modules_loaded": len(loaded),
+        "pipeline_modules_loaded": forbidden,
+        "slowest_imports": _slowest_imports(importtime, args.top),
+    }
+    budget = {
+        "import_ms": args.max_import_ms,
+        "startup_ms": args.max_startup_ms,
+        "rss_mib": args.max_rss_mib,
+    }
+    failures = [
+        f"{key} {results[key]} exceeds budget {limit}"
+        for key, limit in budget.items() if results[key] > limit
+    ]
+    if forbidden:
+        failures.append(f"pipeline-only modules loaded: {', '.join(forbidden)}")
+    results["budget"] = budget
+    results["failures"] = failures
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
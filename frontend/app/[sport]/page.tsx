@@ -1,6 +1,7 @@
-import { getArticles, getSports } from "@/lib/api";
+import { getArticlePage, getSports } from "@/lib/api";
+import type { ArticlePage } from "@/lib/api";
 import SportNav from "@/components/SportNav";
-import ArticleList from "@/components/ArticleList";
+import LiveArticleList from "@/components/LiveArticleList";
 
 export const dynamic = "force-dynamic";
 
@@ -11,11 +12,11 @@ interface Props {
 export default async function SportPage({ params }: Props) {
   const { sport: sportSlug } = await params;
   let sports = [];
-  let articles: Awaited<ReturnType<typeof getArticles>> = [];
+  let page: ArticlePage = { items: [], next_cursor: null };
   try {
-    [sports, articles] = await Promise.all([
+    [sports, page] = await Promise.all([
       getSports(),
-      getArticles({ sport: sportSlug }),
+      getArticlePage({ sport: sportSlug }),
     ]);
   } catch {
     // API may be unreachable
@@ -29,7 +30,7 @@ export default async function SportPage({ params }: Props) {
         <h1 className="text-3xl font-bold">{sportName} News</h1>
       </header>
       <SportNav sports={sports} activeSlug={sportSlug} />
-      <ArticleList articles={articles} />
+      <LiveArticleList initialPage={page} sport={sportSlug} />
     </div>
   );
 }
@@ -1,16 +1,17 @@
-import { getArticles, getSports } from "@/lib/api";
+import { getArticlePage, getSports } from "@/lib/api";
+import type { ArticlePage } from "@/lib/api";
 import SportNav from "@/components/SportNav";
-import ArticleList from "@/components/ArticleList";
+import LiveArticleList from "@/components/LiveArticleList";
 
 export const dynamic = "force-dynamic";
 
 export default async function HomePage() {
   let sports: Awaited<ReturnType<typeof getSports>> = [];
-  let articles: Awaited<ReturnType<typeof getArticles>> = [];
+  let page: ArticlePage = { items: [], next_cursor: null };
   try {
-    [sports, articles] = await Promise.all([
+    [sports, page] = await Promise.all([
       getSports(),
-      getArticles(),
+      getArticlePage(),
     ]);
   } catch {
     // API may be unreachable
@@ -23,7 +24,7 @@ export default async function HomePage() {
         <p className="text-gray-600 mt-1">Cricket and Soccer headlines with AI summaries</p>
       </header>
       <SportNav sports={sports} />
-      <ArticleList articles={articles} showSportTag />
+      <LiveArticleList initialPage={page} showSportTag />
     </div>
   );
 }
@@ -0,0 +1,73 @@
+"use client";
+
+import { useEffect, useState } from "react";
+import ArticleList from "./ArticleList";
+import { getArticlePage, subscribeArticles } from "@/lib/api";
+import type { Article, ArticlePage } from "@/lib/api";
+
+interface LiveArticleListProps {
+  initialPage: ArticlePage;
+  sport?: string;
+  showSportTag?: boolean;
+}
+
+export default function LiveArticleList({ initialPage, sport, showSportTag }: LiveArticleListProps) {
+  const [articles, setArticles] = useState<Article[]>(initialPage.items);
+  const [cursor, setCursor] = useState(initialPage.next_cursor);
+  const [loading, setLoading] = useState(false);
+
+  useEffect(() => {
+    setArticles(initialPage.items);
+    setCursor(initialPage.next_cursor);
+    return subscribeArticles(
+      (article) =>
+        setArticles((current) =>
+          current.some((a) => a.id === article.id) ? current : [article, ...current],
+        ),
+      {
+        sport,
+        onReset: () => {
+          getArticlePage({ sport })
+            .then((page) => {
+              setArticles(page.items);
+              setCursor(page.next_cursor);
+            })
+            .catch(() => {});
+        },
+      },
+    );
+  }, [initialPage, sport]);
+
+  const loadMore = () => {
+    if (!cursor || loading) return;
+    setLoading(true);
+    getArticlePage({ sport, cursor })
+      .then((page) => {
+        setArticles((current) => {
+          const seen = new Set(current.map((a) => a.id));
+          return [...current, ...page.items.filter((a) => !seen.has(a.id))];
+        });
+        setCursor(page.next_cursor);
+      })
+      .catch(() => {})
+      .finally(() => setLoading(false));
+  };
+
+  return (
+    <>
+      <ArticleList articles={articles} showSportTag={showSportTag} />
+      {cursor && (
+        <div className="mt-8 text-center">
+          <button
+            type="button"
+            onClick={loadMore}
+            disabled={loading}
+            className="px-4 py-2 rounded border border-gray-300 text-sm hover:bg-gray-50 disabled:opacity-50"
+          >
+            {loading ? "Loading..." : "Load more"}
+          </button>
+        </div>
+      )}
+    </>
+  );
+}
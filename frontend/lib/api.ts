@@ -17,21 +17,40 @@ export interface Article {
   sport: Sport;
 }
 
+export interface ArticleSource {
+  source_url: string;
+  source_name: string;
+  published_at: string | null;
+}
+
+export interface ArticleDetail extends Article {
+  alternate_sources: ArticleSource[];
+}
+
+export interface ArticlePage {
+  items: Article[];
+  next_cursor: string | null;
+}
+
 export async function getSports(): Promise<Sport[]> {
   const res = await fetch(`${API_URL}/api/sports`);
   if (!res.ok) throw new Error("Failed to fetch sports");
   return res.json();
 }
 
-export async function getArticles(params?: {
+export async function getArticlePage(params?: {
   sport?: string;
   from?: string;
   to?: string;
-}): Promise<Article[]> {
+  limit?: number;
+  cursor?: string;
+}): Promise<ArticlePage> {
   const searchParams = new URLSearchParams();
   if (params?.sport) searchParams.set("sport", params.sport);
   if (params?.from) searchParams.set("from", params.from);
   if (params?.to) searchParams.set("to", params.to);
+  if (params?.limit) searchParams.set("limit", String(params.limit));
+  if (params?.cursor) searchParams.set("cursor", params.cursor);
   const qs = searchParams.toString();
   const url = `${API_URL}/api/articles${qs ? `?${qs}` : ""}`;
   const res = await fetch(url);
@@ -39,8 +58,27 @@ export async function getArticles(params?: {
   return res.json();
 }
 
-export async function getArticle(id: number): Promise<Article> {
+export async function getArticle(id: number): Promise<ArticleDetail> {
   const res = await fetch(`${API_URL}/api/articles/${id}`);
   if (!res.ok) throw new Error("Failed to fetch article");
   return res.json();
 }
+
+/**
+ * Subscribe to newly stored articles over Server-Sent Events.
+ * EventSource reconnects on its own and resumes via Last-Event-ID;
+ * `onReset` fires when too many articles were missed to replay.
+ * Returns a function that closes the stream.
+ */
+export function subscribeArticles(
+  onArticle: (article: Article) => void,
+  options?: { sport?: string; onReset?: () => void },
+): () => void {
+  const qs = options?.sport ? `?sport=${encodeURIComponent(options.sport)}` : "";
+  const source = new EventSource(`${API_URL}/api/articles/stream${qs}`);
+  source.addEventListener("article", (event) => {
+    onArticle(JSON.parse((event as MessageEvent).data));
+  });
+  source.addEventListener("reset", () => options?.onReset?.());
+  return () => source.close();
+}
@@ -0,0 +1,59 @@
+"""Resuming an interrupted pipeline run whose leftovers were already stored."""
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+_workdir = Path(tempfile.mkdtemp(prefix="pipeline-resume-test-"))
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{_workdir}/test.db",
+    AGENT_CACHE="0",
+    AGENT_CACHE_DIR=str(_workdir / "cache"),
+)
+os.environ.pop("OPENAI_API_KEY", None)
+_root = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(_root), str(_root / "backend")]
+
+from agent.crew.checkpoint import register_candidates  # noqa: E402
+from agent.crew.crew import PipelineStats, run_pipeline  # noqa: E402
+from agent.crew.models import ArticleCandidate  # noqa: E402
+from app.database import SessionLocal, init_db  # noqa: E402
+from app.models import PipelineCheckpoint  # noqa: E402
+from app.persistence import bulk_insert_articles  # noqa: E402
+from app.seed import seed_sports  # noqa: E402
+
+
+def test_stored_leftover_closes_the_resumed_run():
+    url = "https://example.com/already-stored"
+    init_db()
+    db = SessionLocal()
+    try:
+        seed_sports(db)
+        db.commit()
+        bulk_insert_articles(db, [{
+            "headline": "Stored before its checkpoint was",
+            "summary": "The run crashed between insert and checkpoint.",
+            "source_url": url,
+            "source_name": "Example",
+            "published_at": datetime.utcnow(),
+            "sport_slug": "cricket",
+        }])
+    finally:
+        db.close()
+    register_candidates(None, [ArticleCandidate(
+        url=url, title="Stored", source_name="Example", sport="cricket", date=None,
+    )])
+    sources = _workdir / "sources.yaml"
+    sources.write_text("cricket:\n  rss: []\n")
+
+    stats = PipelineStats()
+    asyncio.run(run_pipeline(sources, stats=stats))
+
+    assert stats.known_skipped == 1
+    db = SessionLocal()
+    try:
+        assert db.query(PipelineCheckpoint).count() == 0
+    finally:
+        db.close()